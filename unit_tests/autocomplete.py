@@ -0,0 +1,164 @@
+"""
+AutocompleteTrie - Radix trie with precomputed top-K completions per node
+"""
+import heapq
+from bisect import insort
+
+
+def normalize_term(text, keep_trailing_space=False):
+    """Lowercase and collapse whitespace (optionally keeping one trailing space)"""
+    normalized = " ".join(text.lower().split())
+    if keep_trailing_space and normalized and text[-1:].isspace():
+        normalized += " "
+    return normalized
+
+
+class _Node:
+    __slots__ = ("edge", "children", "term", "top")
+
+    def __init__(self, edge=""):
+        self.edge = edge
+        self.children = {}
+        self.term = None
+        self.top = []
+
+
+class AutocompleteTrie:
+    """Weighted completions; every node keeps the best top_k (-weight, key) entries below it"""
+    def __init__(self, top_k=10):
+        if not isinstance(top_k, int) or top_k <= 0:
+            raise ValueError("top_k must be a positive integer")
+        self.top_k = top_k
+        self.root = _Node()
+        self.terms = {}
+
+    def __len__(self):
+        return len(self.terms)
+
+    def __contains__(self, term):
+        return normalize_term(term) in self.terms
+
+    def add(self, term, weight=0):
+        """Add a term occurrence; repeated terms accumulate weight"""
+        key = normalize_term(term)
+        if not key:
+            return False
+        entry = self.terms.get(key)
+        if entry is None:
+            self.terms[key] = [weight, 1, term.strip()]
+            old = None
+        else:
+            old = (-entry[0], key)
+            entry[0] += weight
+            entry[1] += 1
+        path = self._insert(key)
+        new = (-self.terms[key][0], key)
+        if old is not None and new > old:
+            # Weight dropped: entries cut off earlier may now belong in the top lists
+            self._rebuild(path)
+            return True
+        for node in path:
+            if old is not None and old in node.top:
+                node.top.remove(old)
+            insort(node.top, new)
+            if len(node.top) > self.top_k:
+                node.top.pop()
+        return True
+
+    def remove(self, term, weight=0):
+        """Remove one occurrence of a term and its weight contribution"""
+        key = normalize_term(term)
+        entry = self.terms.get(key)
+        if entry is None:
+            return False
+        entry[0] -= weight
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del self.terms[key]
+        path = self._find_path(key)
+        if key not in self.terms:
+            path[-1].term = None
+            self._prune(path)
+        self._rebuild(path)
+        return True
+
+    def suggest(self, prefix, limit=5):
+        """Display terms completing the prefix, highest weight first"""
+        node = self._locate(prefix)
+        if node is None:
+            return []
+        return [self.terms[key][2] for _, key in node.top[:limit]]
+
+    def _insert(self, key):
+        """Create nodes for key as needed and return the root-to-terminal path"""
+        node = self.root
+        path = [node]
+        i = 0
+        while i < len(key):
+            child = node.children.get(key[i])
+            if child is None:
+                child = _Node(key[i:])
+                node.children[key[i]] = child
+                path.append(child)
+                node = child
+                break
+            edge = child.edge
+            common = 0
+            limit = min(len(edge), len(key) - i)
+            while common < limit and edge[common] == key[i + common]:
+                common += 1
+            if common < len(edge):
+                # Split the edge so the key ends or branches at a node
+                middle = _Node(edge[:common])
+                child.edge = edge[common:]
+                middle.children[child.edge[0]] = child
+                middle.top = list(child.top)
+                node.children[key[i]] = middle
+                child = middle
+            path.append(child)
+            node = child
+            i += common
+        node.term = key
+        return path
+
+    def _find_path(self, key):
+        node = self.root
+        path = [node]
+        i = 0
+        while i < len(key):
+            node = node.children[key[i]]
+            path.append(node)
+            i += len(node.edge)
+        return path
+
+    def _locate(self, prefix):
+        """Node whose subtree holds exactly the keys starting with prefix"""
+        node = self.root
+        i = 0
+        while i < len(prefix):
+            child = node.children.get(prefix[i])
+            if child is None:
+                return None
+            rest = prefix[i:]
+            if rest.startswith(child.edge):
+                i += len(child.edge)
+            elif child.edge.startswith(rest):
+                return child
+            else:
+                return None
+            node = child
+        return node
+
+    def _prune(self, path):
+        """Drop empty leaves left behind by a removed term"""
+        while len(path) > 1 and path[-1].term is None and not path[-1].children:
+            leaf = path.pop()
+            del path[-1].children[leaf.edge[0]]
+
+    def _rebuild(self, path):
+        """Recompute top lists bottom-up along a path from the children's lists"""
+        for node in reversed(path):
+            candidates = [entry for child in node.children.values() for entry in child.top]
+            if node.term is not None:
+                candidates.append((-self.terms[node.term][0], node.term))
+            node.top = heapq.nsmallest(self.top_k, candidates)
@@ -0,0 +1,57 @@
+"""
+Benchmark - QuizSearchPage.suggest latency per keystroke
+
+Usage: python benchmarks/bench_autocomplete.py [size ...]
+"""
+import gc
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from bench_search import make_catalog
+from quiz_search_page import QuizSearchPage
+
+TYPED = 2000
+
+
+def bench(size):
+    rng = random.Random(size)
+    page = QuizSearchPage()
+    catalog = make_catalog(size, rng)
+    started = time.perf_counter()
+    page.load_quizzes(catalog)
+    page.load_topics()
+    build = time.perf_counter() - started
+
+    # Every keystroke of randomly chosen titles: "a", "al", "alg", ...
+    keystrokes = []
+    while len(keystrokes) < TYPED:
+        title = catalog[rng.randrange(size)]["title"]
+        keystrokes.extend(title[:end] for end in range(1, len(title) + 1))
+
+    gc.collect()
+    gc.disable()
+    started = time.perf_counter()
+    for prefix in keystrokes:
+        page.suggest(prefix)
+    per_keystroke = (time.perf_counter() - started) / len(keystrokes)
+    gc.enable()
+
+    started = time.perf_counter()
+    page.add_quiz({"id": size + 1, "title": "Algebra Sprint", "subject": "Math", "grade": 7, "plays": 10 ** 6, "language": "en"})
+    update = time.perf_counter() - started
+    print(f"{size:>10,} titles  build {build:8.2f} s  keystroke {per_keystroke * 1e6:6.1f} us"
+          f"  incremental add {update * 1e6:8.1f} us")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 100000, 1000000]
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
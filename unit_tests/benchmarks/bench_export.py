@@ -0,0 +1,53 @@
+"""
+Benchmark - ResultsPage.export_to_excel throughput (rows/sec) and peak RSS growth
+
+Usage: python benchmarks/bench_export.py [size ...]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:  # Windows: no getrusage, RSS is not reported
+    resource = None
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from bench_results_stats import make_results
+from results_page import ResultsPage
+
+
+def peak_rss_mb():
+    if resource is None:
+        return float("nan")
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def bench(size):
+    page = ResultsPage()
+    page.load_results(make_results(size, random.Random(size)))
+    before = peak_rss_mb()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "results.xlsx")
+        started = time.perf_counter()
+        page.export_to_excel(path)
+        elapsed = time.perf_counter() - started
+        file_mb = os.path.getsize(path) / (1024 * 1024)
+    growth = peak_rss_mb() - before
+    print(f"{size:>10,} rows  {size / elapsed:>10,.0f} rows/s  {elapsed:6.2f} s  file {file_mb:6.1f} MB"
+          f"  peak RSS {peak_rss_mb():7.1f} MB (+{growth:.1f} MB during export)")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 100000, 1000000]
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark - exact vs fuzzy QuizSearchPage.search latency
+
+Usage: python benchmarks/bench_fuzzy.py [size ...]
+"""
+import gc
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from bench_search import make_catalog
+from quiz_search_page import QuizSearchPage
+
+QUERIES = 500
+
+
+def misspell(word, rng):
+    """Apply one random deletion, substitution or transposition"""
+    i = rng.randrange(1, len(word) - 1)
+    edit = rng.choice(("delete", "substitute", "transpose"))
+    if edit == "delete":
+        return word[:i] + word[i + 1:]
+    if edit == "substitute":
+        return word[:i] + rng.choice("aeiouxyz") + word[i + 1:]
+    return word[:i - 1] + word[i] + word[i - 1] + word[i + 1:]
+
+
+def timed(page, queries, fuzzy):
+    gc.collect()
+    gc.disable()
+    started = time.perf_counter()
+    for query in queries:
+        page.search(query, limit=20, fuzzy=fuzzy)
+    elapsed = (time.perf_counter() - started) / len(queries)
+    gc.enable()
+    return elapsed
+
+
+def bench(size):
+    rng = random.Random(size)
+    page = QuizSearchPage(cache_size=1)
+    catalog = make_catalog(size, rng)
+    page.load_quizzes(catalog)
+
+    exact, typos = [], []
+    for _ in range(QUERIES):
+        topic, word = catalog[rng.randrange(size)]["title"].split()[:2]
+        exact.append(f"{topic} {word}")
+        typos.append(f"{misspell(topic, rng)} {misspell(word, rng)}")
+
+    exact_latency = timed(page, exact, fuzzy=False)
+    fuzzy_latency = timed(page, typos, fuzzy=True)
+    print(f"{size:>10,} titles  exact {exact_latency * 1e6:8.1f} us  fuzzy {fuzzy_latency * 1e6:8.1f} us"
+          f"  {len(page.index.trigrams):,} distinct trigrams")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100000, 1000000]
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark - SessionHub broadcast latency with many simulated players in one process
+
+Usage: python benchmarks/bench_hub.py [players ...]
+"""
+import asyncio
+import gc
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from session_hub import SessionHub
+
+ROOM_SIZE = 100
+QUESTIONS = 10
+
+
+async def bench(players):
+    hub = SessionHub()
+    loop = asyncio.get_running_loop()
+    codes = [hub.create_room(room) for room in range(max(1, players // ROOM_SIZE))]
+    latencies = []
+    received = 0
+    round_done = asyncio.Event()
+
+    async def player(subscription):
+        nonlocal received
+        async for event in subscription:
+            if event["type"] != "question":
+                continue
+            latencies.append(loop.time() - event["sent_at"])
+            received += 1
+            if received == players:
+                round_done.set()
+
+    tasks = []
+    for number in range(players):
+        _, subscription = hub.join(codes[number % len(codes)], f"Player {number}")
+        tasks.append(asyncio.ensure_future(player(subscription)))
+    await asyncio.sleep(0)
+
+    gc.collect()
+    gc.disable()
+    rounds = []
+    for _ in range(QUESTIONS):
+        received = 0
+        round_done.clear()
+        started = time.perf_counter()
+        for code in codes:
+            await hub.next_question(code)
+        await round_done.wait()
+        rounds.append(time.perf_counter() - started)
+    gc.enable()
+
+    for code in codes:
+        await hub.close_room(code)
+    await asyncio.gather(*tasks)
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2]
+    p99 = latencies[int(len(latencies) * 0.99)]
+    print(f"{players:>8,} players in {len(codes):>4} rooms  broadcast round {statistics.median(rounds) * 1e3:7.1f} ms"
+          f"  latency p50 {p50 * 1e3:6.1f} ms  p99 {p99 * 1e3:6.1f} ms  max {latencies[-1] * 1e3:6.1f} ms")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 10000]
+    for size in sizes:
+        asyncio.run(bench(size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark - JoinCodeRegistry allocate/resolve/release with many live codes
+
+Usage: python benchmarks/bench_join_codes.py [live codes ...]
+"""
+import gc
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from join_codes import JoinCodeRegistry
+
+OPERATIONS = 100000
+
+
+def bench(size):
+    rng = random.Random(size)
+    registry = JoinCodeRegistry(rng=rng)
+    gc.collect()
+    gc.disable()
+    started = time.perf_counter()
+    codes = [registry.allocate(number) for number in range(size)]
+    allocate = (time.perf_counter() - started) / size
+
+    lookups = [rng.choice(codes) for _ in range(OPERATIONS)]
+    started = time.perf_counter()
+    for code in lookups:
+        registry.resolve(code)
+    resolve = (time.perf_counter() - started) / OPERATIONS
+
+    # Session churn: end one session, start another
+    started = time.perf_counter()
+    for code in lookups:
+        if registry.release(code):
+            registry.allocate(code)
+    churn = (time.perf_counter() - started) / OPERATIONS
+    gc.enable()
+    print(f"{size:>9,} live codes  allocate {allocate * 1e6:5.2f} us  resolve {resolve * 1e6:5.2f} us"
+          f"  release+allocate {churn * 1e6:5.2f} us")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 100000, 500000]
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
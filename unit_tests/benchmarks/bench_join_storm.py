@@ -0,0 +1,58 @@
+"""
+Benchmark - join storm: a class joining at once via add_participants vs add_participant calls
+
+Usage: python benchmarks/bench_join_storm.py [class size ...]
+"""
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from live_session_page import LiveSessionPage
+
+ALREADY_JOINED = 1000
+REPEATS = 20
+
+
+def started_session():
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    session.add_participants([f"Early {number}" for number in range(ALREADY_JOINED)])
+    return session
+
+
+def bench(size):
+    # Every student scans twice; the second scan must not create a duplicate
+    names = [f"Student {number}" for number in range(size)] * 2
+    bulk = single = 0.0
+    gc.collect()
+    gc.disable()
+    for _ in range(REPEATS):
+        session = started_session()
+        started = time.perf_counter()
+        session.add_participants(names)
+        bulk += time.perf_counter() - started
+
+        session = started_session()
+        started = time.perf_counter()
+        seen = set()
+        for name in names:
+            if name not in seen:
+                seen.add(name)
+                session.add_participant(name)
+        single += time.perf_counter() - started
+    gc.enable()
+    print(f"{size:>7,} students x2 scans into {ALREADY_JOINED:,} players  bulk {bulk / REPEATS * 1e3:7.2f} ms"
+          f"  one by one {single / REPEATS * 1e3:7.2f} ms")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [300, 3000, 30000]
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
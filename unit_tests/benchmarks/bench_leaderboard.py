@@ -0,0 +1,51 @@
+"""
+Benchmark - LiveSessionPage score update + top-10 leaderboard vs a full re-sort per answer
+
+Usage: python benchmarks/bench_leaderboard.py [participants ...]
+"""
+import gc
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from live_session_page import LiveSessionPage
+
+ANSWERS = 20000
+
+
+def bench(size):
+    rng = random.Random(size)
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    ids = [session.add_participant(f"Player {i}") for i in range(size)]
+    answers = [(rng.choice(ids), rng.randrange(1000)) for _ in range(ANSWERS)]
+
+    gc.collect()
+    gc.disable()
+    started = time.perf_counter()
+    for participant_id, points in answers:
+        participant = session._get_participant_by_id(participant_id)
+        session.update_score(participant_id, participant["score"] + points)
+        session.get_leaderboard(limit=10)
+    incremental = (time.perf_counter() - started) / ANSWERS
+
+    participants = session.get_participants()
+    started = time.perf_counter()
+    for participant_id, points in answers[:2000]:
+        sorted(participants, key=lambda p: p["score"], reverse=True)[:10]
+    full_sort = (time.perf_counter() - started) / 2000
+    gc.enable()
+    print(f"{size:>8,} participants  update+top10 {incremental * 1e6:7.2f} us  full re-sort {full_sort * 1e6:9.2f} us")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [500, 5000, 50000]
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark - participant memory: bytes per participant for 100k players spread over many rooms
+
+Usage: python benchmarks/bench_participant_memory.py [rooms ...]
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from join_codes import JoinCodeRegistry
+from live_session_page import LiveSessionPage, Participant
+
+PARTICIPANTS = 100_000
+# Distinct first names in a typical school roster
+ROSTER = 400
+
+
+def room_names(room, size):
+    # Fresh string objects per room, as they arrive from each join request
+    return [f"Student {(room * 7 + seat) % ROSTER}" for seat in range(size)]
+
+
+def measure(build):
+    """(bytes allocated and still held by build(), result)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return held, result
+
+
+def bench(rooms):
+    size = PARTICIPANTS // rooms
+    names = [room_names(room, size) for room in range(rooms)]
+
+    def sessions():
+        registry = JoinCodeRegistry()
+        built = []
+        for room in range(rooms):
+            session = LiveSessionPage(quiz_id=room, registry=registry)
+            session.start_live_session()
+            session.add_participants(names[room])
+            built.append(session)
+        return built
+
+    def empty_sessions():
+        registry = JoinCodeRegistry()
+        built = []
+        for room in range(rooms):
+            session = LiveSessionPage(quiz_id=room, registry=registry)
+            session.start_live_session()
+            built.append(session)
+        return built
+
+    def dict_records():
+        # The previous layout: one dict per participant with a copied name string
+        return [{"id": seat, "name": "".join(name), "joined_at": time.monotonic(), "score": 0}
+                for room_list in names for seat, name in enumerate(room_list)]
+
+    def slotted_records():
+        return [Participant(seat, "".join(name), time.monotonic())
+                for room_list in names for seat, name in enumerate(room_list)]
+
+    total = size * rooms
+    full, _ = measure(sessions)
+    empty, _ = measure(empty_sessions)
+    as_dicts, _ = measure(dict_records)
+    as_slots, _ = measure(slotted_records)
+    print(f"{rooms:>5,} rooms x {size:,} players  session {(full - empty) / total:6.1f} B/participant"
+          f"  record: dict {as_dicts / total:6.1f} B  slotted+interned {as_slots / total:6.1f} B")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 1000, 5000]
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
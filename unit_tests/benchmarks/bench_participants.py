@@ -0,0 +1,45 @@
+"""
+Benchmark - LiveSessionPage join/leave storms: per-operation cost as rooms grow
+
+Usage: python benchmarks/bench_participants.py [room size ...]
+"""
+import gc
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from live_session_page import LiveSessionPage
+
+
+def bench(size):
+    rng = random.Random(size)
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    names = [f"Player {number}" for number in range(size)]
+
+    gc.collect()
+    gc.disable()
+    started = time.perf_counter()
+    ids = [session.add_participant(name) for name in names]
+    join = (time.perf_counter() - started) / size
+
+    rng.shuffle(ids)
+    started = time.perf_counter()
+    for participant_id in ids:
+        session.remove_participant(participant_id)
+    leave = (time.perf_counter() - started) / size
+    gc.enable()
+    print(f"{size:>8,} players  join {join * 1e6:6.2f} us  leave {leave * 1e6:6.2f} us")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000]
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
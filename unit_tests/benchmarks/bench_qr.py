@@ -0,0 +1,55 @@
+"""
+Benchmark - QR share: rendering on every request vs the per-join-code image cache
+
+Usage: python benchmarks/bench_qr.py [rooms ...]
+"""
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from join_codes import JoinCodeRegistry
+from live_session_page import JOIN_URL, LiveSessionPage
+from qr_code import qr_matrix, qr_png
+
+# The projector plus 30 students open the QR code
+REQUESTS_PER_ROOM = 31
+
+
+def bench(rooms):
+    registry = JoinCodeRegistry()
+    sessions = [LiveSessionPage(quiz_id=1, registry=registry) for _ in range(rooms)]
+    for session in sessions:
+        session.start_live_session()
+    gc.collect()
+    gc.disable()
+    started = time.perf_counter()
+    for session in sessions:
+        for _ in range(REQUESTS_PER_ROOM):
+            matrix = qr_matrix(JOIN_URL.format(session.join_code))
+            qr_png(matrix)
+    uncached = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for session in sessions:
+        for _ in range(REQUESTS_PER_ROOM):
+            session.share_join_code("qr")
+    cached = time.perf_counter() - started
+    gc.enable()
+    for session in sessions:
+        session.end_session()
+    requests = rooms * REQUESTS_PER_ROOM
+    print(f"{rooms:>5,} rooms x {REQUESTS_PER_ROOM} requests  render each {uncached / requests * 1e3:6.2f} ms/request"
+          f"  cached {cached / requests * 1e3:6.3f} ms/request  ({uncached / cached:5.1f}x)")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10, 100]
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Benchmark - ResultsPage.download_report: serial vs process-pool rendering, peak RSS growth
+
+Usage: python benchmarks/bench_report.py [size ...]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from bench_export import peak_rss_mb
+from bench_results_stats import make_results
+from results_page import ResultsPage
+
+
+def bench(size):
+    page = ResultsPage()
+    page.load_results(make_results(size, random.Random(size)))
+    page.get_statistics()
+    cores = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as directory:
+        for workers in sorted({1, max(2, cores)}):
+            before = peak_rss_mb()
+            started = time.perf_counter()
+            result = page.download_report(os.path.join(directory, "report.pdf"), workers=workers)
+            elapsed = time.perf_counter() - started
+            file_mb = os.path.getsize(os.path.join(directory, "report.pdf")) / (1024 * 1024)
+            print(f"{size:>10,} students  workers {workers:>2}  {result['pages']:>6,} pages  {elapsed:6.2f} s"
+                  f"  file {file_mb:6.1f} MB  peak RSS +{peak_rss_mb() - before:.1f} MB")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 100000]
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark - ResultsPage.get_statistics on large result sets vs a pure-Python pass
+
+Usage: python benchmarks/bench_results_stats.py [size ...]
+"""
+import gc
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from results_page import ResultsPage
+
+STUDENTS = 5000
+DAYS = 90
+QUESTIONS = 20
+
+
+def make_results(size, rng):
+    """Synthetic result rows shaped like ResultsPage mock data"""
+    results = []
+    for result_id in range(1, size + 1):
+        correct = rng.randint(0, QUESTIONS)
+        accuracy = correct * 100.0 / QUESTIONS
+        results.append({
+            "id": result_id,
+            "student": f"Student {rng.randrange(STUDENTS)}",
+            "score": int(accuracy),
+            "accuracy": accuracy,
+            "questions_correct": correct,
+            "total_questions": QUESTIONS,
+            "date": f"2024-{1 + rng.randrange(DAYS) // 30:02d}-{1 + rng.randrange(DAYS) % 28:02d}"
+        })
+    return results
+
+
+def python_statistics(results):
+    """The same summary computed with lists and the statistics module"""
+    scores = [r["score"] for r in results]
+    by_date = {}
+    for r in results:
+        by_date.setdefault(r["date"], []).append(r["score"])
+    return {
+        "average_score": sum(scores) / len(scores),
+        "median_score": statistics.median(scores),
+        "std_score": statistics.pstdev(scores),
+        "percentiles": statistics.quantiles(scores, n=20),
+        "by_date": {day: (len(s), sum(s) / len(s), max(s), min(s)) for day, s in sorted(by_date.items())}
+    }
+
+
+def bench(size):
+    rng = random.Random(size)
+    results = make_results(size, rng)
+    page = ResultsPage()
+    page.load_results(results)
+
+    gc.collect()
+    gc.disable()
+    started = time.perf_counter()
+    page.get_statistics()
+    first = time.perf_counter() - started
+    started = time.perf_counter()
+    page.get_statistics()
+    cached = time.perf_counter() - started
+    started = time.perf_counter()
+    python_statistics(results)
+    baseline = time.perf_counter() - started
+    gc.enable()
+    print(f"{size:>10,} results  numpy first {first * 1e3:8.1f} ms  numpy cached {cached * 1e3:8.1f} ms"
+          f"  pure python {baseline * 1e3:8.1f} ms")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 100000, 1000000]
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark - QuizSearchPage.search latency as the catalog grows
+
+Usage: python benchmarks/bench_search.py [size ...]
+"""
+import gc
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from quiz_search_page import QuizSearchPage
+
+SUBJECTS = ["Math", "Science", "History", "English", "Geography"]
+TOPICS = ["Algebra", "Geometry", "Calculus", "Biology", "Chemistry", "Physics", "Grammar",
+          "Literature", "Writing", "Maps", "Countries", "Ancient", "World", "Fractions", "Poetry"]
+LANGUAGES = ["en", "es", "fr"]
+SYLLABLES = [onset + vowel + coda for onset in "bdfghklmnprstvz" for vowel in "aeiou" for coda in "lmnrst"]
+QUERIES = 1000
+PAGES = 50
+
+
+def pseudo_word(n):
+    """Deterministic made-up word for vocabulary entry n ("kaloru", ...)"""
+    n = n * 7919 + 104729
+    syllables = []
+    for _ in range(3):
+        n, digit = divmod(n, len(SYLLABLES))
+        syllables.append(SYLLABLES[digit])
+    return "".join(syllables)
+
+
+def make_catalog(size, rng):
+    """Synthetic catalog: vocabulary grows with the catalog like real titles do"""
+    vocabulary = [pseudo_word(n) for n in range(max(size // 10, 100))]
+    return [
+        {
+            "id": i,
+            "title": f"{rng.choice(TOPICS)} {rng.choice(vocabulary)} Quiz",
+            "subject": rng.choice(SUBJECTS),
+            "grade": rng.randint(1, 12),
+            "questions": rng.randint(5, 30),
+            "plays": rng.randrange(100000),
+            "language": rng.choice(LANGUAGES)
+        }
+        for i in range(1, size + 1)
+    ]
+
+
+def bench(size):
+    rng = random.Random(size)
+    page = QuizSearchPage()
+    catalog = make_catalog(size, rng)
+    started = time.perf_counter()
+    page.load_quizzes(catalog)
+    build = time.perf_counter() - started
+
+    gc.collect()
+    gc.disable()
+    started = time.perf_counter()
+    cursor = None
+    for _ in range(PAGES):
+        cursor = page.sort_by_plays("desc", k=20, cursor=cursor)["next_cursor"]
+    per_page = (time.perf_counter() - started) / PAGES
+    gc.enable()
+
+    queries = [f"{rng.choice(TOPICS)} {catalog[rng.randrange(size)]['title'].split()[1]}" for _ in range(QUERIES)]
+    # Like timeit: keep collector pauses over the million-object heap out of the timing
+    gc.collect()
+    gc.disable()
+    started = time.perf_counter()
+    for query in queries:
+        page.search(query, limit=20)
+    per_query = (time.perf_counter() - started) / QUERIES
+
+    # Single-token queries matching 1/15 of the catalog ("algebra") or all of it ("quiz"):
+    # facet counting dominates; the cache is cleared so each one is computed
+    broad = [topic.lower() for topic in TOPICS] + ["quiz"]
+    started = time.perf_counter()
+    for query in broad:
+        page.results_cache.clear()
+        page.search(query)
+    per_broad = (time.perf_counter() - started) / len(broad)
+    gc.enable()
+    print(f"{size:>10,} quizzes  build {build:8.2f} s  query {per_query * 1e6:8.1f} us"
+          f"  broad query {per_broad * 1e3:7.2f} ms  top-20 page {per_page * 1e6:8.1f} us")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000, 1000000]
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
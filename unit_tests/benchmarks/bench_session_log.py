@@ -0,0 +1,77 @@
+"""
+Benchmark - session log: answer-path overhead of logging and restore time from snapshot + tail
+
+Usage: python benchmarks/bench_session_log.py [players ...]
+"""
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from join_codes import JoinCodeRegistry
+from live_session_page import LiveSessionPage
+from session_log import SessionLog
+
+QUESTIONS = 20
+RESTORES = 10
+ROUNDS = 3
+
+
+def play(players, log, rng):
+    """Run a full quiz; returns seconds spent in submit_answers/next_question"""
+    session = LiveSessionPage(quiz_id=1, registry=JoinCodeRegistry(), log=log)
+    session.start_live_session()
+    ids = [result["id"] for result in session.add_participants([f"Player {n}" for n in range(players)])]
+    session.start_quiz()
+    answering = 0.0
+    for question in range(1, QUESTIONS + 1):
+        batch = [{"participant_id": participant_id, "question": question,
+                  "correct": rng.random() < 0.6, "response_time": rng.uniform(0, 20)}
+                 for participant_id in ids]
+        started = time.perf_counter()
+        # Answers arrive in bursts of 50
+        for offset in range(0, players, 50):
+            session.submit_answers(batch[offset:offset + 50])
+        if question < QUESTIONS:
+            session.next_question()
+        answering += time.perf_counter() - started
+    if log is not None:
+        log.flush()
+    return answering
+
+
+def bench(players, directory):
+    path = os.path.join(directory, f"room-{players}.log")
+    gc.collect()
+    gc.disable()
+    plain = logged = float("inf")
+    for _ in range(ROUNDS):
+        plain = min(plain, play(players, None, random.Random(1)))
+        for leftover in (path, path + ".snap"):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+        logged = min(logged, play(players, SessionLog(path), random.Random(1)))
+    _, tail = SessionLog(path).load()
+    started = time.perf_counter()
+    for _ in range(RESTORES):
+        LiveSessionPage.restore(SessionLog(path), registry=JoinCodeRegistry())
+    restore = (time.perf_counter() - started) / RESTORES
+    gc.enable()
+    print(f"{players:>7,} players x {QUESTIONS} questions  answers {plain * 1e3:8.1f} ms"
+          f"  with log {logged * 1e3:8.1f} ms ({(logged / plain - 1) * 100:+5.1f}%)"
+          f"  restore {restore * 1e3:7.2f} ms ({len(tail)} tail events)")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 1000, 10000]
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            bench(size, directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark - LiveSessionPage.submit_answers throughput when every player answers at the timer
+
+Usage: python benchmarks/bench_submit.py [participants ...]
+"""
+import gc
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from live_session_page import QUESTION_TIME_LIMIT, LiveSessionPage, answer_points
+
+QUESTIONS = 10
+
+
+def make_session(size):
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    ids = [session.add_participant(f"Player {i}") for i in range(size)]
+    session.start_quiz()
+    return session, ids
+
+
+def make_batches(ids, rng):
+    return [
+        [{"participant_id": participant_id, "question": question, "correct": rng.random() < 0.7,
+          "response_time": rng.uniform(0, QUESTION_TIME_LIMIT)} for participant_id in ids]
+        for question in range(1, QUESTIONS + 1)
+    ]
+
+
+def bench(size):
+    rng = random.Random(size)
+    session, ids = make_session(size)
+    batches = make_batches(ids, rng)
+
+    gc.collect()
+    gc.disable()
+    started = time.perf_counter()
+    for batch in batches:
+        session.submit_answers(batch)
+        session.next_question()
+    batched = time.perf_counter() - started
+
+    # Baseline: one leaderboard update per answer
+    session, ids = make_session(size)
+    started = time.perf_counter()
+    for batch in batches:
+        for answer in batch:
+            participant = session._get_participant_by_id(answer["participant_id"])
+            points = answer_points(answer["correct"], answer["response_time"])
+            session.update_score(answer["participant_id"], participant["score"] + points)
+    per_answer = time.perf_counter() - started
+    gc.enable()
+    total = size * QUESTIONS
+    print(f"{size:>8,} players  batched {total / batched:>12,.0f} answers/s"
+          f"  per-answer updates {total / per_answer:>12,.0f} answers/s")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [500, 5000, 50000]
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+BoundedCache - Size- and TTL-bounded LRU cache with hit/miss/eviction counters
+"""
+import time
+from collections import OrderedDict
+
+
+class BoundedCache:
+    """Least-recently-used cache whose entries also expire after ttl seconds"""
+    def __init__(self, max_size=256, ttl=300, clock=time.monotonic):
+        if not isinstance(max_size, int) or max_size <= 0:
+            raise ValueError("Cache size must be a positive integer")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("TTL must be positive")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """Return a live entry and mark it most recently used"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= self.clock():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def peek(self, key, default=None):
+        """Return a live entry without counting a hit or miss or changing its LRU position"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= self.clock():
+            return default
+        return value
+
+    def put(self, key, value):
+        """Store an entry, evicting the least recently used ones past max_size"""
+        expires_at = None if self.ttl is None else self.clock() + self.ttl
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def pop(self, key, default=None):
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
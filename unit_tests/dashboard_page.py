@@ -1,10 +1,205 @@
 """
 DashboardPage - Main quiz dashboard with search, filters, and creation
 """
+import heapq
+from array import array
+from collections.abc import Sequence
+from itertools import islice
+
+from quiz_table import QuizTable
+
+SUBJECTS = ["Math", "Science", "History", "English", "Geography"]
+
+# Walk a presorted view when the filtered source holds at least 1/16 of all quizzes;
+# below that a heap over the source touches fewer quizzes
+SCAN_RATIO = 16
+
+# sort option -> newest/largest first
+SORT_OPTIONS = {
+    "date": True,
+    "name": False,
+    "questions": True
+}
+
+
+def _sort_key(table, option, handle):
+    """((type rank, value), tie-breaker) ordered ascending; descending views read it backwards"""
+    descending = SORT_OPTIONS[option]
+    value = table.value_at(handle, option, raw=True)
+    # Numbers, then text, then anything else by repr: one odd overflow value (None, "10")
+    # cannot make the view unsortable, and odd values end up last in either direction
+    if isinstance(value, (int, float)) and value == value:
+        rank = 0
+    elif isinstance(value, str):
+        rank = 1
+    else:
+        rank, value = 2, repr(value)
+    # Negated load sequence keeps ties in load order once the view is reversed
+    if descending:
+        return ((-rank, value), -handle)
+    return ((rank, value), handle)
+
+
+def _bulk_sort_key(table, option):
+    """Key giving _sort_key's order; plain (value, tie) when the column holds every value"""
+    if table.has_overflow(option):
+        return lambda handle: _sort_key(table, option, handle)
+    # One value type throughout, so the type rank would never decide anything
+    value_at = table.value_at
+    if SORT_OPTIONS[option]:
+        return lambda handle: (value_at(handle, option, True), -handle)
+    return lambda handle: (value_at(handle, option, True), handle)
+
+
+def _validate_query(query):
+    if not isinstance(query, str):
+        raise TypeError("Search query must be a string")
+    return query.strip()
+
+
+def _validate_subject(subject):
+    if not isinstance(subject, str):
+        raise TypeError("Subject must be a string")
+    if subject not in SUBJECTS:
+        raise ValueError("Invalid subject")
+    return subject
+
+
+def _validate_grade(grade):
+    if not isinstance(grade, int):
+        raise TypeError("Grade must be an integer")
+    if grade < 1 or grade > 12:
+        raise ValueError("Grade must be between 1 and 12")
+    return grade
+
+
+def _validate_sort(sort_by):
+    if sort_by not in SORT_OPTIONS:
+        raise ValueError("Invalid sort option")
+    return sort_by
+
+
+class SortedView(Sequence):
+    """Read-only live view of the dashboard quizzes in one presorted order"""
+    def __init__(self, page, sort_by):
+        self._page = page
+        self._sort_by = sort_by
+        self._descending = SORT_OPTIONS[sort_by]
+
+    def __len__(self):
+        return len(self._page._sorted[self._sort_by])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        entries = self._page._sorted[self._sort_by]
+        if index < 0:
+            index += len(entries)
+        if not 0 <= index < len(entries):
+            raise IndexError("View index out of range")
+        if self._descending:
+            index = len(entries) - 1 - index
+        return self._page.table.row_at(entries[index])
+
+    def __iter__(self):
+        entries = self._page._sorted[self._sort_by]
+        table = self._page.table
+        for handle in (reversed(entries) if self._descending else entries):
+            yield table.row_at(handle)
+
+
+class DashboardQuery:
+    """Chained query (search -> subject -> grade -> sort -> page) evaluated in one lazy pass"""
+    def __init__(self, page, search="", subject=None, grade=None, sort_by=None):
+        self._page = page
+        self._search = search
+        self._subject = subject
+        self._grade = grade
+        self._sort_by = sort_by
+
+    def search(self, query):
+        self._search = _validate_query(query)
+        return self
+
+    def subject(self, subject):
+        self._subject = _validate_subject(subject)
+        return self
+
+    def grade(self, grade):
+        self._grade = _validate_grade(grade)
+        return self
+
+    def sort(self, sort_by):
+        """Sort option, or None to keep load order"""
+        self._sort_by = None if sort_by is None else _validate_sort(sort_by)
+        return self
+
+    def _source(self):
+        """Smallest row-handle collection: the whole table or the selected subject/grade bucket"""
+        sources = [self._page.table.all_handles()]
+        if self._subject is not None:
+            sources.append(self._page._by_subject.get(self._subject, {}))
+        if self._grade is not None:
+            sources.append(self._page._by_grade.get(self._grade, {}))
+        return min(sources, key=len)
+
+    def _use_sorted_view(self):
+        return self._sort_by is not None and len(self._source()) * SCAN_RATIO >= len(self._page.table)
+
+    def _matches(self, quizzes=None):
+        """Generator over matching quizzes, by default from the smallest bucket"""
+        if quizzes is None:
+            quizzes = map(self._page.table.row_at, self._source())
+        needle = self._search.lower()
+        for quiz in quizzes:
+            if self._subject is not None and quiz.get("subject") != self._subject:
+                continue
+            if self._grade is not None and quiz.get("grade") != self._grade:
+                continue
+            if needle:
+                name = quiz.get("name")
+                if not isinstance(name, str) or needle not in name.lower():
+                    continue
+            yield quiz
+
+    def _key(self):
+        """Row sort key sharing the presorted views' order, odd values included"""
+        table, option = self._page.table, self._sort_by
+        return lambda quiz: _sort_key(table, option, quiz.handle)
+
+    def __iter__(self):
+        if self._sort_by is None:
+            return self._matches()
+        if self._use_sorted_view():
+            return self._matches(SortedView(self._page, self._sort_by))
+        return iter(sorted(self._matches(), key=self._key(), reverse=SORT_OPTIONS[self._sort_by]))
+
+    def count(self):
+        return sum(1 for _ in self._matches())
+
+    def page(self, number=1, size=20):
+        """Materialize only the requested page (1-based)"""
+        if not isinstance(number, int) or number < 1:
+            raise ValueError("Page number must be a positive integer")
+        if not isinstance(size, int) or size < 1:
+            raise ValueError("Page size must be a positive integer")
+        start = (number - 1) * size
+        if self._sort_by is None:
+            return list(islice(self._matches(), start, start + size))
+        if self._use_sorted_view():
+            return list(islice(self._matches(SortedView(self._page, self._sort_by)), start, start + size))
+        select = heapq.nlargest if SORT_OPTIONS[self._sort_by] else heapq.nsmallest
+        return select(start + size, self._matches(), key=self._key())[start:]
+
 
 class DashboardPage:
     def __init__(self):
-        self.quizzes = []
+        self.table = QuizTable()
+        self.table.observer = self
+        # Buckets and sorted views hold row handles, so repeated quiz ids are kept apart
+        self._by_subject = {}
+        self._by_grade = {}
+        self._sorted = {option: array("q") for option in SORT_OPTIONS}
         self.search_query = ""
         self.filters = {
             "subject": None,
@@ -17,7 +212,7 @@ class DashboardPage:
         """Load quizzes into dashboard"""
         if quiz_list is None:
             # Default mock quizzes
-            self.quizzes = [
+            quiz_list = [
                 {"id": 1, "name": "Math Quiz", "subject": "Math", "grade": 5, "questions": 10, "date": "2024-01-15"},
                 {"id": 2, "name": "Science Test", "subject": "Science", "grade": 8, "questions": 15, "date": "2024-01-20"},
                 {"id": 3, "name": "History Exam", "subject": "History", "grade": 10, "questions": 20, "date": "2024-01-10"}
@@ -25,58 +220,119 @@ class DashboardPage:
         else:
             if not isinstance(quiz_list, list):
                 raise TypeError("Quiz list must be a list")
-            self.quizzes = quiz_list
+
+        # Build everything aside and swap it in, so a bad quiz leaves the dashboard untouched
+        table = QuizTable()
+        by_subject = {}
+        by_grade = {}
+        for quiz in quiz_list:
+            if not isinstance(quiz, dict):
+                raise TypeError("Quiz must be a dict")
+            handle = table.append(quiz, unique=False)
+            by_subject.setdefault(table.value_at(handle, "subject"), {})[handle] = None
+            by_grade.setdefault(table.value_at(handle, "grade"), {})[handle] = None
+        # Bulk load: sort each view once instead of inserting one by one
+        handles = table.all_handles()
+        sorted_views = {option: array("q", sorted(handles, key=_bulk_sort_key(table, option)))
+                        for option in SORT_OPTIONS}
+        self.table.observer = None
+        table.observer = self
+        self.table, self._by_subject, self._by_grade, self._sorted = table, by_subject, by_grade, sorted_views
         self.is_loaded = True
         return True
+
+    def add_quiz(self, quiz):
+        """Add a single quiz, keeping buckets and sorted views up to date"""
+        if not isinstance(quiz, dict):
+            raise TypeError("Quiz must be a dict")
+        if not isinstance(quiz.get("id"), int):
+            raise TypeError("Quiz ID must be an integer")
+        if quiz["id"] in self.table:
+            raise ValueError(f"Quiz with ID {quiz['id']} already exists")
+        self._index_row(self.table.append(quiz))
+        return quiz["id"]
+
+    @property
+    def quizzes(self):
+        """All quizzes (row views) in load order"""
+        return self.table.rows()
+
+    def _sorted_position(self, option, handle):
+        """bisect_left of the row's key in one sorted handle array"""
+        handles = self._sorted[option]
+        table = self.table
+        key = _sort_key(table, option, handle)
+        low, high = 0, len(handles)
+        while low < high:
+            middle = (low + high) // 2
+            if _sort_key(table, option, handles[middle]) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _index_row(self, handle):
+        """Add a stored row to the subject/grade buckets and the sorted views"""
+        self._by_subject.setdefault(self.table.value_at(handle, "subject"), {})[handle] = None
+        self._by_grade.setdefault(self.table.value_at(handle, "grade"), {})[handle] = None
+        for option, handles in self._sorted.items():
+            handles.insert(self._sorted_position(option, handle), handle)
+
+    def _unindex_row(self, handle):
+        """Remove a row from the sorted views and its buckets (the table keeps it)"""
+        for option, handles in self._sorted.items():
+            del handles[self._sorted_position(option, handle)]
+        for buckets, field in ((self._by_subject, "subject"), (self._by_grade, "grade")):
+            key = self.table.value_at(handle, field)
+            bucket = buckets[key]
+            del bucket[handle]
+            if not bucket:
+                del buckets[key]
+
+    def before_row_change(self, handle):
+        """Table observer: a row view is about to be edited"""
+        self._unindex_row(handle)
+
+    def after_row_change(self, handle):
+        self._index_row(handle)
     
+    def query(self):
+        """Lazy query pipeline seeded with the active search and filters"""
+        return DashboardQuery(
+            self,
+            search=self.search_query,
+            subject=self.filters["subject"],
+            grade=self.filters["grade"],
+            sort_by=self.filters["sort_by"]
+        )
+
     def search_quiz(self, query):
         """Search quizzes by name"""
-        if not isinstance(query, str):
-            raise TypeError("Search query must be a string")
-        
-        self.search_query = query.strip()
+        self.search_query = _validate_query(query)
         
         if not self.search_query:
             return self.quizzes
         
-        results = [q for q in self.quizzes if self.search_query.lower() in q["name"].lower()]
+        needle = self.search_query.lower()
+        names = self.table.names
+        results = [self.table.row_at(handle) for handle, index in self.table.positions()
+                   if needle in names[index].lower()]
         return results
     
     def filter_by_subject(self, subject):
         """Filter quizzes by subject"""
-        if not isinstance(subject, str):
-            raise TypeError("Subject must be a string")
-        
-        if subject not in ["Math", "Science", "History", "English", "Geography"]:
-            raise ValueError("Invalid subject")
-        
-        self.filters["subject"] = subject
-        return [q for q in self.quizzes if q["subject"] == subject]
+        self.filters["subject"] = _validate_subject(subject)
+        return [self.table.row_at(handle) for handle in self._by_subject.get(subject, ())]
     
     def filter_by_grade(self, grade):
         """Filter quizzes by grade level"""
-        if not isinstance(grade, int):
-            raise TypeError("Grade must be an integer")
-        
-        if grade < 1 or grade > 12:
-            raise ValueError("Grade must be between 1 and 12")
-        
-        self.filters["grade"] = grade
-        return [q for q in self.quizzes if q["grade"] == grade]
+        self.filters["grade"] = _validate_grade(grade)
+        return [self.table.row_at(handle) for handle in self._by_grade.get(grade, ())]
     
     def sort_quizzes(self, sort_by):
-        """Sort quizzes by: date, name, questions"""
-        if sort_by not in ["date", "name", "questions"]:
-            raise ValueError("Invalid sort option")
-        
-        self.filters["sort_by"] = sort_by
-        
-        if sort_by == "date":
-            return sorted(self.quizzes, key=lambda q: q["date"], reverse=True)
-        elif sort_by == "name":
-            return sorted(self.quizzes, key=lambda q: q["name"])
-        else:  # questions
-            return sorted(self.quizzes, key=lambda q: q["questions"], reverse=True)
+        """Sort quizzes by: date, name, questions (live presorted view, no copy)"""
+        self.filters["sort_by"] = _validate_sort(sort_by)
+        return SortedView(self, sort_by)
     
     def click_create_quiz_button(self):
         """Click 'Create Quiz' button"""
@@ -86,17 +342,14 @@ class DashboardPage:
     
     def get_quiz_count(self):
         """Get total number of quizzes"""
-        return len(self.quizzes)
+        return len(self.table)
     
     def get_quiz_by_id(self, quiz_id):
         """Get specific quiz by ID"""
         if not isinstance(quiz_id, int):
             raise TypeError("Quiz ID must be an integer")
         
-        for quiz in self.quizzes:
-            if quiz["id"] == quiz_id:
-                return quiz
-        return None
+        return self.table.row(quiz_id)
     
     def open_quiz(self, quiz_id):
         """Open quiz for viewing/editing"""
@@ -111,7 +364,10 @@ class DashboardPage:
         if quiz is None:
             raise ValueError(f"Quiz with ID {quiz_id} not found")
         
-        self.quizzes = [q for q in self.quizzes if q["id"] != quiz_id]
+        # Every row loaded with this id
+        for handle in self.table.handles_of(quiz_id):
+            self._unindex_row(handle)
+            self.table.remove_handle(handle)
         return {"status": "success", "message": f"Quiz {quiz_id} deleted"}
     
     def clear_filters(self):
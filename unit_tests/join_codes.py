@@ -0,0 +1,60 @@
+"""
+JoinCodeRegistry - Unique live-session join codes with O(1) code -> session lookup
+"""
+import random
+import string
+
+ALPHABET = string.ascii_uppercase + string.digits
+
+
+class JoinCodeRegistry:
+    """Random codes checked against the active set; released codes become available again"""
+    def __init__(self, length=6, rng=None):
+        if not isinstance(length, int) or length <= 0:
+            raise ValueError("Code length must be a positive integer")
+        self.length = length
+        self.capacity = len(ALPHABET) ** length
+        self._rng = rng or random.Random()
+        self._sessions = {}
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __contains__(self, code):
+        return self.normalize(code) in self._sessions
+
+    @staticmethod
+    def normalize(code):
+        """Codes are matched case-insensitively, ignoring surrounding whitespace"""
+        return code.strip().upper() if isinstance(code, str) else code
+
+    def allocate(self, session):
+        """Reserve a code no active session is using and bind it to the session"""
+        if len(self._sessions) >= self.capacity:
+            raise ValueError("No join codes left")
+        # With 36^6 codes a draw collides with probability live / 2.2e9, so retries are rare
+        code = "".join(self._rng.choices(ALPHABET, k=self.length))
+        while code in self._sessions:
+            code = "".join(self._rng.choices(ALPHABET, k=self.length))
+        self._sessions[code] = session
+        return code
+
+    def register(self, code, session):
+        """Bind a known code to a session (e.g. one restored after a restart)"""
+        code = self.normalize(code)
+        if code in self._sessions:
+            raise ValueError(f"Join code {code} is already in use")
+        self._sessions[code] = session
+        return code
+
+    def resolve(self, code):
+        """Session using the code, or None"""
+        return self._sessions.get(self.normalize(code))
+
+    def release(self, code):
+        """Free a code for reuse; returns False if it was not active"""
+        return self._sessions.pop(self.normalize(code), None) is not None
+
+
+# Registry shared by sessions created without their own
+default_registry = JoinCodeRegistry()
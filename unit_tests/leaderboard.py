@@ -0,0 +1,88 @@
+"""
+Leaderboard - Score-ordered members with bisect updates, top-N and rank queries
+"""
+from bisect import bisect_left, insort
+
+# Batches touching at least 1/8 of the members re-sort once instead of moving each entry
+REBUILD_RATIO = 8
+
+
+class Leaderboard:
+    """Sorted (-score, join sequence, member id) entries: highest score first, ties in join order"""
+    def __init__(self):
+        self._entries = []
+        self._keys = {}
+        self._next_sequence = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, member_id):
+        return member_id in self._keys
+
+    def add(self, member_id, score=0):
+        if member_id in self._keys:
+            raise ValueError(f"Member {member_id} is already on the leaderboard")
+        entry = (-score, self._next_sequence, member_id)
+        self._next_sequence += 1
+        insort(self._entries, entry)
+        self._keys[member_id] = entry
+
+    def add_many(self, member_ids, score=0):
+        """Add members in order with one sort instead of an insort each"""
+        member_ids = list(member_ids)
+        for member_id in member_ids:
+            if member_id in self._keys:
+                raise ValueError(f"Member {member_id} is already on the leaderboard")
+        if len(set(member_ids)) != len(member_ids):
+            raise ValueError("Members must be unique")
+        entries = []
+        for member_id in member_ids:
+            entry = (-score, self._next_sequence, member_id)
+            self._next_sequence += 1
+            self._keys[member_id] = entry
+            entries.append(entry)
+        self._entries.extend(entries)
+        # Two sorted runs: timsort merges them in linear time
+        self._entries.sort()
+
+    def remove(self, member_id):
+        entry = self._keys.pop(member_id)
+        del self._entries[bisect_left(self._entries, entry)]
+
+    def update(self, member_id, score):
+        """Move a member to its new score position; join order still breaks ties"""
+        old = self._keys[member_id]
+        if old[0] == -score:
+            return
+        del self._entries[bisect_left(self._entries, old)]
+        entry = (-score, old[1], member_id)
+        insort(self._entries, entry)
+        self._keys[member_id] = entry
+
+    def update_many(self, scores):
+        """Apply {member_id: score} in one pass: per-entry moves for small batches, one sort for large"""
+        if len(scores) * REBUILD_RATIO < len(self._entries):
+            for member_id, score in scores.items():
+                self.update(member_id, score)
+            return
+        for member_id, score in scores.items():
+            old = self._keys[member_id]
+            self._keys[member_id] = (-score, old[1], member_id)
+        # Refresh entries in their previous order, then re-sort: unchanged members are
+        # still in order, which timsort merges in close to linear time
+        keys = self._keys
+        self._entries = [keys[entry[2]] for entry in self._entries]
+        self._entries.sort()
+
+    def score(self, member_id):
+        return -self._keys[member_id][0]
+
+    def rank(self, member_id):
+        """1-based position of the member"""
+        return bisect_left(self._entries, self._keys[member_id]) + 1
+
+    def top(self, limit=None):
+        """Member ids of the best `limit` members (all when None)"""
+        entries = self._entries if limit is None else self._entries[:limit]
+        return [entry[2] for entry in entries]
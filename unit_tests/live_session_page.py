@@ -1,25 +1,100 @@
 """
 LiveSessionPage - Live quiz session with join codes and participant tracking
 """
+import sys
+import time
+from collections.abc import Mapping
+
+from bounded_cache import BoundedCache
+from join_codes import default_registry
+from leaderboard import Leaderboard
+from qr_code import qr_matrix, qr_png
+
+QUESTION_TIME_LIMIT = 20.0
+MAX_POINTS = 1000
+JOIN_URL = "https://quizizz.com/join?code={}"
+QR_CACHE_SIZE = 4096
+# Logged events written out immediately: game-state boundaries and whole answer batches
+FLUSHED_EVENTS = ("start", "question", "answers", "end")
+# Game boundaries where a due snapshot is taken; never on the answer path
+SNAPSHOT_EVENTS = ("start", "question")
+
+# Rendered QR codes by join code, shared by all sessions; evicted when a code is released
+qr_cache = BoundedCache(max_size=QR_CACHE_SIZE, ttl=None)
+
+
+def answer_points(correct, response_time, time_limit=QUESTION_TIME_LIMIT):
+    """Correct answers earn MAX_POINTS when instant, falling linearly to half at the time limit"""
+    if not correct:
+        return 0
+    return round(MAX_POINTS * (1 - response_time / time_limit / 2))
+
+
+class Participant(Mapping):
+    """Slotted participant record, readable like the old dicts; scores change through update_score"""
+    __slots__ = ("id", "name", "joined_at", "_score")
+    FIELDS = ("id", "name", "joined_at", "score")
+
+    def __init__(self, participant_id, name, joined_at, score=0):
+        self.id = participant_id
+        # Rooms full of the same first names share one string object
+        self.name = sys.intern(name)
+        self.joined_at = joined_at
+        self._score = score
+
+    @property
+    def score(self):
+        return self._score
+
+    def __getitem__(self, field):
+        if field not in Participant.FIELDS:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __iter__(self):
+        return iter(Participant.FIELDS)
+
+    def __len__(self):
+        return len(Participant.FIELDS)
+
+    def __contains__(self, field):
+        return field in Participant.FIELDS
+
+    def __repr__(self):
+        return f"Participant(id={self.id}, name={self.name!r}, score={self._score})"
+
 
 class LiveSessionPage:
-    def __init__(self, quiz_id):
+    def __init__(self, quiz_id, registry=None, log=None, clock=time.monotonic):
         if not isinstance(quiz_id, int):
             raise TypeError("Quiz ID must be an integer")
         self.quiz_id = quiz_id
+        self.registry = default_registry if registry is None else registry
+        # Optional SessionLog: every state change is recorded so restore() can rebuild the session
+        self.log = log
+        # Join timestamps come from this clock (monotonic seconds by default)
+        self.clock = clock
         self.join_code = None
         self.is_started = False
-        self.participants = []
+        # id -> participant record in join order; ids are never reused
+        self._participants = {}
+        self._next_participant_id = 1
+        # Case-folded name -> ids of participants using it, in join order
+        self._name_index = {}
         self.current_question = 0
+        self._answered = set()
+        self.leaderboard = Leaderboard()
+        self._record("create", quiz_id=quiz_id)
     
     def start_live_session(self):
         """Start a live quiz session"""
-        import random
-        import string
-        
-        # Generate random 6-character join code
-        self.join_code = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
+        if self.is_started:
+            self.registry.release(self.join_code)
+            qr_cache.pop(self.join_code)
+        # Unique among all active sessions sharing the registry
+        self.join_code = self.registry.allocate(self)
         self.is_started = True
+        self._record("start", join_code=self.join_code)
         return {
             "status": "success",
             "join_code": self.join_code,
@@ -48,9 +123,15 @@ class LiveSessionPage:
         if method == "email":
             return {"action": "open_email_client", "body": f"Join my quiz with code: {self.join_code}"}
         elif method == "link":
-            return {"action": "generate_link", "url": f"https://quizizz.com/join?code={self.join_code}"}
+            return {"action": "generate_link", "url": JOIN_URL.format(self.join_code)}
         else:  # qr
-            return {"action": "generate_qr", "data": self.join_code}
+            # The projector and every student phone ask for the same image: render it once
+            image = qr_cache.get(self.join_code)
+            if image is None:
+                matrix = qr_matrix(JOIN_URL.format(self.join_code))
+                image = qr_cache.put(self.join_code, {"matrix": matrix, "png": qr_png(matrix)})
+            return {"action": "generate_qr", "data": self.join_code, "url": JOIN_URL.format(self.join_code),
+                    "matrix": image["matrix"], "png": image["png"]}
     
     def add_participant(self, name):
         """Add a participant to the session"""
@@ -61,22 +142,80 @@ class LiveSessionPage:
         if not self.is_started:
             raise ValueError("Session has not been started yet")
         
-        participant = {
-            "id": len(self.participants) + 1,
-            "name": name.strip(),
-            "joined_at": "2024-01-15 10:00:00",
-            "score": 0
-        }
-        self.participants.append(participant)
-        return participant["id"]
+        participant = self._new_participant(name.strip(), self.clock())
+        self.leaderboard.add(participant.id, participant.score)
+        self._record("join", participants=[[participant.id, participant.name, participant.joined_at]])
+        return participant.id
+    
+    def add_participants(self, names):
+        """Join many participants in one pass (e.g. a class scanning the QR code)
+
+        Returns one result per name: "joined" with the new id, "duplicate" with the id
+        of the participant already using that name (case-insensitive), or "invalid".
+        """
+        if not isinstance(names, (list, tuple)):
+            raise TypeError("Names must be a list")
+        if not self.is_started:
+            raise ValueError("Session has not been started yet")
+        
+        results = []
+        joined = []
+        participants = self._participants
+        name_index = self._name_index
+        next_id = self._next_participant_id
+        # One batch, one join time
+        joined_at = self.clock()
+        for name in names:
+            if not isinstance(name, str):
+                results.append({"name": name, "status": "invalid", "id": None,
+                                "error": "Participant name must be a string"})
+                continue
+            name = name.strip()
+            if not name:
+                results.append({"name": name, "status": "invalid", "id": None,
+                                "error": "Participant name cannot be empty"})
+                continue
+            key = sys.intern(name.casefold())
+            existing = name_index.get(key)
+            if existing:
+                results.append({"name": name, "status": "duplicate", "id": existing[0]})
+                continue
+            # Inlined _new_participant: ids are allocated locally and stored once at the end
+            participants[next_id] = Participant(next_id, name, joined_at)
+            name_index[key] = [next_id]
+            joined.append(next_id)
+            results.append({"name": name, "status": "joined", "id": next_id})
+            next_id += 1
+        self._next_participant_id = next_id
+        self.leaderboard.add_many(joined)
+        if joined:
+            self._record("join", participants=[[participant_id, participants[participant_id].name, joined_at]
+                                               for participant_id in joined])
+        return results
+    
+    def _new_participant(self, name, joined_at):
+        """Create, store and index a participant record (leaderboard not included)"""
+        participant = Participant(self._next_participant_id, name, joined_at)
+        self._next_participant_id += 1
+        self._store_participant(participant)
+        return participant
+    
+    def _store_participant(self, participant):
+        self._participants[participant.id] = participant
+        self._name_index.setdefault(sys.intern(participant.name.casefold()), []).append(participant.id)
     
     def get_participant_count(self):
         """Get number of participants"""
-        return len(self.participants)
+        return len(self._participants)
+    
+    @property
+    def participants(self):
+        """Participants in join order"""
+        return list(self._participants.values())
     
     def get_participants(self):
         """Get list of all participants"""
-        return self.participants.copy()
+        return self.participants
     
     def remove_participant(self, participant_id):
         """Remove a participant from session"""
@@ -87,17 +226,30 @@ class LiveSessionPage:
         if participant is None:
             raise ValueError(f"Participant with ID {participant_id} not found")
         
-        self.participants = [p for p in self.participants if p["id"] != participant_id]
+        self._drop_participant(participant)
+        self._record("leave", id=participant_id)
         return {"status": "success", "message": f"Participant {participant_id} removed"}
     
+    def _drop_participant(self, participant):
+        """Remove a participant from the records, leaderboard and name index"""
+        del self._participants[participant.id]
+        self.leaderboard.remove(participant.id)
+        key = participant.name.casefold()
+        same_name = self._name_index[key]
+        same_name.remove(participant.id)
+        if not same_name:
+            del self._name_index[key]
+    
     def start_quiz(self):
         """Start the quiz questions"""
         if not self.is_started:
             raise ValueError("Session has not been started yet")
-        if len(self.participants) == 0:
+        if len(self._participants) == 0:
             raise ValueError("Cannot start quiz without participants")
         
         self.current_question = 1
+        self._answered = set()
+        self._record("question", question=1)
         return {
             "status": "success",
             "message": "Quiz started",
@@ -110,31 +262,182 @@ class LiveSessionPage:
             raise ValueError("Quiz has not been started yet")
         
         self.current_question += 1
+        self._answered = set()
+        self._record("question", question=self.current_question)
         return {"current_question": self.current_question}
     
+    def submit_answers(self, batch):
+        """Score a burst of answers to the current question and update the leaderboard once
+
+        Each answer is a dict with participant_id, question, correct and response_time
+        (seconds). Answers for another question, from unknown participants, repeated
+        answers and out-of-range times are counted as rejected instead of raising.
+        """
+        if self.current_question == 0:
+            raise ValueError("Quiz has not been started yet")
+        if not isinstance(batch, (list, tuple)):
+            raise TypeError("Answer batch must be a list")
+        
+        question = self.current_question
+        participants = self._participants
+        answered = self._answered
+        new_scores = {}
+        accepted_ids = []
+        for answer in batch:
+            try:
+                participant_id = answer["participant_id"]
+                response_time = answer["response_time"]
+                valid = (answer["question"] == question and participant_id in participants
+                         and participant_id not in answered and 0 <= response_time <= QUESTION_TIME_LIMIT)
+            except (KeyError, TypeError):
+                valid = False
+            if not valid:
+                continue
+            answered.add(participant_id)
+            accepted_ids.append(participant_id)
+            points = answer_points(answer.get("correct"), response_time)
+            if points:
+                participant = participants[participant_id]
+                participant._score += points
+                new_scores[participant_id] = participant._score
+        self.leaderboard.update_many(new_scores)
+        if accepted_ids:
+            # Resulting scores, not raw answers: replay needs no re-scoring
+            self._record("answers", question=question, answered=accepted_ids,
+                         scores=[[participant_id, score] for participant_id, score in new_scores.items()])
+        return {"question": question, "accepted": len(accepted_ids), "rejected": len(batch) - len(accepted_ids)}
+    
     def end_session(self):
         """End the live session"""
         if not self.is_started:
             raise ValueError("Session has not been started yet")
         
         self.is_started = False
+        self.registry.release(self.join_code)
+        qr_cache.pop(self.join_code)
+        self._record("end")
         return {
             "status": "success",
-            "total_participants": len(self.participants),
+            "total_participants": len(self._participants),
             "message": "Session ended"
         }
     
-    def get_leaderboard(self):
-        """Get current leaderboard"""
-        if len(self.participants) == 0:
-            return []
-        
-        sorted_participants = sorted(self.participants, key=lambda p: p["score"], reverse=True)
-        return sorted_participants
+    @staticmethod
+    def find_by_join_code(join_code, registry=None):
+        """Active session using the join code, or None"""
+        return (default_registry if registry is None else registry).resolve(join_code)
+    
+    def get_leaderboard(self, limit=None):
+        """Get current leaderboard (highest score first, ties in join order)"""
+        if limit is not None and (not isinstance(limit, int) or limit <= 0):
+            raise ValueError("Limit must be a positive integer")
+        return [self._participants[participant_id] for participant_id in self.leaderboard.top(limit)]
+    
+    def get_rank(self, participant_id):
+        """1-based leaderboard position of a participant"""
+        if self._get_participant_by_id(participant_id) is None:
+            raise ValueError(f"Participant with ID {participant_id} not found")
+        return self.leaderboard.rank(participant_id)
+    
+    def update_score(self, participant_id, score):
+        """Set a participant's score and move them on the leaderboard"""
+        if not isinstance(score, (int, float)):
+            raise TypeError("Score must be a number")
+        if score < 0:
+            raise ValueError("Score cannot be negative")
+        participant = self._get_participant_by_id(participant_id)
+        if participant is None:
+            raise ValueError(f"Participant with ID {participant_id} not found")
+        participant._score = score
+        self.leaderboard.update(participant_id, score)
+        self._record("score", id=participant_id, score=score)
+        return self.leaderboard.rank(participant_id)
     
     def _get_participant_by_id(self, participant_id):
         """Internal method to find participant by ID"""
-        for participant in self.participants:
-            if participant["id"] == participant_id:
-                return participant
-        return None
+        return self._participants.get(participant_id)
+    
+    def _record(self, event_type, **data):
+        """Append an event to the session log, writing a due snapshot at the next game boundary"""
+        if self.log is None:
+            return
+        data["type"] = event_type
+        if self.log.append(data) and event_type in SNAPSHOT_EVENTS:
+            self.log.write_snapshot(self.snapshot())
+        elif event_type in FLUSHED_EVENTS:
+            self.log.flush()
+    
+    def snapshot(self):
+        """JSON-serializable state from which restore() rebuilds the session"""
+        return {
+            "quiz_id": self.quiz_id,
+            "join_code": self.join_code,
+            "is_started": self.is_started,
+            "current_question": self.current_question,
+            "next_participant_id": self._next_participant_id,
+            # Join order, so restored leaderboard ties break the same way
+            "participants": [[p.id, p.name, p.joined_at, p.score] for p in self._participants.values()],
+            "answered": sorted(self._answered)
+        }
+    
+    @classmethod
+    def restore(cls, log, registry=None, clock=time.monotonic):
+        """Rebuild a session from its log's latest snapshot plus the events after it
+
+        The session is re-bound to its join code if it was still running, and later
+        changes keep being recorded in the same log. Logged join times are kept as
+        recorded, so they are only comparable with each other.
+        """
+        state, events = log.load()
+        if state is not None:
+            session = cls(state["quiz_id"], registry=registry, clock=clock)
+            session._load_snapshot(state)
+        elif events and events[0]["type"] == "create":
+            session = cls(events[0]["quiz_id"], registry=registry, clock=clock)
+        else:
+            raise ValueError("Session log is empty")
+        for event in events:
+            session._apply(event)
+        # Replay only updates records; the leaderboard is re-sorted once at the end
+        session.leaderboard.update_many({participant_id: participant.score
+                                         for participant_id, participant in session._participants.items()})
+        if session.is_started:
+            session.registry.register(session.join_code, session)
+        session.log = log
+        return session
+    
+    def _load_snapshot(self, state):
+        self.join_code = state["join_code"]
+        self.is_started = state["is_started"]
+        self.current_question = state["current_question"]
+        self._answered = set(state["answered"])
+        for participant_id, name, joined_at, score in state["participants"]:
+            self._store_participant(Participant(participant_id, name, joined_at, score))
+        self._next_participant_id = state["next_participant_id"]
+        self.leaderboard.add_many(self._participants)
+    
+    def _apply(self, event):
+        """Replay one logged event; restore() binds the registry and re-sorts the leaderboard afterwards"""
+        event_type = event["type"]
+        if event_type == "start":
+            self.join_code = event["join_code"]
+            self.is_started = True
+        elif event_type == "join":
+            joined = []
+            for participant_id, name, joined_at in event["participants"]:
+                self._next_participant_id = participant_id
+                joined.append(self._new_participant(name, joined_at).id)
+            self.leaderboard.add_many(joined)
+        elif event_type == "leave":
+            self._drop_participant(self._participants[event["id"]])
+        elif event_type == "question":
+            self.current_question = event["question"]
+            self._answered = set()
+        elif event_type == "answers":
+            self._answered.update(event["answered"])
+            for participant_id, score in event["scores"]:
+                self._participants[participant_id]._score = score
+        elif event_type == "score":
+            self._participants[event["id"]]._score = event["score"]
+        elif event_type == "end":
+            self.is_started = False
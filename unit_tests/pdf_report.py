@@ -0,0 +1,147 @@
+"""
+PdfReport - Streaming text-only PDF writer with optional process-pool page rendering
+"""
+import os
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+PAGE_WIDTH = 595  # A4 in points
+PAGE_HEIGHT = 842
+MARGIN = 50
+FONT_SIZE = 9
+LEADING = 14
+LINES_PER_PAGE = 50
+# Below this many pages the pool start-up costs more than it saves
+PARALLEL_MIN_PAGES = 200
+# Pages sent to a worker per task, and tasks in flight per worker; together they
+# bound memory while amortizing inter-process overhead
+PAGES_PER_TASK = 16
+PENDING_PER_WORKER = 4
+
+
+def pdf_text(text):
+    """Escape a line for a PDF literal string (Latin-1; other characters become ?)"""
+    encoded = str(text).encode("latin-1", "replace")
+    return encoded.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+def render_page(lines, number):
+    """Compressed content stream for one page of text lines plus a page-number footer"""
+    parts = [b"BT /F1 %d Tf %d TL %d %d Td" % (FONT_SIZE, LEADING, MARGIN, PAGE_HEIGHT - MARGIN)]
+    for line in lines:
+        parts.append(b"(" + pdf_text(line) + b") Tj T*")
+    parts.append(b"ET")
+    parts.append(b"BT /F1 %d Tf %d %d Td (Page %d) Tj ET" % (FONT_SIZE, PAGE_WIDTH - MARGIN - 40, MARGIN // 2, number))
+    return zlib.compress(b"\n".join(parts))
+
+
+def render_pages(pages, first_number):
+    """Content streams for a batch of consecutive pages (one process-pool task)"""
+    return [render_page(lines, number) for number, lines in enumerate(pages, first_number)]
+
+
+def paginate(lines, per_page=LINES_PER_PAGE, header=()):
+    """Group an iterable of lines into pages, repeating header lines on each page"""
+    lines = iter(lines)
+    body = per_page - len(header)
+    if body <= 0:
+        raise ValueError("Header does not fit on a page")
+    while True:
+        chunk = list(islice(lines, body))
+        if not chunk:
+            return
+        yield list(header) + chunk
+
+
+def default_workers(pages):
+    """One process per core, but only for reports long enough to amortize the pool"""
+    cores = os.cpu_count() or 1
+    return cores if cores > 1 and pages >= PARALLEL_MIN_PAGES else 1
+
+
+class PdfStreamWriter:
+    """Writes each object as soon as it is produced; only byte offsets are kept for the xref"""
+    CATALOG = 1
+    PAGES = 2
+    FONT = 3
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._file = open(filename, "wb")
+        self._offsets = {}
+        self._page_ids = []
+        self._next_id = 4
+        self._file.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        self._write_object(self.FONT, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica "
+                                      b"/Encoding /WinAnsiEncoding >>")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    @property
+    def page_count(self):
+        return len(self._page_ids)
+
+    def add_page(self, stream):
+        """Append a page given its compressed content stream"""
+        if self._file is None:
+            raise ValueError("Writer is closed")
+        content_id, page_id = self._next_id, self._next_id + 1
+        self._next_id += 2
+        self._write_object(content_id, b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(stream)
+                           + stream + b"\nendstream")
+        self._write_object(page_id, b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %d %d] /Contents %d 0 R "
+                                    b"/Resources << /Font << /F1 %d 0 R >> >> >>"
+                           % (self.PAGES, PAGE_WIDTH, PAGE_HEIGHT, content_id, self.FONT))
+        self._page_ids.append(page_id)
+
+    def close(self):
+        """Write the page tree, catalog, xref table and trailer"""
+        if self._file is None:
+            return
+        kids = b" ".join(b"%d 0 R" % page_id for page_id in self._page_ids)
+        self._write_object(self.PAGES, b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % len(self._page_ids))
+        self._write_object(self.CATALOG, b"<< /Type /Catalog /Pages %d 0 R >>" % self.PAGES)
+        xref = self._file.tell()
+        size = self._next_id
+        self._file.write(b"xref\n0 %d\n0000000000 65535 f \n" % size)
+        self._file.write(b"".join(b"%010d 00000 n \n" % self._offsets[object_id] for object_id in range(1, size)))
+        self._file.write(b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, self.CATALOG, xref))
+        self._file.close()
+        self._file = None
+
+    def _write_object(self, object_id, body):
+        self._offsets[object_id] = self._file.tell()
+        self._file.write(b"%d 0 obj\n" % object_id + body + b"\nendobj\n")
+
+
+def write_report(filename, pages, workers=1):
+    """Render an iterable of page line lists into filename and return the page count"""
+    if not isinstance(workers, int) or workers <= 0:
+        raise ValueError("Workers must be a positive integer")
+    with PdfStreamWriter(filename) as writer:
+        if workers == 1:
+            for number, lines in enumerate(pages, 1):
+                writer.add_page(render_page(lines, number))
+            return writer.page_count
+        pages = iter(pages)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Submit through a bounded window (Executor.map would consume every page up front)
+            pending = deque()
+            number = 1
+            while True:
+                batch = list(islice(pages, PAGES_PER_TASK))
+                if batch:
+                    pending.append(pool.submit(render_pages, batch, number))
+                    number += len(batch)
+                if pending and (not batch or len(pending) >= workers * PENDING_PER_WORKER):
+                    for stream in pending.popleft().result():
+                        writer.add_page(stream)
+                elif not batch:
+                    break
+        return writer.page_count
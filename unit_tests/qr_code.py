@@ -0,0 +1,236 @@
+"""
+QrCode - Pure-Python QR code encoder (byte mode, versions 1-3, error correction M) with PNG output
+"""
+import struct
+import zlib
+
+# Version -> (data codewords, error correction codewords) at level M; one block each
+VERSIONS = {1: (16, 10), 2: (28, 16), 3: (44, 26)}
+EC_LEVEL_M = 0b00
+FORMAT_GENERATOR = 0b10100110111
+FORMAT_MASK = 0b101010000010010
+PAD_BYTES = (0xEC, 0x11)
+
+# GF(256) with the QR polynomial x^8 + x^4 + x^3 + x^2 + 1
+GF_EXP = [0] * 512
+GF_LOG = [0] * 256
+_value = 1
+for _power in range(255):
+    GF_EXP[_power] = _value
+    GF_LOG[_value] = _power
+    _value <<= 1
+    if _value & 0x100:
+        _value ^= 0x11D
+for _power in range(255, 512):
+    GF_EXP[_power] = GF_EXP[_power - 255]
+
+MASKS = (
+    lambda row, col: (row + col) % 2 == 0,
+    lambda row, col: row % 2 == 0,
+    lambda row, col: col % 3 == 0,
+    lambda row, col: (row + col) % 3 == 0,
+    lambda row, col: (row // 2 + col // 3) % 2 == 0,
+    lambda row, col: row * col % 2 + row * col % 3 == 0,
+    lambda row, col: (row * col % 2 + row * col % 3) % 2 == 0,
+    lambda row, col: ((row + col) % 2 + row * col % 3) % 2 == 0,
+)
+FINDER_LIKE = ("10111010000", "00001011101")
+
+
+def rs_generator(degree):
+    """Coefficients (highest power first) of prod(x - a^i) for i < degree"""
+    generator = [1]
+    for power in range(degree):
+        product = generator + [0]
+        for index, coefficient in enumerate(generator):
+            if coefficient:
+                product[index + 1] ^= GF_EXP[GF_LOG[coefficient] + power]
+        generator = product
+    return generator
+
+
+def rs_remainder(data, degree):
+    """Reed-Solomon error correction codewords for the data codewords"""
+    generator = rs_generator(degree)
+    remainder = [0] * degree
+    for byte in data:
+        factor = byte ^ remainder[0]
+        remainder = remainder[1:] + [0]
+        if factor:
+            log_factor = GF_LOG[factor]
+            for index in range(degree):
+                remainder[index] ^= GF_EXP[GF_LOG[generator[index + 1]] + log_factor]
+    return remainder
+
+
+def format_bits(mask):
+    """15-bit BCH-protected format information for level M and the mask"""
+    data = EC_LEVEL_M << 3 | mask
+    remainder = data << 10
+    for shift in range(4, -1, -1):
+        if remainder & 1 << (shift + 10):
+            remainder ^= FORMAT_GENERATOR << shift
+    return (data << 10 | remainder) ^ FORMAT_MASK
+
+
+def pick_version(length):
+    for version, (data_codewords, _) in VERSIONS.items():
+        # 4-bit mode indicator and 8-bit character count precede the data
+        if length <= data_codewords - 2:
+            return version
+    raise ValueError(f"Data too long for a QR code (max {VERSIONS[3][0] - 2} bytes)")
+
+
+def codewords(data, version):
+    """Byte-mode data codewords padded to capacity, followed by their error correction"""
+    data_codewords, ec_codewords = VERSIONS[version]
+    bits = "0100" + format(len(data), "08b") + "".join(format(byte, "08b") for byte in data)
+    bits += "0" * min(4, data_codewords * 8 - len(bits))
+    bits += "0" * (-len(bits) % 8)
+    encoded = [int(bits[index:index + 8], 2) for index in range(0, len(bits), 8)]
+    encoded += [PAD_BYTES[index % 2] for index in range(data_codewords - len(encoded))]
+    return encoded + rs_remainder(encoded, ec_codewords)
+
+
+def function_patterns(version):
+    """Module grid with finder, timing and alignment patterns, plus the reserved-module mask"""
+    size = 17 + 4 * version
+    modules = [[0] * size for _ in range(size)]
+    reserved = [[False] * size for _ in range(size)]
+
+    def put(row, col, dark):
+        modules[row][col] = int(dark)
+        reserved[row][col] = True
+
+    for index in range(size):
+        put(6, index, index % 2 == 0)
+        put(index, 6, index % 2 == 0)
+    for top, left in ((0, 0), (0, size - 7), (size - 7, 0)):
+        # 7x7 finder plus its light separator, clipped to the grid
+        for row in range(top - 1, top + 8):
+            for col in range(left - 1, left + 8):
+                if 0 <= row < size and 0 <= col < size:
+                    distance = max(abs(row - top - 3), abs(col - left - 3))
+                    put(row, col, distance != 2 and distance != 4)
+    if version > 1:
+        # Versions 2-6 have a single alignment pattern near the bottom-right corner
+        center = size - 7
+        for row in range(center - 2, center + 3):
+            for col in range(center - 2, center + 3):
+                put(row, col, max(abs(row - center), abs(col - center)) != 1)
+    # Format information areas and the always-dark module
+    for index in range(9):
+        reserved[8][index] = reserved[index][8] = True
+    for index in range(8):
+        reserved[8][size - 1 - index] = reserved[size - 1 - index][8] = True
+    put(size - 8, 8, True)
+    return modules, reserved
+
+
+def place_data(modules, reserved, data):
+    """Fill non-reserved modules with the codeword bits in the two-column zigzag order"""
+    size = len(modules)
+    bits = [(byte >> shift) & 1 for byte in data for shift in range(7, -1, -1)]
+    index = 0
+    right = size - 1
+    while right > 0:
+        if right == 6:
+            # Skip the vertical timing pattern
+            right = 5
+        upward = ((right + 1) & 2) == 0
+        for step in range(size):
+            row = size - 1 - step if upward else step
+            for col in (right, right - 1):
+                if not reserved[row][col]:
+                    # Remainder bits after the last codeword stay light
+                    modules[row][col] = bits[index] if index < len(bits) else 0
+                    index += 1
+        right -= 2
+
+
+def place_format(modules, mask):
+    size = len(modules)
+    bits = format_bits(mask)
+    bit = [(bits >> index) & 1 for index in range(15)]
+    for index in range(6):
+        modules[index][8] = bit[index]
+    modules[7][8] = bit[6]
+    modules[8][8] = bit[7]
+    modules[8][7] = bit[8]
+    for index in range(9, 15):
+        modules[8][14 - index] = bit[index]
+    for index in range(8):
+        modules[8][size - 1 - index] = bit[index]
+    for index in range(8, 15):
+        modules[size - 15 + index][8] = bit[index]
+
+
+def penalty(modules):
+    """Mask penalty score: long runs, 2x2 blocks, finder-like patterns and dark balance"""
+    size = len(modules)
+    lines = ["".join(map(str, row)) for row in modules]
+    lines += ["".join(str(modules[row][col]) for row in range(size)) for col in range(size)]
+    score = 0
+    for line in lines:
+        run = 1
+        for index in range(1, size + 1):
+            if index < size and line[index] == line[index - 1]:
+                run += 1
+                continue
+            if run >= 5:
+                score += run - 2
+            run = 1
+        for pattern in FINDER_LIKE:
+            start = line.find(pattern)
+            while start != -1:
+                score += 40
+                start = line.find(pattern, start + 1)
+    for row in range(size - 1):
+        for col in range(size - 1):
+            if modules[row][col] == modules[row][col + 1] == modules[row + 1][col] == modules[row + 1][col + 1]:
+                score += 3
+    dark = sum(map(sum, modules))
+    total = size * size
+    score += abs(dark * 20 - total * 10) // total * 10
+    return score
+
+
+def qr_matrix(text):
+    """QR code modules (1 = dark) for the text as UTF-8, using the lowest-penalty mask"""
+    data = text.encode("utf-8")
+    version = pick_version(len(data))
+    base, reserved = function_patterns(version)
+    place_data(base, reserved, codewords(data, version))
+    best = None
+    for mask, applies in enumerate(MASKS):
+        modules = [row[:] for row in base]
+        for row in range(len(modules)):
+            for col in range(len(modules)):
+                if not reserved[row][col] and applies(row, col):
+                    modules[row][col] ^= 1
+        place_format(modules, mask)
+        score = penalty(modules)
+        if best is None or score < best[0]:
+            best = (score, modules)
+    return tuple(tuple(row) for row in best[1])
+
+
+def png_chunk(tag, data):
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+
+def qr_png(matrix, scale=8, border=4):
+    """Grayscale PNG of the modules, `scale` pixels per module with a light quiet zone"""
+    if not isinstance(scale, int) or scale <= 0:
+        raise ValueError("Scale must be a positive integer")
+    width = (len(matrix) + 2 * border) * scale
+    margin = b"\xff" * (border * scale)
+    blank = b"\x00" + b"\xff" * width
+    rows = [blank] * (border * scale)
+    for modules in matrix:
+        pixels = b"".join(b"\x00" * scale if dark else b"\xff" * scale for dark in modules)
+        rows.extend([b"\x00" + margin + pixels + margin] * scale)
+    rows.extend([blank] * (border * scale))
+    header = struct.pack(">IIBBBBB", width, width, 8, 0, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + png_chunk(b"IHDR", header)
+            + png_chunk(b"IDAT", zlib.compress(b"".join(rows), 9)) + png_chunk(b"IEND", b""))
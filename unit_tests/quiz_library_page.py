@@ -1,9 +1,13 @@
 
+from quiz_table import QuizTable
+
+
 class QuizLibraryPage:
     """Quizizz library - save favorite quizzes, organize collections"""
     def __init__(self):
         self.saved_quizzes = []
-        self.quiz_plays = {}
+        # One row per distinct saved quiz (its plays); saved_quizzes keeps every save in order
+        self.table = QuizTable()
         self.total_questions = 0
 
     def add_quiz(self, quiz_id, plays=0, questions=10):
@@ -15,18 +19,24 @@ class QuizLibraryPage:
         if questions <= 0:
             raise ValueError("Questions must be positive")
         
+        if quiz_id in self.table:
+            self.table.set_value(quiz_id, "plays", self.table.value(quiz_id, "plays") + plays)
+        else:
+            self.table.append({"id": quiz_id, "plays": plays})
+        # Only once the table accepted the quiz, so a failed add leaves no trace
         self.saved_quizzes.append(quiz_id)
-        self.quiz_plays[quiz_id] = self.quiz_plays.get(quiz_id, 0) + plays
         self.total_questions += questions
         return self.saved_quizzes
 
     def remove_quiz(self, quiz_id):
         """Remove quiz from library"""
-        if quiz_id not in self.saved_quizzes:
+        if quiz_id not in self.table:
             raise ValueError("Quiz not in library")
         self.saved_quizzes.remove(quiz_id)
-        if quiz_id in self.quiz_plays:
-            del self.quiz_plays[quiz_id]
+        if quiz_id in self.saved_quizzes:
+            self.table.set_value(quiz_id, "plays", 0)
+        else:
+            self.table.remove(quiz_id)
         return self.saved_quizzes
 
     def get_quizzes(self):
@@ -38,21 +48,23 @@ class QuizLibraryPage:
     
     def get_plays(self, quiz_id):
         """Get number of plays for a quiz"""
-        return self.quiz_plays.get(quiz_id, 0)
+        if quiz_id not in self.table:
+            return 0
+        return self.table.value(quiz_id, "plays")
     
     def update_plays(self, quiz_id, plays):
         """Update play count for a quiz"""
-        if quiz_id not in self.saved_quizzes:
+        if quiz_id not in self.table:
             raise ValueError("Quiz not in library")
         if plays < 0:
             raise ValueError("Plays cannot be negative")
-        self.quiz_plays[quiz_id] = plays
-        return self.quiz_plays[quiz_id]
+        self.table.set_value(quiz_id, "plays", plays)
+        return plays
     
     def clear_library(self):
         """Clear all saved quizzes"""
         self.saved_quizzes = []
-        self.quiz_plays = {}
+        self.table = QuizTable()
         self.total_questions = 0
         return self.saved_quizzes
     
@@ -63,4 +75,4 @@ class QuizLibraryPage:
         return len(self.saved_quizzes) == 0
     
     def has_quiz(self, quiz_id):
-        return quiz_id in self.saved_quizzes
+        return quiz_id in self.table
@@ -1,34 +1,238 @@
+import heapq
+import json
+import os
+
+from autocomplete import AutocompleteTrie, normalize_term
+from bounded_cache import BoundedCache
+from search_index import SearchIndex, tokenize
+
+MOCK_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mock_data")
+# Quizzes per search() page unless the caller asks for more (limit=None returns every match)
+PAGE_SIZE = 20
+
 
 class QuizSearchPage:
     """Quizizz search functionality - search for quizzes, apply filters"""
-    def __init__(self):
+    def __init__(self, cache_size=256, cache_ttl=300):
         self.last_query = None
+        self.last_fuzzy = False
         self.filters = {}
-        self.results_cache = {}
-    
-    def search(self, query):
-        """Search for quizzes by keyword"""
+        self.sort_order = None
+        self.results_cache = BoundedCache(max_size=cache_size, ttl=cache_ttl)
+        self.index = SearchIndex()
+        self.suggestions = AutocompleteTrie()
+        # (name, weight) of every subject/topic suggestion, replayed when the catalog is rebuilt
+        self.topics = []
+
+    def load_quizzes(self, quiz_list=None):
+        """Load quiz catalog into the search index"""
+        if quiz_list is None:
+            # Default mock catalog
+            with open(os.path.join(MOCK_DATA_DIR, "search_results.json"), encoding="utf-8") as f:
+                quiz_list = json.load(f)["quizzes"]
+        elif not isinstance(quiz_list, list):
+            raise TypeError("Quiz list must be a list")
+        for quiz in quiz_list:
+            if not isinstance(quiz, dict):
+                raise TypeError("Quiz must be a dict")
+            if not isinstance(quiz.get("id"), int):
+                raise TypeError("Quiz ID must be an integer")
+
+        # Built aside and swapped in: a bad quiz part-way through leaves the current catalog intact
+        index = SearchIndex()
+        index.add_many(quiz_list)
+        suggestions = AutocompleteTrie()
+        for name, weight in self.topics:
+            suggestions.add(name, weight)
+        for quiz in quiz_list:
+            if quiz.get("title"):
+                suggestions.add(quiz["title"], quiz.get("plays", 0))
+        self.index = index
+        self.suggestions = suggestions
+        self.results_cache.clear()
+        return len(self.index)
+
+    def load_topics(self, category_tree=None):
+        """Add subject and topic names to autocomplete, ranked by subject quiz count"""
+        if category_tree is None:
+            with open(os.path.join(MOCK_DATA_DIR, "category_tree.json"), encoding="utf-8") as f:
+                category_tree = json.load(f)
+        elif not isinstance(category_tree, dict):
+            raise TypeError("Category tree must be a dict")
+
+        added = 0
+        for subject in category_tree.get("subjects", []):
+            weight = subject.get("quiz_count", 0)
+            for name in [subject["name"]] + subject.get("topics", []):
+                self.suggestions.add(name, weight)
+                self.topics.append((name, weight))
+                added += 1
+        return added
+
+    def add_quiz(self, quiz):
+        """Add or replace a single quiz in the catalog"""
+        if not isinstance(quiz, dict):
+            raise TypeError("Quiz must be a dict")
+        if not isinstance(quiz.get("id"), int):
+            raise TypeError("Quiz ID must be an integer")
+        previous = self.index.get(quiz["id"])
+        if previous is not None:
+            self._remove_suggestion(previous)
+        self.index.add(quiz)
+        self._add_suggestion(quiz)
+        self.results_cache.clear()
+        return quiz["id"]
+
+    def remove_quiz(self, quiz_id):
+        """Remove a quiz from the catalog"""
+        if not isinstance(quiz_id, int):
+            raise TypeError("Quiz ID must be an integer")
+        quiz = self.index.get(quiz_id)
+        if quiz is None:
+            raise ValueError(f"Quiz with ID {quiz_id} not found")
+        self.index.remove(quiz_id)
+        self._remove_suggestion(quiz)
+        self.results_cache.clear()
+        return True
+
+    def _add_suggestion(self, quiz):
+        if quiz.get("title"):
+            self.suggestions.add(quiz["title"], quiz.get("plays", 0))
+
+    def _remove_suggestion(self, quiz):
+        if quiz.get("title"):
+            self.suggestions.remove(quiz["title"], quiz.get("plays", 0))
+
+    def suggest(self, prefix, limit=5):
+        """Ranked title/subject/topic completions for a search-as-you-type prefix"""
+        if not isinstance(prefix, str):
+            raise TypeError("Prefix must be a string")
+        if not isinstance(limit, int) or limit <= 0:
+            raise ValueError("Limit must be a positive integer")
+        return self.suggestions.suggest(normalize_term(prefix, keep_trailing_space=True), limit)
+
+    def search(self, query, limit=PAGE_SIZE, fuzzy=False):
+        """Search for quizzes by keyword (every word must match title, subject or language)
+
+        Returns the first `limit` matches (one page by default) with the total count.
+        With fuzzy=True words may contain typos; closest matches come first.
+        """
         if not isinstance(query, str) or not query.strip():
             raise ValueError("Invalid query")
+        if limit is not None and (not isinstance(limit, int) or limit <= 0):
+            raise ValueError("Limit must be a positive integer")
         self.last_query = query
-        results = {"quizzes": [query], "count": 1}
-        self.results_cache[query] = results
-        return results
+        self.last_fuzzy = fuzzy
+
+        key = self._cache_key(query, limit, fuzzy)
+        cached = self.results_cache.get(key)
+        if cached is not None:
+            return cached
+
+        distances = self.index.fuzzy_match(query) if fuzzy else None
+        matches = self._filtered(set(distances) if fuzzy else self.index.match(query))
+        if self.sort_order is not None:
+            ids = self.index.top_by_plays(limit, matches, descending=self.sort_order == "desc")
+        elif fuzzy:
+            ranked = ((distances[quiz_id], quiz_id) for quiz_id in matches)
+            best = sorted(ranked) if limit is None else heapq.nsmallest(limit, ranked)
+            ids = [quiz_id for _, quiz_id in best]
+        elif limit is None:
+            ids = sorted(matches)
+        else:
+            ids = heapq.nsmallest(limit, matches)
+        results = {
+            "quizzes": [self.index.get(quiz_id) for quiz_id in ids],
+            "count": len(matches),
+            "facets": self.index.facet_counts(matches)
+        }
+        return self.results_cache.put(key, results)
+
+    def _cache_key(self, query, limit=None, fuzzy=False):
+        """Normalized query + facet filters + sort order + limit + fuzziness"""
+        # Other filter names do not change results, and apply_filter leaves their values unchecked
+        filters = tuple(sorted(
+            (name, (value["min"], value["max"]) if isinstance(value, dict) else value)
+            for name, value in self.filters.items() if name in SearchIndex.FACETS
+        ))
+        return (" ".join(tokenize(query)), filters, self.sort_order, limit, fuzzy)
+
+    def _filtered(self, matches):
+        """Intersect query matches with the active filters, smallest set first"""
+        for allowed in sorted(self._filter_sets(), key=len):
+            if not matches:
+                break
+            matches = matches & allowed
+        return matches
 
-    def sort_by_plays(self, order):
-        """Sort quizzes by number of plays"""
+    def _filter_sets(self):
+        """Id sets for the active subject/grade/language filters"""
+        sets = []
+        for name, value in self.filters.items():
+            if name not in SearchIndex.FACETS:
+                continue
+            if name == "grade" and isinstance(value, dict):
+                grades = self.validate_grade_range(value["min"], value["max"])
+                sets.append(self.index.facet_range("grade", grades["min"], grades["max"]))
+            else:
+                sets.append(self.index.facet_ids(name, value))
+        return sets
+
+    def sort_by_plays(self, order, k=20, cursor=None):
+        """Page of k quizzes by number of plays for the last query (or whole catalog)"""
         if not isinstance(order, str) or not order.strip():
             raise ValueError("Order must be a string")
         if order not in ("asc", "desc"):
             raise ValueError("Invalid sort order")
-        return order
+        if not isinstance(k, int) or k <= 0:
+            raise ValueError("Page size must be a positive integer")
+        after = self._decode_cursor(cursor)
+        self.sort_order = order
+
+        if self.last_query is not None:
+            if self.last_fuzzy:
+                candidates = self._filtered(set(self.index.fuzzy_match(self.last_query)))
+            else:
+                candidates = self._filtered(self.index.match(self.last_query))
+        else:
+            filter_sets = sorted(self._filter_sets(), key=len)
+            candidates = filter_sets[0].intersection(*filter_sets[1:]) if filter_sets else None
+        total = len(self.index) if candidates is None else len(candidates)
+
+        ids = self.index.top_by_plays(k, candidates, descending=order == "desc", after=after)
+        quizzes = [self.index.get(quiz_id) for quiz_id in ids]
+        next_cursor = None
+        if len(ids) == k:
+            next_cursor = f"{quizzes[-1].get('plays', 0)}:{ids[-1]}"
+        return {"quizzes": quizzes, "count": total, "next_cursor": next_cursor}
+
+    @staticmethod
+    def _decode_cursor(cursor):
+        """Cursor "plays:id" -> SearchIndex.plays_key of the last quiz on the previous page"""
+        if cursor is None:
+            return None
+        try:
+            plays, quiz_id = (int(part) for part in cursor.split(":"))
+        except (AttributeError, ValueError):
+            raise ValueError("Invalid cursor")
+        return (-plays, quiz_id)
     
     def apply_filter(self, filter_name, value):
-        """Apply filter: grade, subject, language"""
+        """Apply filter: grade (single grade or validate_grade_range dict), subject, language"""
         if not filter_name:
             raise ValueError("Filter name cannot be empty")
         if value is None:
             raise ValueError("Filter value cannot be None")
+        if filter_name in SearchIndex.FACETS:
+            if filter_name == "grade" and isinstance(value, dict):
+                if "min" not in value or "max" not in value:
+                    raise ValueError("Grade range must have min and max")
+                value = self.validate_grade_range(value["min"], value["max"])
+            else:
+                try:
+                    hash(value)
+                except TypeError:
+                    raise TypeError(f"Filter value for {filter_name} must be hashable")
         self.filters[filter_name] = value
         return self.filters
     
@@ -36,8 +240,16 @@ class QuizSearchPage:
         self.filters = {}
         return self.filters
     
-    def get_cached_results(self, query):
-        return self.results_cache.get(query)
+    def get_cached_results(self, query, limit=PAGE_SIZE, fuzzy=False):
+        """Cached results for the query under the current filters and sort order"""
+        if not isinstance(query, str):
+            return None
+        # peek: checking the cache is not a use of it, so stats and LRU order stay put
+        return self.results_cache.peek(self._cache_key(query, limit, fuzzy))
+
+    def get_cache_stats(self):
+        """Cache size and hit/miss/eviction/expiration counters"""
+        return self.results_cache.stats()
     
     def get_last_query(self):
         return self.last_query
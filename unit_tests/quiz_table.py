@@ -0,0 +1,353 @@
+"""
+QuizTable - Columnar quiz storage (typed arrays) with dict-like row views
+"""
+from array import array
+from collections.abc import MutableMapping
+from datetime import date
+
+FIELDS = ("id", "name", "subject", "grade", "questions", "plays", "date")
+# Presence bit per column field: rows only expose the fields they were loaded with
+FIELD_BITS = {field: 1 << bit for bit, field in enumerate(FIELDS[1:])}
+NUMERIC_FIELDS = ("grade", "questions", "plays")
+
+
+def date_ordinal(value):
+    """Ordinal of an ISO date string, or None if it would not read back unchanged"""
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = date.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed.toordinal() if parsed.isoformat() == value else None
+
+
+class QuizRow(MutableMapping):
+    """Dict-like view of one quiz row; writes go straight to the table"""
+    __slots__ = ("_table", "_handle")
+
+    def __init__(self, table, handle):
+        self._table = table
+        self._handle = handle
+
+    @property
+    def handle(self):
+        """Table handle of the row"""
+        return self._handle
+
+    def __getitem__(self, field):
+        if not self._table.has_field(self._handle, field):
+            raise KeyError(field)
+        return self._table.value_at(self._handle, field)
+
+    def __setitem__(self, field, value):
+        self._table.set_field(self._handle, field, value)
+
+    def __delitem__(self, field):
+        self._table.delete_field(self._handle, field)
+
+    def __iter__(self):
+        return iter(self._table.fields(self._handle))
+
+    def __len__(self):
+        return len(self._table.fields(self._handle))
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class QuizTable:
+    """One typed array per numeric column (ids stay a list); subjects are stored as small integer codes
+
+    Rows are addressed by a handle assigned on append (also their load sequence), so
+    the same quiz id may appear more than once. Values a column cannot hold exactly
+    (non-integer counts, non-ISO dates) and keys outside FIELDS are kept per row in
+    an overflow dict. An optional observer is told before and after a row changes.
+    """
+    def __init__(self):
+        # Plain list: every id is already held as a _by_id key, and any hashable id fits
+        self.ids = []
+        self.names = []
+        self.subject_codes = array("H")
+        self.grades = array("b")
+        self.questions = array("l")
+        self.plays = array("q")
+        self.date_ordinals = array("l")
+        self.handles = array("q")
+        self.present = array("B")
+        self.subjects = []
+        self.observer = None
+        self._subject_codes = {}
+        self._rows = {}
+        self._by_id = {}
+        self._extra = {}
+        self._text_dates = 0
+        self._next_handle = 0
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, quiz_id):
+        return quiz_id in self._by_id
+
+    def __iter__(self):
+        """Quiz ids in insertion order"""
+        ids = self.ids
+        return (ids[index] for index in self._rows.values())
+
+    def append(self, quiz, unique=True):
+        """Store a quiz dict as a new row and return its handle"""
+        quiz_id = quiz["id"]
+        # Raises TypeError for an unhashable id before anything is registered
+        same_id = self._by_id.get(quiz_id)
+        if unique and same_id is not None:
+            raise ValueError(f"Quiz with ID {quiz_id} already exists")
+        handle = self._next_handle
+        self._next_handle += 1
+        index = len(self.ids)
+        self._rows[handle] = index
+        if same_id is None:
+            self._by_id[quiz_id] = [handle]
+        else:
+            same_id.append(handle)
+        self.ids.append(quiz_id)
+        self.names.append("")
+        # Placeholder until the loop below; None gets a code only for rows without a subject
+        self.subject_codes.append(0)
+        self.grades.append(0)
+        self.questions.append(0)
+        self.plays.append(0)
+        self.date_ordinals.append(0)
+        self.handles.append(handle)
+        self.present.append(0)
+        for field, value in quiz.items():
+            if field != "id":
+                self._set(handle, index, field, value)
+        if "subject" not in quiz:
+            self._reset(index, "subject")
+        return handle
+
+    def remove(self, quiz_id):
+        """Delete every row with the quiz id"""
+        for handle in list(self._by_id.get(quiz_id, ())):
+            self.remove_handle(handle)
+
+    def remove_handle(self, handle):
+        """Delete one row in O(1) by moving the last row into its slot"""
+        index = self._rows.pop(handle)
+        same_id = self._by_id[self.ids[index]]
+        same_id.remove(handle)
+        if not same_id:
+            del self._by_id[self.ids[index]]
+        extra = self._extra.pop(handle, None)
+        if extra and "date" in extra:
+            self._text_dates -= 1
+        last = len(self.ids) - 1
+        if index != last:
+            self._rows[self.handles[last]] = index
+            for column in self._columns():
+                column[index] = column[last]
+        for column in self._columns():
+            column.pop()
+
+    def clear(self):
+        """Drop every row (subject codes are kept)"""
+        for column in self._columns():
+            del column[:]
+        self._rows.clear()
+        self._by_id.clear()
+        self._extra.clear()
+        self._text_dates = 0
+
+    def handle(self, quiz_id):
+        """Handle of the first row with the quiz id, or None"""
+        handles = self._by_id.get(quiz_id)
+        return handles[0] if handles else None
+
+    def handles_of(self, quiz_id):
+        """Handles of every row with the quiz id, in insertion order"""
+        return list(self._by_id.get(quiz_id, ()))
+
+    def all_handles(self):
+        """Live view of every handle in insertion order"""
+        return self._rows.keys()
+
+    def positions(self):
+        """(handle, column index) pairs in insertion order"""
+        return self._rows.items()
+
+    def row(self, quiz_id):
+        """Row view of the first row with the quiz id, or None"""
+        handle = self.handle(quiz_id)
+        return None if handle is None else QuizRow(self, handle)
+
+    def row_at(self, handle):
+        return QuizRow(self, handle)
+
+    def rows(self):
+        """Row views in insertion order"""
+        return [QuizRow(self, handle) for handle in self._rows]
+
+    def subject_code(self, subject):
+        """Integer code for a subject, assigning the next one on first sight"""
+        code = self._subject_codes.get(subject)
+        if code is None:
+            code = len(self.subjects)
+            self.subjects.append(subject)
+            self._subject_codes[subject] = code
+        return code
+
+    def has_field(self, handle, field):
+        if field == "id":
+            return True
+        extra = self._extra.get(handle)
+        if extra is not None and field in extra:
+            return True
+        bit = FIELD_BITS.get(field)
+        return bit is not None and (self.present[self._rows[handle]] & bit) != 0
+
+    def has_overflow(self, field):
+        """True when some row keeps the field in its overflow dict instead of the column"""
+        return any(field in extra for extra in self._extra.values())
+
+    def fields(self, handle):
+        """Keys of the row: id, the loaded column fields, then overflow keys"""
+        present = self.present[self._rows[handle]]
+        fields = ["id"] + [field for field, bit in FIELD_BITS.items() if present & bit]
+        fields.extend(self._extra.get(handle, ()))
+        return fields
+
+    def value(self, quiz_id, field, raw=False):
+        """Field value for the first row with the quiz id"""
+        return self.value_at(self._by_id[quiz_id][0], field, raw)
+
+    def value_at(self, handle, field, raw=False):
+        """Field value for one row; raw=True gives codes/ordinals for sorting (default when absent)"""
+        index = self._rows[handle]
+        if self._extra:
+            extra = self._extra.get(handle)
+            if extra is not None and field in extra:
+                value = extra[field]
+                if raw and field == "date":
+                    return value if isinstance(value, str) else ""
+                return value
+        if field == "id":
+            return self.ids[index]
+        if field == "name":
+            return self.names[index]
+        if field == "subject":
+            code = self.subject_codes[index]
+            return code if raw else self.subjects[code]
+        if field == "grade":
+            return self.grades[index]
+        if field == "questions":
+            return self.questions[index]
+        if field == "plays":
+            return self.plays[index]
+        if field == "date":
+            ordinal = self.date_ordinals[index]
+            # Ordinals sort like ISO strings; once any date is free text, compare strings
+            if raw and not self._text_dates:
+                return ordinal
+            return date.fromordinal(ordinal).isoformat() if ordinal else ("" if raw else None)
+        if field == "sequence":
+            return handle
+        raise KeyError(field)
+
+    def set_value(self, quiz_id, field, value):
+        """Update a numeric field of the first row with the quiz id"""
+        if field not in NUMERIC_FIELDS:
+            raise KeyError(field)
+        handle = self._by_id[quiz_id][0]
+        self._set(handle, self._rows[handle], field, value)
+
+    def set_field(self, handle, field, value):
+        """Write any field except the id, notifying the observer"""
+        if field == "id":
+            raise ValueError("Quiz ID cannot be changed")
+        if self.observer is not None:
+            self.observer.before_row_change(handle)
+        self._set(handle, self._rows[handle], field, value)
+        if self.observer is not None:
+            self.observer.after_row_change(handle)
+
+    def delete_field(self, handle, field):
+        if field == "id":
+            raise ValueError("Quiz ID cannot be changed")
+        if not self.has_field(handle, field):
+            raise KeyError(field)
+        if self.observer is not None:
+            self.observer.before_row_change(handle)
+        index = self._rows[handle]
+        self._drop_extra(handle, field)
+        bit = FIELD_BITS.get(field)
+        if bit is not None:
+            self.present[index] &= ~bit
+            self._reset(index, field)
+        if self.observer is not None:
+            self.observer.after_row_change(handle)
+
+    def _set(self, handle, index, field, value):
+        bit = FIELD_BITS.get(field)
+        if bit is not None and self._store(index, field, value):
+            self.present[index] |= bit
+            self._drop_extra(handle, field)
+            return
+        if bit is not None:
+            self.present[index] &= ~bit
+            self._reset(index, field)
+        extra = self._extra.setdefault(handle, {})
+        if field == "date" and field not in extra:
+            self._text_dates += 1
+        extra[field] = value
+
+    def _store(self, index, field, value):
+        """Write a value into its column; False when the column cannot hold it exactly"""
+        if field == "name":
+            if not isinstance(value, str):
+                return False
+            self.names[index] = value
+        elif field == "subject":
+            try:
+                self.subject_codes[index] = self.subject_code(value)
+            except (TypeError, OverflowError):
+                return False
+        elif field == "date":
+            ordinal = date_ordinal(value)
+            if ordinal is None:
+                return False
+            self.date_ordinals[index] = ordinal
+        else:
+            # bool and float would not read back as the same type
+            if type(value) is not int:
+                return False
+            column = {"grade": self.grades, "questions": self.questions, "plays": self.plays}[field]
+            try:
+                column[index] = value
+            except OverflowError:
+                return False
+        return True
+
+    def _reset(self, index, field):
+        if field == "name":
+            self.names[index] = ""
+        elif field == "subject":
+            self.subject_codes[index] = self.subject_code(None)
+        elif field == "date":
+            self.date_ordinals[index] = 0
+        else:
+            self._store(index, field, 0)
+
+    def _drop_extra(self, handle, field):
+        extra = self._extra.get(handle)
+        if extra is None or field not in extra:
+            return
+        del extra[field]
+        if field == "date":
+            self._text_dates -= 1
+        if not extra:
+            del self._extra[handle]
+
+    def _columns(self):
+        return (self.ids, self.names, self.subject_codes, self.grades, self.questions,
+                self.plays, self.date_ordinals, self.handles, self.present)
@@ -1,6 +1,28 @@
 """
 ResultsPage - View and filter quiz results with export functionality
 """
+from bisect import bisect_left
+from itertools import chain
+from operator import itemgetter
+
+import numpy as np
+
+from pdf_report import LINES_PER_PAGE, default_workers, paginate, write_report
+from xlsx_writer import XlsxStreamWriter
+
+PERCENTILES = (25, 50, 75, 90)
+# Score buckets 0-9, 10-19, ..., 90-100 (numpy closes the last bin)
+HISTOGRAM_EDGES = tuple(range(0, 101, 10))
+SORT_FIELDS = ("score", "accuracy", "student", "date")
+EXPORT_COLUMNS = ("id", "student", "score", "accuracy", "questions_correct", "total_questions", "date")
+# Result rows packed into the answer bit matrix per numpy call
+ANSWER_BLOCK_ROWS = 65536
+# Upper/lower group share for the item discrimination index
+DISCRIMINATION_GROUP = 0.27
+HISTOGRAM_LABELS = tuple(
+    f"{low}-{high if high == HISTOGRAM_EDGES[-1] else high - 1}"
+    for low, high in zip(HISTOGRAM_EDGES, HISTOGRAM_EDGES[1:])
+)
 
 class ResultsPage:
     def __init__(self):
@@ -10,22 +32,56 @@ class ResultsPage:
             "min_accuracy": None,
             "question_id": None
         }
+        self._index_results([])
     
     def load_results(self, results_list=None):
         """Load quiz results"""
         if results_list is None:
             # Default mock results
-            self.results = [
-                {"id": 1, "student": "Alice", "score": 85, "accuracy": 85.0, "questions_correct": 17, "total_questions": 20, "date": "2024-01-15"},
-                {"id": 2, "student": "Bob", "score": 92, "accuracy": 92.0, "questions_correct": 18, "total_questions": 20, "date": "2024-01-15"},
-                {"id": 3, "student": "Charlie", "score": 78, "accuracy": 78.0, "questions_correct": 15, "total_questions": 20, "date": "2024-01-16"}
+            results_list = [
+                {"id": 1, "student": "Alice", "score": 85, "accuracy": 85.0, "questions_correct": 17, "total_questions": 20, "date": "2024-01-15",
+                 "answers": [1, 1, 1, 0, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1]},
+                {"id": 2, "student": "Bob", "score": 92, "accuracy": 92.0, "questions_correct": 18, "total_questions": 20, "date": "2024-01-15",
+                 "answers": [1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1]},
+                {"id": 3, "student": "Charlie", "score": 78, "accuracy": 78.0, "questions_correct": 15, "total_questions": 20, "date": "2024-01-16",
+                 "answers": [1, 0, 1, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 0, 1, 1, 0, 1, 1]}
             ]
         else:
             if not isinstance(results_list, list):
                 raise TypeError("Results must be a list")
-            self.results = results_list
+        self._index_results(results_list)
         return True
     
+    def _index_results(self, results):
+        """Id map, case-folded student index and accuracy-sorted results, swapped in with the rows"""
+        # Built aside and assigned together, so a failure keeps the previous load intact.
+        # Rows missing a field stay loaded but are left out of that field's index.
+        by_id = {}
+        by_student = {}
+        with_accuracy = []
+        for result in results:
+            if "id" in result:
+                by_id.setdefault(result["id"], result)
+            student = result.get("student")
+            if isinstance(student, str):
+                by_student.setdefault(student.casefold(), []).append(result)
+            accuracy = result.get("accuracy")
+            # NaN never passes a minimum and would break the bisect order
+            if isinstance(accuracy, (int, float)) and accuracy == accuracy:
+                with_accuracy.append(result)
+        # Stable sort: equal accuracies keep load order
+        by_accuracy = sorted(with_accuracy, key=itemgetter("accuracy"))
+        self.results = results
+        self._by_id = by_id
+        self._by_student = by_student
+        self._by_accuracy = by_accuracy
+        self._accuracy_keys = [result["accuracy"] for result in by_accuracy]
+        # Lazily built columns, bit matrices and sort permutations belong to the old data
+        self._columns = None
+        self._answers = None
+        self._sort_columns = {}
+        self._permutations = {}
+    
     def get_all_results(self):
         """Get all quiz results"""
         return self.results.copy()
@@ -38,46 +94,143 @@ class ResultsPage:
             raise ValueError("Student name cannot be empty")
         
         self.filters["student"] = student_name
-        return [r for r in self.results if r["student"].lower() == student_name.lower()]
+        return list(self._by_student.get(student_name.casefold(), ()))
     
     def filter_by_accuracy(self, min_accuracy):
-        """Filter results by minimum accuracy percentage"""
+        """Filter results by minimum accuracy percentage (lowest accuracy first)"""
         if not isinstance(min_accuracy, (int, float)):
             raise TypeError("Accuracy must be a number")
         if min_accuracy < 0 or min_accuracy > 100:
             raise ValueError("Accuracy must be between 0 and 100")
         
         self.filters["min_accuracy"] = min_accuracy
-        return [r for r in self.results if r["accuracy"] >= min_accuracy]
+        return self._by_accuracy[bisect_left(self._accuracy_keys, min_accuracy):]
     
-    def filter_by_question(self, question_id):
-        """Filter to see who answered specific question correctly/incorrectly"""
+    def filter_by_question(self, question_id, correct=None):
+        """Results that answered a question; correct=True/False keeps only right/wrong answers"""
         if not isinstance(question_id, int):
             raise TypeError("Question ID must be an integer")
+        if question_id < 1:
+            raise ValueError("Question ID must be positive")
+        if correct is not None and not isinstance(correct, bool):
+            raise TypeError("Correct must be a boolean")
         
         self.filters["question_id"] = question_id
-        # Simplified: return all results (in real scenario would check specific question)
-        return self.results.copy()
+        matrix = self._answer_matrix()
+        if question_id > matrix["questions"]:
+            return []
+        byte, bit = divmod(question_id - 1, 8)
+        mask = np.uint8(0x80 >> bit)
+        selected = (matrix["answered"][:, byte] & mask) != 0
+        if correct is not None:
+            right = (matrix["correct"][:, byte] & mask) != 0
+            selected &= right if correct else ~right
+        return [self.results[i] for i in np.flatnonzero(selected)]
+    
+    def get_item_analysis(self):
+        """Per-question answered count, difficulty (share correct) and upper-lower discrimination"""
+        matrix = self._answer_matrix()
+        questions = matrix["questions"]
+        if questions == 0:
+            return {}
+        correct = np.unpackbits(matrix["correct"], axis=1, count=questions)
+        answered = np.unpackbits(matrix["answered"], axis=1, count=questions)
+        answered_counts = answered.sum(axis=0)
+        correct_counts = correct.sum(axis=0)
+        difficulty = np.divide(correct_counts, answered_counts, out=np.zeros(questions), where=answered_counts > 0)
+        # Compare the top and bottom 27% of students (by total correct) on each question
+        students = np.flatnonzero(answered.any(axis=1))
+        order = students[np.argsort(correct[students].sum(axis=1), kind="stable")]
+        group = max(1, int(round(len(order) * DISCRIMINATION_GROUP)))
+        discrimination = correct[order[-group:]].mean(axis=0) - correct[order[:group]].mean(axis=0)
+        return {
+            question + 1: {
+                "answered": int(answered_counts[question]),
+                "correct": int(correct_counts[question]),
+                "difficulty": float(difficulty[question]),
+                "discrimination": float(discrimination[question])
+            }
+            for question in range(questions)
+        }
+    
+    def _answer_matrix(self):
+        """Bit-packed students x questions correct/answered matrices, built once per load"""
+        if self._answers is None:
+            questions = max((len(r.get("answers") or ()) for r in self.results), default=0)
+            width = (questions + 7) // 8
+            correct = np.zeros((len(self.results), width), dtype=np.uint8)
+            answered = np.zeros((len(self.results), width), dtype=np.uint8)
+            # Unpacked booleans only ever exist for one block of rows
+            for start in range(0, len(self.results), ANSWER_BLOCK_ROWS):
+                block = [r.get("answers") or () for r in self.results[start:start + ANSWER_BLOCK_ROWS]]
+                lengths = np.fromiter(map(len, block), dtype=np.intp, count=len(block))
+                # Row-major mask of answered cells; the flattened answers fill it in the same order
+                block_answered = np.arange(questions) < lengths[:, None]
+                block_correct = np.zeros(block_answered.shape, dtype=bool)
+                block_correct[block_answered] = np.fromiter(chain.from_iterable(block), dtype=bool,
+                                                            count=int(lengths.sum()))
+                correct[start:start + len(block)] = np.packbits(block_correct, axis=1)
+                answered[start:start + len(block)] = np.packbits(block_answered, axis=1)
+            self._answers = {"correct": correct, "answered": answered, "questions": questions}
+        return self._answers
     
     def sort_results(self, sort_by, ascending=False):
-        """Sort results by: score, accuracy, student, date"""
-        if sort_by not in ["score", "accuracy", "student", "date"]:
+        """Sort results by: score, accuracy, student, date
+
+        sort_by may also be a list of fields or (field, ascending) pairs, most
+        significant first; plain fields use `ascending`. Ties keep load order.
+        """
+        keys = self._normalize_sort(sort_by, ascending)
+        permutation = self._permutations.get(keys)
+        if permutation is None:
+            # np.lexsort is stable and treats its last key as the primary one
+            columns = [self._sort_column(field) if asc else -self._sort_column(field) for field, asc in keys]
+            permutation = np.lexsort(columns[::-1]) if self.results else np.empty(0, dtype=np.intp)
+            self._permutations[keys] = permutation
+        results = self.results
+        return [results[i] for i in permutation.tolist()]
+    
+    def _normalize_sort(self, sort_by, ascending):
+        """Hashable ((field, ascending), ...) tuple for a sort_results request"""
+        if isinstance(sort_by, str):
+            sort_by = [sort_by]
+        if not isinstance(sort_by, (list, tuple)) or not sort_by:
             raise ValueError("Invalid sort option")
-        
-        if sort_by == "student":
-            return sorted(self.results, key=lambda r: r["student"], reverse=not ascending)
-        else:
-            return sorted(self.results, key=lambda r: r[sort_by], reverse=not ascending)
+        keys = []
+        for key in sort_by:
+            if isinstance(key, str):
+                # Plain fields take `ascending` loosely, as sort_results always has
+                field, asc = key, bool(ascending)
+            else:
+                try:
+                    field, asc = key
+                except (TypeError, ValueError):
+                    raise ValueError("Invalid sort option")
+                if not isinstance(asc, bool):
+                    raise ValueError("Invalid sort option")
+            if field not in SORT_FIELDS:
+                raise ValueError("Invalid sort option")
+            keys.append((field, asc))
+        return tuple(keys)
+    
+    def _sort_column(self, field):
+        """Numeric column for a sort field: scores as floats, text fields as sorted-order ranks"""
+        column = self._sort_columns.get(field)
+        if column is None:
+            if field in ("score", "accuracy"):
+                column = self._score_columns()[field]
+            else:
+                _, column = np.unique(np.array([r[field] for r in self.results]), return_inverse=True)
+                column = column.astype(np.int64)
+            self._sort_columns[field] = column
+        return column
     
     def get_result_by_id(self, result_id):
         """Get specific result by ID"""
         if not isinstance(result_id, int):
             raise TypeError("Result ID must be an integer")
         
-        for result in self.results:
-            if result["id"] == result_id:
-                return result
-        return None
+        return self._by_id.get(result_id)
     
     def export_to_excel(self, filename=None):
         """Export results to Excel format"""
@@ -93,6 +246,11 @@ class ResultsPage:
         if not filename.endswith(".xlsx"):
             raise ValueError("Filename must have .xlsx extension")
         
+        # Rows are streamed straight into the zip, never materialized as a sheet in memory
+        with XlsxStreamWriter(filename, sheet_name="Results") as writer:
+            writer.write_row(EXPORT_COLUMNS)
+            writer.write_rows(tuple(r.get(column) for column in EXPORT_COLUMNS) for r in self.results)
+        
         return {
             "status": "success",
             "filename": filename,
@@ -100,17 +258,55 @@ class ResultsPage:
             "message": f"Exported {len(self.results)} results to {filename}"
         }
     
-    def download_report(self):
-        """Download PDF report of results"""
+    def download_report(self, filename=None, workers=None):
+        """Download PDF report of results (summary page, then the results table)"""
         if len(self.results) == 0:
             raise ValueError("No results to download")
         
+        if filename is None:
+            filename = "quiz_report.pdf"
+        
+        if not isinstance(filename, str):
+            raise TypeError("Filename must be a string")
+        
+        if not filename.endswith(".pdf"):
+            raise ValueError("Filename must have .pdf extension")
+        
+        if workers is None:
+            workers = default_workers(len(self.results) // LINES_PER_PAGE)
+        pages = write_report(filename, self._report_pages(), workers=workers)
+        
         return {
             "action": "download",
             "format": "pdf",
-            "filename": "quiz_report.pdf"
+            "filename": filename,
+            "pages": pages
         }
     
+    def _report_pages(self):
+        """Generator of page line lists; result rows are formatted one page at a time"""
+        stats = self.get_statistics()
+        percentiles = ", ".join(f"p{p}: {value:.1f}" for p, value in stats["percentiles"].items())
+        summary = [
+            "Quiz Results Report",
+            "",
+            f"Students: {stats['total_students']}",
+            f"Average score: {stats['average_score']:.1f}   Median: {stats['median_score']:.1f}"
+            f"   Std dev: {stats['std_score']:.1f}",
+            f"Highest: {stats['highest_score']:.0f}   Lowest: {stats['lowest_score']:.0f}",
+            f"Percentiles: {percentiles}",
+            "",
+            "Score distribution"
+        ]
+        summary += [f"    {label}: {count}" for label, count in stats["histogram"].items()]
+        summary += ["", "By date"]
+        summary += [f"    {day}: {day_stats['count']} results, average {day_stats['average_score']:.1f}"
+                    for day, day_stats in stats["by_date"].items()]
+        yield from paginate(summary)
+        rows = (f"{r.get('id')}    {r.get('student')}    score {r.get('score')}    "
+                f"accuracy {r.get('accuracy')}%    {r.get('date')}" for r in self.results)
+        yield from paginate(rows, header=("Results", ""))
+    
     def get_statistics(self):
         """Get statistical summary of results"""
         if len(self.results) == 0:
@@ -118,17 +314,69 @@ class ResultsPage:
                 "total_students": 0,
                 "average_score": 0,
                 "highest_score": 0,
-                "lowest_score": 0
+                "lowest_score": 0,
+                "median_score": 0,
+                "std_score": 0,
+                "average_accuracy": 0,
+                "percentiles": {p: 0 for p in PERCENTILES},
+                "histogram": {label: 0 for label in HISTOGRAM_LABELS},
+                "by_date": {}
             }
         
-        scores = [r["score"] for r in self.results]
+        columns = self._score_columns()
+        scores = columns["score"]
+        accuracy = columns["accuracy"]
+        buckets, _ = np.histogram(scores, bins=HISTOGRAM_EDGES)
         return {
-            "total_students": len(self.results),
-            "average_score": sum(scores) / len(scores),
-            "highest_score": max(scores),
-            "lowest_score": min(scores)
+            "total_students": len(scores),
+            "average_score": float(scores.mean()),
+            "highest_score": float(scores.max()),
+            "lowest_score": float(scores.min()),
+            "median_score": float(np.median(scores)),
+            "std_score": float(scores.std()),
+            "average_accuracy": float(accuracy.mean()),
+            "percentiles": dict(zip(PERCENTILES, np.percentile(scores, PERCENTILES).tolist())),
+            "histogram": dict(zip(HISTOGRAM_LABELS, buckets.tolist())),
+            "by_date": self._date_aggregates(columns)
         }
     
+    def _score_columns(self):
+        """Columnar score/accuracy arrays and per-row date codes, built once per load"""
+        if self._columns is None:
+            count = len(self.results)
+            date_codes = {}
+            self._columns = {
+                "score": np.fromiter((r["score"] for r in self.results), dtype=np.float64, count=count),
+                "accuracy": np.fromiter((r["accuracy"] for r in self.results), dtype=np.float64, count=count),
+                "date": np.fromiter((date_codes.setdefault(r["date"], len(date_codes)) for r in self.results),
+                                    dtype=np.intp, count=count),
+                "dates": list(date_codes)
+            }
+        return self._columns
+    
+    def _date_aggregates(self, columns):
+        """Per-date count, averages and score range, ordered by date"""
+        codes = columns["date"]
+        scores = columns["score"]
+        size = len(columns["dates"])
+        counts = np.bincount(codes, minlength=size)
+        score_sums = np.bincount(codes, weights=scores, minlength=size)
+        accuracy_sums = np.bincount(codes, weights=columns["accuracy"], minlength=size)
+        highest = np.full(size, -np.inf)
+        lowest = np.full(size, np.inf)
+        np.maximum.at(highest, codes, scores)
+        np.minimum.at(lowest, codes, scores)
+        aggregates = {}
+        for code in sorted(range(size), key=columns["dates"].__getitem__):
+            aggregates[columns["dates"][code]] = {
+                "count": int(counts[code]),
+                "average_score": float(score_sums[code] / counts[code]),
+                "average_accuracy": float(accuracy_sums[code] / counts[code]),
+                "highest_score": float(highest[code]),
+                "lowest_score": float(lowest[code])
+            }
+        return aggregates
+    
     def clear_filters(self):
         """Clear all active filters"""
         self.filters = {
@@ -148,3 +396,4 @@ class ResultsPage:
         if self.filters["question_id"]:
             active["question_id"] = self.filters["question_id"]
         return active
+
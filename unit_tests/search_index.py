@@ -0,0 +1,351 @@
+"""
+SearchIndex - Tokenized inverted index over quiz title, subject and language
+"""
+import heapq
+import re
+from array import array
+from bisect import bisect_left, bisect_right, insort
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Walk the presorted plays order when candidates are at least 1/16 of the catalog;
+# below that a heap over the candidates touches fewer quizzes
+SCAN_RATIO = 16
+# Facet counts for at least this many ids go through numpy; smaller sets are counted in a loop
+BINCOUNT_MIN = 512
+
+
+def tokenize(text):
+    """Split text into lowercase word tokens"""
+    if text is None:
+        return []
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+def trigrams(token):
+    """Boundary-padded character trigrams: "math" -> ^ma, mat, ath, th$"""
+    padded = f"^{token}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def auto_distance(token):
+    """Typos allowed for a token: none up to 2 chars, 1 up to 5, then 2"""
+    if len(token) <= 2:
+        return 0
+    return 1 if len(token) <= 5 else 2
+
+
+def bounded_edit_distance(a, b, limit):
+    """Levenshtein distance capped at limit + 1 (Myers/Hyyro bit-parallel, one pass over b)"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if not a:
+        return min(len(b), limit + 1)
+    full = (1 << len(a)) - 1
+    last = 1 << (len(a) - 1)
+    match_bits = {}
+    for i, char in enumerate(a):
+        match_bits[char] = match_bits.get(char, 0) | (1 << i)
+    positive, negative, score = full, 0, len(a)
+    for char in b:
+        eq = match_bits.get(char, 0)
+        vertical = eq | negative
+        horizontal = (((eq & positive) + positive) ^ positive) | eq
+        plus = negative | (~(horizontal | positive) & full)
+        minus = positive & horizontal
+        if plus & last:
+            score += 1
+        elif minus & last:
+            score -= 1
+        plus = ((plus << 1) | 1) & full
+        minus = (minus << 1) & full
+        positive = minus | (~(vertical | plus) & full)
+        negative = plus & vertical
+    return min(score, limit + 1)
+
+
+class SearchIndex:
+    """Per-field postings (token -> set of quiz ids) and facet sets with incremental add/remove"""
+    FIELDS = ("title", "subject", "language")
+    FACETS = ("subject", "grade", "language")
+
+    def __init__(self):
+        self.documents = {}
+        self.postings = {field: {} for field in self.FIELDS}
+        self.facets = {facet: {} for facet in self.FACETS}
+        self.by_plays = []
+        self.trigrams = {}
+        self.by_length = {}
+        # Dense slot per quiz and one code column per facet (code 0 = no value), for counting
+        self.slots = {}
+        self.free_slots = []
+        self.facet_codes = {facet: array("i") for facet in self.FACETS}
+        self.facet_values = {facet: [None] for facet in self.FACETS}
+        self._value_codes = {facet: {} for facet in self.FACETS}
+
+    def __len__(self):
+        return len(self.documents)
+
+    def __contains__(self, quiz_id):
+        return quiz_id in self.documents
+
+    def add(self, quiz):
+        """Index a quiz, replacing any previous version with the same id"""
+        self._add(quiz)
+        insort(self.by_plays, self.plays_key(quiz["id"]))
+
+    def add_many(self, quizzes):
+        """Bulk index quizzes, sorting the plays order once at the end"""
+        for quiz in quizzes:
+            if quiz["id"] in self.documents:
+                self.add(quiz)
+            else:
+                self._add(quiz)
+                self.by_plays.append(self.plays_key(quiz["id"]))
+        self.by_plays.sort()
+
+    def _add(self, quiz):
+        quiz_id = quiz["id"]
+        if quiz_id in self.documents:
+            self.remove(quiz_id)
+        self.documents[quiz_id] = quiz
+        for field in self.FIELDS:
+            field_postings = self.postings[field]
+            for token in set(tokenize(quiz.get(field))):
+                ids = field_postings.get(token)
+                if ids is None:
+                    if not self._in_vocabulary(token):
+                        for gram in trigrams(token):
+                            self.trigrams.setdefault(gram, set()).add(token)
+                        self.by_length.setdefault(len(token), set()).add(token)
+                    field_postings[token] = {quiz_id}
+                else:
+                    ids.add(quiz_id)
+        slot = self.free_slots.pop() if self.free_slots else len(self.facet_codes["subject"])
+        self.slots[quiz_id] = slot
+        for facet in self.FACETS:
+            value = quiz.get(facet)
+            code = 0
+            if value is not None:
+                ids = self.facets[facet].get(value)
+                if ids is None:
+                    self.facets[facet][value] = {quiz_id}
+                else:
+                    ids.add(quiz_id)
+                code = self._value_codes[facet].get(value) or self._value_code(facet, value)
+            codes = self.facet_codes[facet]
+            if slot == len(codes):
+                codes.append(code)
+            else:
+                codes[slot] = code
+
+    def remove(self, quiz_id):
+        """Drop a quiz from every posting list it appears in"""
+        if quiz_id not in self.documents:
+            return False
+        key = self.plays_key(quiz_id)
+        position = bisect_left(self.by_plays, key)
+        if position < len(self.by_plays) and self.by_plays[position] == key:
+            del self.by_plays[position]
+        else:
+            # plays was changed on the stored dict after indexing
+            self.by_plays = [entry for entry in self.by_plays if entry[1] != quiz_id]
+        quiz = self.documents.pop(quiz_id)
+        for field in self.FIELDS:
+            field_postings = self.postings[field]
+            for token in set(tokenize(quiz.get(field))):
+                ids = field_postings.get(token)
+                if ids is None:
+                    continue
+                ids.discard(quiz_id)
+                if not ids:
+                    del field_postings[token]
+                    if not self._in_vocabulary(token):
+                        self._drop_trigrams(token)
+        for facet in self.FACETS:
+            ids = self.facets[facet].get(quiz.get(facet))
+            if ids is not None:
+                ids.discard(quiz_id)
+                if not ids:
+                    del self.facets[facet][quiz.get(facet)]
+        slot = self.slots.pop(quiz_id)
+        for codes in self.facet_codes.values():
+            codes[slot] = 0
+        self.free_slots.append(slot)
+        return True
+
+    def _value_code(self, facet, value):
+        """Assign the next code to a facet value seen for the first time"""
+        code = len(self.facet_values[facet])
+        self.facet_values[facet].append(value)
+        self._value_codes[facet][value] = code
+        return code
+
+    def _in_vocabulary(self, token):
+        return any(token in self.postings[field] for field in self.FIELDS)
+
+    def _drop_trigrams(self, token):
+        for gram in trigrams(token):
+            tokens = self.trigrams.get(gram)
+            if tokens is not None:
+                tokens.discard(token)
+                if not tokens:
+                    del self.trigrams[gram]
+        same_length = self.by_length[len(token)]
+        same_length.discard(token)
+        if not same_length:
+            del self.by_length[len(token)]
+
+    def get(self, quiz_id):
+        return self.documents.get(quiz_id)
+
+    def lookup(self, token):
+        """Ids of quizzes containing the token in any indexed field"""
+        found = [self.postings[field][token] for field in self.FIELDS if token in self.postings[field]]
+        if not found:
+            return set()
+        if len(found) == 1:
+            return found[0]
+        return found[0].union(*found[1:])
+
+    def match(self, query):
+        """Ids of quizzes containing every token of the query"""
+        tokens = set(tokenize(query))
+        if not tokens:
+            return set()
+        candidates = sorted((self.lookup(token) for token in tokens), key=len)
+        if len(candidates) == 1:
+            return set(candidates[0])
+        # Intersect starting from the shortest postings list
+        return candidates[0].intersection(*candidates[1:])
+
+    def fuzzy_terms(self, token, max_distance=None):
+        """Indexed tokens within max_distance edits of token, as {term: distance}"""
+        if max_distance is None:
+            max_distance = auto_distance(token)
+        if max_distance == 0:
+            return {token: 0} if self._in_vocabulary(token) else {}
+        grams = trigrams(token)
+        # q-gram lemma: each edit destroys at most 3 trigrams, so a match shares at
+        # least `needed` of them and must appear in one of the rarest len - needed + 1
+        needed = len(grams) - 3 * max_distance
+        if needed > 0:
+            postings = sorted((self.trigrams.get(gram, set()) for gram in grams), key=len)
+            candidates = set().union(*postings[:len(grams) - needed + 1])
+        else:
+            # Short token: a match may share no trigram at all, so scan every term of a close length
+            lengths = range(len(token) - max_distance, len(token) + max_distance + 1)
+            candidates = set().union(*(self.by_length.get(length, ()) for length in lengths))
+        terms = {}
+        for candidate in candidates:
+            if abs(len(candidate) - len(token)) > max_distance:
+                continue
+            if needed > 1 and len(grams & trigrams(candidate)) < needed:
+                continue
+            distance = bounded_edit_distance(token, candidate, max_distance)
+            if distance <= max_distance:
+                terms[candidate] = distance
+        return terms
+
+    def fuzzy_match(self, query):
+        """Quizzes matching every query token up to a few typos, as {quiz_id: total distance}"""
+        tokens = set(tokenize(query))
+        if not tokens:
+            return {}
+        per_token = []
+        for token in tokens:
+            # Cheapest tier first so each quiz keeps its smallest distance
+            tiers = sorted((distance, term) for term, distance in self.fuzzy_terms(token).items())
+            per_token.append(tiers)
+        ids_per_token = []
+        for tiers in per_token:
+            found = [self.lookup(term) for _, term in tiers]
+            ids_per_token.append(set().union(*found) if found else set())
+        ids_per_token.sort(key=len)
+        matches = ids_per_token[0].intersection(*ids_per_token[1:])
+        distances = dict.fromkeys(matches, 0)
+        for tiers in per_token:
+            remaining = set(matches)
+            for distance, term in tiers:
+                if not remaining:
+                    break
+                hit = remaining & self.lookup(term)
+                remaining -= hit
+                if distance:
+                    for quiz_id in hit:
+                        distances[quiz_id] += distance
+        return distances
+
+    def plays_key(self, quiz_id):
+        """Sort key for most-played-first order (ties broken by id)"""
+        return (-self.documents[quiz_id].get("plays", 0), quiz_id)
+
+    def top_by_plays(self, k=None, ids=None, descending=True, after=None):
+        """Up to k quiz ids ordered by plays, starting after the given plays_key"""
+        order = self.by_plays
+        if ids is None or len(ids) * SCAN_RATIO >= len(order):
+            # Dense candidates: walk the presorted order, skipping non-candidates
+            if descending:
+                start = 0 if after is None else bisect_right(order, after)
+                positions = range(start, len(order))
+            else:
+                end = len(order) if after is None else bisect_left(order, after)
+                positions = range(end - 1, -1, -1)
+            found = []
+            for position in positions:
+                quiz_id = order[position][1]
+                if ids is None or quiz_id in ids:
+                    found.append(quiz_id)
+                    if len(found) == k:
+                        break
+            return found
+
+        # Sparse candidates: partial heap selection over their keys only
+        keys = (self.plays_key(quiz_id) for quiz_id in ids)
+        if after is not None:
+            keys = (key for key in keys if (key > after if descending else key < after))
+        if k is None:
+            best = sorted(keys, reverse=not descending)
+        elif descending:
+            best = heapq.nsmallest(k, keys)
+        else:
+            best = heapq.nlargest(k, keys)
+        return [key[1] for key in best]
+
+    def facet_ids(self, facet, value):
+        """Ids of quizzes with the given facet value"""
+        return self.facets[facet].get(value, set())
+
+    def facet_range(self, facet, low, high):
+        """Ids of quizzes whose numeric facet value lies in [low, high]"""
+        # Values of other types ("K", None-like text) cannot be in a numeric range
+        found = [ids for value, ids in self.facets[facet].items()
+                 if isinstance(value, (int, float)) and low <= value <= high]
+        if not found:
+            return set()
+        return found[0].union(*found[1:])
+
+    def facet_counts(self, ids):
+        """Per-facet value counts within a set of quiz ids, read from the facet code columns"""
+        slots = self.slots
+        counts = {}
+        if len(ids) < BINCOUNT_MIN:
+            for facet in self.FACETS:
+                codes, values = self.facet_codes[facet], self.facet_values[facet]
+                facet_counts = {}
+                for quiz_id in ids:
+                    code = codes[slots[quiz_id]]
+                    if code:
+                        value = values[code]
+                        facet_counts[value] = facet_counts.get(value, 0) + 1
+                counts[facet] = facet_counts
+            return counts
+        positions = np.fromiter(map(slots.__getitem__, ids), dtype=np.intp, count=len(ids))
+        for facet in self.FACETS:
+            values = self.facet_values[facet]
+            codes = np.frombuffer(self.facet_codes[facet], dtype=np.intc)
+            per_code = np.bincount(codes[positions], minlength=len(values))
+            counts[facet] = {values[code]: int(per_code[code]) for code in np.flatnonzero(per_code[1:]) + 1}
+        return counts
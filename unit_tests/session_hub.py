@@ -0,0 +1,175 @@
+"""
+SessionHub - Asyncio host for many LiveSessionPage rooms with bounded per-subscriber fan-out
+"""
+import asyncio
+
+from join_codes import JoinCodeRegistry
+from live_session_page import LiveSessionPage
+
+OVERFLOW_POLICIES = ("drop_oldest", "block")
+LEADERBOARD_SIZE = 10
+# Queued by Subscription.close() to wake a consumer waiting on an empty queue
+_CLOSED = object()
+
+
+class Subscription:
+    """One subscriber's bounded event queue"""
+    def __init__(self, join_code, queue_size):
+        self.join_code = join_code
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self.closed = False
+        self._putters = set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        event = await self.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+    async def get(self):
+        """Next event, or None once the room has closed and the queue is drained"""
+        if self.closed and self.queue.empty():
+            return None
+        event = await self.queue.get()
+        return None if event is _CLOSED else event
+
+    async def put(self, event):
+        """Wait for queue space; False if the subscription closes while waiting"""
+        if self.closed:
+            return False
+        putter = asyncio.ensure_future(self.queue.put(event))
+        self._putters.add(putter)
+        try:
+            await putter
+        except asyncio.CancelledError:
+            # close() cancelled the put; anything else is the publisher being cancelled
+            if self.closed:
+                return False
+            raise
+        finally:
+            self._putters.discard(putter)
+        return True
+
+    def close(self):
+        """Stop accepting events; release blocked publishers and a consumer waiting for events"""
+        if self.closed:
+            return
+        self.closed = True
+        for putter in list(self._putters):
+            putter.cancel()
+        # A waiting consumer means the queue is empty; a full queue has no one to wake
+        if not self.queue.full():
+            self.queue.put_nowait(_CLOSED)
+
+
+class SessionHub:
+    """Rooms keyed by join code; events are copied into every subscriber queue of a room
+
+    overflow="drop_oldest" discards a slow subscriber's oldest event so the room never
+    waits on it; overflow="block" makes publishers await space (backpressure).
+    """
+    def __init__(self, queue_size=64, overflow="drop_oldest"):
+        if not isinstance(queue_size, int) or queue_size <= 0:
+            raise ValueError("Queue size must be a positive integer")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError("Overflow must be 'drop_oldest' or 'block'")
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.registry = JoinCodeRegistry()
+        self.rooms = {}
+        self.subscribers = {}
+
+    def __len__(self):
+        return len(self.rooms)
+
+    def create_room(self, quiz_id):
+        """Start a live session for the quiz and return its join code"""
+        session = LiveSessionPage(quiz_id, registry=self.registry)
+        join_code = session.start_live_session()["join_code"]
+        self.rooms[join_code] = session
+        self.subscribers[join_code] = set()
+        return join_code
+
+    def room(self, join_code):
+        session = self.rooms.get(join_code)
+        if session is None:
+            raise ValueError(f"Room {join_code} not found")
+        return session
+
+    def subscribe(self, join_code):
+        """Register a subscriber for the room's events"""
+        self.room(join_code)
+        subscription = Subscription(join_code, self.queue_size)
+        self.subscribers[join_code].add(subscription)
+        return subscription
+
+    def join(self, join_code, name):
+        """Add a participant to the room and subscribe them; returns (participant id, subscription)"""
+        participant_id = self.room(join_code).add_participant(name)
+        return participant_id, self.subscribe(join_code)
+
+    def unsubscribe(self, subscription):
+        self.subscribers.get(subscription.join_code, set()).discard(subscription)
+        subscription.close()
+
+    async def publish(self, join_code, event, overflow=None):
+        """Deliver an event to every subscriber of the room; returns the number delivered"""
+        self.room(join_code)
+        event.setdefault("sent_at", asyncio.get_running_loop().time())
+        overflow = overflow or self.overflow
+        delivered = 0
+        # Copy: with overflow="block" subscribers may leave while we wait
+        for subscription in list(self.subscribers[join_code]):
+            if subscription.closed:
+                continue
+            queue = subscription.queue
+            if queue.full():
+                if overflow == "block":
+                    # Returns False instead of hanging if the subscriber leaves meanwhile
+                    delivered += await subscription.put(event)
+                    continue
+                queue.get_nowait()
+                subscription.dropped += 1
+            queue.put_nowait(event)
+            delivered += 1
+        return delivered
+
+    async def broadcast(self, event):
+        """Publish the same event to every room; rooms are served concurrently"""
+        counts = await asyncio.gather(*(self.publish(join_code, dict(event)) for join_code in list(self.rooms)))
+        return sum(counts)
+
+    async def next_question(self, join_code):
+        """Advance the room (starting the quiz on the first call) and announce the question"""
+        session = self.room(join_code)
+        if session.current_question == 0:
+            result = session.start_quiz()
+        else:
+            result = session.next_question()
+        await self.publish(join_code, {"type": "question", "question": result["current_question"]})
+        return result["current_question"]
+
+    async def submit_answers(self, join_code, batch):
+        """Score a batch of answers and push the new top of the leaderboard"""
+        session = self.room(join_code)
+        result = session.submit_answers(batch)
+        top = [{"id": p.id, "name": p.name, "score": p.score}
+               for p in session.get_leaderboard(limit=LEADERBOARD_SIZE)]
+        await self.publish(join_code, {"type": "leaderboard", "question": result["question"], "top": top})
+        return result
+
+    async def close_room(self, join_code):
+        """End the session, send a final event and release the room's subscribers"""
+        session = self.room(join_code)
+        summary = session.end_session()
+        # Never wait on a full queue here: the final event replaces the oldest one instead
+        await self.publish(join_code, {"type": "ended", "total_participants": summary["total_participants"]},
+                           overflow="drop_oldest")
+        for subscription in self.subscribers.pop(join_code):
+            subscription.close()
+        del self.rooms[join_code]
+        return summary
@@ -0,0 +1,106 @@
+"""
+SessionLog - Append-only JSON-lines event log with compact snapshots for live sessions
+"""
+import json
+import os
+import time
+
+
+class SessionLog:
+    """Buffers events in memory and writes them in batches; a snapshot replaces the log so far
+
+    Files: `path` holds events written since the last snapshot, `path + ".snap"` the
+    latest snapshot. Every event carries a sequence number, so events already covered
+    by a snapshot are skipped if a crash left them in the log. Buffered events are
+    written once flush_every have queued up or flush_interval seconds have passed
+    since the last write, whichever comes first; callers may also flush explicitly.
+    """
+    def __init__(self, path, flush_every=64, snapshot_every=1000, flush_interval=1.0, clock=time.monotonic):
+        if not isinstance(flush_every, int) or flush_every <= 0:
+            raise ValueError("flush_every must be a positive integer")
+        if not isinstance(snapshot_every, int) or snapshot_every <= 0:
+            raise ValueError("snapshot_every must be a positive integer")
+        if flush_interval is not None and flush_interval < 0:
+            raise ValueError("flush_interval cannot be negative")
+        self.path = path
+        self.snapshot_path = path + ".snap"
+        self.flush_every = flush_every
+        self.snapshot_every = snapshot_every
+        self.flush_interval = flush_interval
+        self.clock = clock
+        self.seq = 0
+        self._buffer = []
+        self._since_snapshot = 0
+        self._last_flush = clock()
+
+    def append(self, event):
+        """Queue an event; returns True when a snapshot is due"""
+        self.seq += 1
+        event["seq"] = self.seq
+        self._buffer.append(json.dumps(event, separators=(",", ":")))
+        self._since_snapshot += 1
+        if len(self._buffer) >= self.flush_every or (
+                self.flush_interval is not None and self.clock() - self._last_flush >= self.flush_interval):
+            self.flush()
+        return self._since_snapshot >= self.snapshot_every
+
+    def flush(self):
+        """Write buffered events to the log in one call"""
+        self._last_flush = self.clock()
+        if not self._buffer:
+            return
+        with open(self.path, "a", encoding="utf-8") as log_file:
+            log_file.write("\n".join(self._buffer) + "\n")
+        self._buffer = []
+
+    def write_snapshot(self, state):
+        """Atomically store a full state snapshot and start an empty log after it"""
+        self.flush()
+        temporary = self.snapshot_path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as snapshot_file:
+            # dumps, not dump: json.dump streams through the pure-Python encoder
+            snapshot_file.write(json.dumps({"seq": self.seq, "state": state}, separators=(",", ":")))
+        os.replace(temporary, self.snapshot_path)
+        # Safe to drop: a crash before this line only leaves events the snapshot already covers
+        open(self.path, "w", encoding="utf-8").close()
+        self._since_snapshot = 0
+
+    def load(self):
+        """(snapshot state or None, events after it); later appends continue the sequence"""
+        state = None
+        covered = 0
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, encoding="utf-8") as snapshot_file:
+                snapshot = json.load(snapshot_file)
+            state = snapshot["state"]
+            covered = snapshot["seq"]
+        events = []
+        if os.path.exists(self.path):
+            # Byte offset just past the last complete event, and whether it ends the line
+            good_end = 0
+            ends_line = True
+            with open(self.path, "rb") as log_file:
+                for line in log_file:
+                    if line.strip():
+                        try:
+                            event = json.loads(line)
+                        except (json.JSONDecodeError, UnicodeDecodeError):
+                            # Torn final write from a crash
+                            break
+                        if event["seq"] > covered:
+                            events.append(event)
+                    good_end += len(line)
+                    ends_line = line.endswith(b"\n")
+                size = log_file.seek(0, os.SEEK_END)
+            # Cut the torn tail so later appends start on a line of their own
+            if good_end < size:
+                os.truncate(self.path, good_end)
+            if not ends_line:
+                with open(self.path, "ab") as log_file:
+                    log_file.write(b"\n")
+        self.seq = events[-1]["seq"] if events else covered
+        self._since_snapshot = len(events)
+        return state, events
+
+    def close(self):
+        self.flush()
@@ -17,13 +17,14 @@ from quiz_library_page import QuizLibraryPage
 @given('я відкрив сторінку пошуку Quizizz')
 def step_open_search_page(context):
     context.search_page = QuizSearchPage()
+    context.search_page.load_quizzes()
     context.current_page = 'search'
 
 
 @when('я введу "{query}" в поле пошуку')
 def step_enter_search_query(context, query):
     context.search_query = query
-    context.search_results = context.search_page.search(query)
+    context.search_results = context.search_page.search(query)["quizzes"]
 
 
 @when('натисну кнопку "Пошук"')
@@ -82,12 +83,13 @@ def step_results_count_greater(context, minimum):
 @given('я виконав пошук за "{query}"')
 def step_performed_search(context, query):
     context.search_page = QuizSearchPage()
-    context.search_results = context.search_page.search(query)
+    context.search_page.load_quizzes()
+    context.search_results = context.search_page.search(query)["quizzes"]
 
 
 @when('я виберу сортування "За популярністю"')
 def step_sort_by_popularity(context):
-    context.search_results = context.search_page.sort_by_plays('desc')
+    context.search_results = context.search_page.sort_by_plays('desc')["quizzes"]
 
 
 @then('результати відсортовані за кількістю проходжень')
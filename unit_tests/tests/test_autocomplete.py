@@ -0,0 +1,65 @@
+"""
+Tests for AutocompleteTrie - prefix completions
+"""
+import pytest
+from autocomplete import AutocompleteTrie
+
+
+# =============== POSITIVE TESTS ===============
+
+def test_suggest_ranked_by_weight():
+    """Test 429: Completions are ordered by weight"""
+    trie = AutocompleteTrie()
+    trie.add("Algebra", 10)
+    trie.add("Algebra II", 50)
+    trie.add("Alphabet", 30)
+    assert trie.suggest("al") == ["Algebra II", "Alphabet", "Algebra"]
+    assert trie.suggest("alg") == ["Algebra II", "Algebra"]
+
+def test_suggest_inside_edge():
+    """Test 430: Prefix ending inside a compressed edge still matches"""
+    trie = AutocompleteTrie()
+    trie.add("Geometry", 1)
+    assert trie.suggest("geo") == ["Geometry"]
+    assert trie.suggest("geometry") == ["Geometry"]
+    assert trie.suggest("geometryx") == []
+
+def test_repeated_term_accumulates_weight():
+    """Test 431: Adding a term again increases its rank"""
+    trie = AutocompleteTrie()
+    trie.add("Maps", 5)
+    trie.add("Math", 8)
+    trie.add("Maps", 5)
+    assert trie.suggest("ma") == ["Maps", "Math"]
+    assert len(trie) == 2
+
+def test_remove_restores_ranking():
+    """Test 432: Removing a term lets cut-off terms back into the top list"""
+    trie = AutocompleteTrie(top_k=1)
+    trie.add("Physics", 10)
+    trie.add("Phonics", 5)
+    assert trie.suggest("ph") == ["Physics"]
+    trie.remove("Physics", 10)
+    assert trie.suggest("ph") == ["Phonics"]
+    assert "Physics" not in trie
+
+def test_weight_decrease_reranks():
+    """Test 433: Negative weight update re-ranks completions"""
+    trie = AutocompleteTrie(top_k=1)
+    trie.add("Chemistry", 10)
+    trie.add("Chess", 6)
+    trie.add("Chemistry", -8)
+    assert trie.suggest("ch") == ["Chess"]
+
+
+# =============== NEGATIVE TESTS ===============
+
+def test_invalid_top_k():
+    """Test 434: Non-positive top_k raises ValueError"""
+    with pytest.raises(ValueError, match="top_k must be a positive integer"):
+        AutocompleteTrie(top_k=0)
+
+def test_remove_unknown_term():
+    """Test 435: Removing unknown term returns False"""
+    trie = AutocompleteTrie()
+    assert trie.remove("Nothing") is False
@@ -0,0 +1,77 @@
+"""
+Tests for BoundedCache - LRU/TTL results cache
+"""
+import pytest
+from bounded_cache import BoundedCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+# =============== POSITIVE TESTS ===============
+
+def test_put_and_get():
+    """Test 409: Stored value is returned and counted as a hit"""
+    cache = BoundedCache(max_size=2)
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    assert cache.stats()["hits"] == 1
+
+def test_evicts_least_recently_used():
+    """Test 410: Oldest untouched entry is evicted first"""
+    cache = BoundedCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+def test_entries_expire_after_ttl():
+    """Test 411: Entries older than ttl are dropped on access"""
+    clock = FakeClock()
+    cache = BoundedCache(max_size=2, ttl=10, clock=clock)
+    cache.put("a", 1)
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
+
+def test_miss_counter():
+    """Test 412: Missing key counts as a miss"""
+    cache = BoundedCache()
+    assert cache.get("missing") is None
+    assert cache.stats()["misses"] == 1
+
+def test_peek_leaves_stats_and_order():
+    """Test 596: peek returns live entries without touching counters or LRU order"""
+    clock = FakeClock()
+    cache = BoundedCache(max_size=2, ttl=10, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.peek("a") == 1
+    assert cache.peek("missing") is None
+    cache.put("c", 3)
+    assert cache.peek("a") is None
+    clock.now = 10
+    assert cache.peek("b") is None
+    assert cache.stats() == {"size": 2, "max_size": 2, "hits": 0, "misses": 0, "evictions": 1, "expirations": 0}
+
+
+# =============== NEGATIVE TESTS ===============
+
+def test_invalid_size():
+    """Test 413: Non-positive size raises ValueError"""
+    with pytest.raises(ValueError, match="Cache size must be a positive integer"):
+        BoundedCache(max_size=0)
+
+def test_invalid_ttl():
+    """Test 414: Non-positive ttl raises ValueError"""
+    with pytest.raises(ValueError, match="TTL must be positive"):
+        BoundedCache(ttl=0)
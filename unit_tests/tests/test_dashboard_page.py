@@ -266,3 +266,173 @@ def test_quiz_count_after_deletion():
     page.delete_quiz(1)
     page.delete_quiz(2)
     assert page.get_quiz_count() == 1
+
+
+# =============== INDEX TESTS ===============
+
+def test_delete_updates_buckets():
+    """Test 446: Deleted quiz disappears from subject and grade filters"""
+    page = DashboardPage()
+    page.load_quizzes()
+    page.delete_quiz(2)
+    assert page.filter_by_subject("Science") == []
+    assert page.filter_by_grade(8) == []
+    assert page.get_quiz_by_id(2) is None
+
+def test_buckets_group_shared_values():
+    """Test 447: Buckets hold every quiz with the same subject"""
+    page = DashboardPage()
+    page.load_quizzes([
+        {"id": 1, "name": "A", "subject": "Math", "grade": 5, "questions": 5, "date": "2024-01-01"},
+        {"id": 2, "name": "B", "subject": "Math", "grade": 6, "questions": 5, "date": "2024-01-02"},
+        {"id": 3, "name": "C", "subject": "English", "grade": 5, "questions": 5, "date": "2024-01-03"}
+    ])
+    assert [q["id"] for q in page.filter_by_subject("Math")] == [1, 2]
+    assert [q["id"] for q in page.filter_by_grade(5)] == [1, 3]
+
+def test_reload_replaces_indexes():
+    """Test 448: Loading a new list drops the previous quizzes"""
+    page = DashboardPage()
+    page.load_quizzes()
+    page.load_quizzes([{"id": 7, "name": "Solo", "subject": "Math", "grade": 5, "questions": 5, "date": "2024-01-01"}])
+    assert page.get_quiz_by_id(1) is None
+    assert [q["id"] for q in page.filter_by_subject("Math")] == [7]
+
+def test_quizzes_keep_load_order_after_delete():
+    """Test 449: Remaining quizzes keep their original order"""
+    page = DashboardPage()
+    page.load_quizzes()
+    page.delete_quiz(2)
+    assert [q["id"] for q in page.quizzes] == [1, 3]
+
+
+# =============== QUERY PIPELINE TESTS ===============
+
+QUERY_QUIZZES = [
+    {"id": 1, "name": "Fractions Quiz", "subject": "Math", "grade": 5, "questions": 10, "date": "2024-01-05"},
+    {"id": 2, "name": "Algebra Quiz", "subject": "Math", "grade": 7, "questions": 25, "date": "2024-01-01"},
+    {"id": 3, "name": "Decimals Quiz", "subject": "Math", "grade": 5, "questions": 15, "date": "2024-01-09"},
+    {"id": 4, "name": "Cells Quiz", "subject": "Science", "grade": 5, "questions": 30, "date": "2024-01-07"},
+    {"id": 5, "name": "Decimals Review", "subject": "Math", "grade": 5, "questions": 8, "date": "2024-01-03"}
+]
+
+def test_query_combines_filters():
+    """Test 450: Search, subject and grade combine in one query"""
+    page = DashboardPage()
+    page.load_quizzes(QUERY_QUIZZES)
+    result = list(page.query().search("quiz").subject("Math").grade(5))
+    assert [q["id"] for q in result] == [3, 1]
+
+def test_query_sorts_and_pages():
+    """Test 451: Sorted query returns only the requested page"""
+    page = DashboardPage()
+    page.load_quizzes(QUERY_QUIZZES)
+    query = page.query().subject("Math").sort("questions")
+    assert [q["id"] for q in query.page(1, size=2)] == [2, 3]
+    assert [q["id"] for q in query.page(2, size=2)] == [1, 5]
+    assert query.page(3, size=2) == []
+
+def test_query_unsorted_page():
+    """Test 452: Unsorted query pages follow load order"""
+    page = DashboardPage()
+    page.load_quizzes(QUERY_QUIZZES)
+    query = page.query().sort(None).grade(5)
+    assert [q["id"] for q in query.page(2, size=2)] == [4, 5]
+
+def test_query_seeded_from_active_filters():
+    """Test 453: query() starts from the stored search and filters"""
+    page = DashboardPage()
+    page.load_quizzes(QUERY_QUIZZES)
+    page.search_quiz("decimals")
+    page.filter_by_grade(5)
+    page.sort_quizzes("date")
+    assert [q["id"] for q in page.query()] == [3, 5]
+    assert page.query().count() == 2
+
+def test_query_is_lazy():
+    """Test 454: Building a query does not touch the quizzes"""
+    page = DashboardPage()
+    page.load_quizzes(QUERY_QUIZZES)
+    query = page.query().search("quiz")
+    page.delete_quiz(1)
+    assert [q["id"] for q in query.subject("Math").sort("name")] == [2, 3]
+
+def test_query_invalid_subject():
+    """Test 455: Query validates filters like the page does"""
+    page = DashboardPage()
+    page.load_quizzes()
+    with pytest.raises(ValueError, match="Invalid subject"):
+        page.query().subject("Art")
+
+def test_query_invalid_page():
+    """Test 456: Non-positive page number raises ValueError"""
+    page = DashboardPage()
+    page.load_quizzes()
+    with pytest.raises(ValueError, match="Page number must be a positive integer"):
+        page.query().page(0)
+
+
+# =============== SORTED VIEW TESTS ===============
+
+def test_sort_view_tracks_add_and_delete():
+    """Test 457: Sorted view reflects quizzes added and deleted later"""
+    page = DashboardPage()
+    page.load_quizzes()
+    view = page.sort_quizzes("date")
+    page.add_quiz({"id": 4, "name": "Geo Quiz", "subject": "Geography", "grade": 6, "questions": 12, "date": "2024-02-01"})
+    page.delete_quiz(2)
+    assert [q["id"] for q in view] == [4, 1, 3]
+    assert len(view) == 3
+
+def test_sort_view_indexing():
+    """Test 458: View supports negative indexes and slices"""
+    page = DashboardPage()
+    page.load_quizzes()
+    view = page.sort_quizzes("questions")
+    assert view[-1]["questions"] == 10
+    assert [q["id"] for q in view[0:2]] == [3, 2]
+
+def test_sort_view_ties_keep_load_order():
+    """Test 459: Equal keys keep load order like a stable sort"""
+    page = DashboardPage()
+    page.load_quizzes(QUERY_QUIZZES + [
+        {"id": 6, "name": "Same Day", "subject": "Math", "grade": 5, "questions": 10, "date": "2024-01-05"}
+    ])
+    expected = sorted(page.quizzes, key=lambda q: q["questions"], reverse=True)
+    assert list(page.sort_quizzes("questions")) == expected
+    expected = sorted(page.quizzes, key=lambda q: q["date"], reverse=True)
+    assert list(page.sort_quizzes("date")) == expected
+
+def test_query_walks_sorted_view():
+    """Test 460: Dense sorted query pages come from the presorted view"""
+    page = DashboardPage()
+    page.load_quizzes(QUERY_QUIZZES)
+    assert [q["id"] for q in page.query().sort("name").page(1, size=3)] == [2, 4, 3]
+
+def test_sort_views_with_odd_values():
+    """Test 612: A None name or text question count loads and sorts after the regular values"""
+    page = DashboardPage()
+    page.load_quizzes(QUERY_QUIZZES + [
+        {"id": 6, "name": None, "subject": "Math", "grade": 5, "questions": "10", "date": "2024-01-05"}
+    ])
+    assert [q["id"] for q in page.sort_quizzes("name")][-1] == 6
+    assert [q["id"] for q in page.sort_quizzes("questions")][-1] == 6
+    assert [q["id"] for q in page.query().subject("Math").sort("name")][-1] == 6
+    assert [q["id"] for q in page.query().search("quiz").sort("questions")] == \
+        [q["id"] for q in page.sort_quizzes("questions") if "quiz" in (q["name"] or "").lower()]
+    page.add_quiz({"id": 7, "name": "Zed", "subject": "Math", "grade": 5, "questions": None, "date": "2024-01-06"})
+    assert [q["id"] for q in page.sort_quizzes("questions")][-2:] == [6, 7]
+
+def test_add_duplicate_quiz():
+    """Test 461: Adding an existing ID raises ValueError"""
+    page = DashboardPage()
+    page.load_quizzes()
+    with pytest.raises(ValueError, match="Quiz with ID 1 already exists"):
+        page.add_quiz({"id": 1, "name": "Again", "subject": "Math", "grade": 5, "questions": 1, "date": "2024-01-01"})
+
+def test_sort_view_index_out_of_range():
+    """Test 462: Indexing past the end raises IndexError"""
+    page = DashboardPage()
+    page.load_quizzes()
+    with pytest.raises(IndexError):
+        page.sort_quizzes("name")[3]
@@ -0,0 +1,87 @@
+"""
+Tests for JoinCodeRegistry - Live session join codes
+"""
+import random
+
+import pytest
+from join_codes import ALPHABET, JoinCodeRegistry
+from live_session_page import LiveSessionPage
+
+
+class RepeatingRandom(random.Random):
+    """Replays the same first draw to force a collision"""
+    def __init__(self):
+        super().__init__(7)
+        self.draws = 0
+
+    def choices(self, population, k=1):
+        self.draws += 1
+        if self.draws <= 2:
+            return ["A"] * k
+        return super().choices(population, k=k)
+
+
+# =============== POSITIVE TESTS ===============
+
+def test_allocate_and_resolve():
+    """Test 535: Allocated code resolves to its session, case-insensitively"""
+    registry = JoinCodeRegistry()
+    session = object()
+    code = registry.allocate(session)
+    assert len(code) == 6
+    assert set(code) <= set(ALPHABET)
+    assert registry.resolve(code) is session
+    assert registry.resolve(f" {code.lower()} ") is session
+
+def test_collision_is_redrawn():
+    """Test 536: A drawn code already in use is never handed out twice"""
+    registry = JoinCodeRegistry(rng=RepeatingRandom())
+    first = registry.allocate("one")
+    second = registry.allocate("two")
+    assert first == "AAAAAA"
+    assert second != first
+    assert registry.resolve(first) == "one"
+
+def test_release_recycles_code():
+    """Test 537: Released codes stop resolving and can be allocated again"""
+    registry = JoinCodeRegistry(length=1)
+    codes = {registry.allocate(n) for n in range(len(ALPHABET))}
+    assert len(codes) == len(ALPHABET)
+    assert registry.release("A") is True
+    assert registry.resolve("A") is None
+    assert registry.allocate("again") == "A"
+
+def test_session_lifecycle_uses_registry():
+    """Test 538: Starting binds the join code to the session, ending releases it"""
+    registry = JoinCodeRegistry()
+    session = LiveSessionPage(quiz_id=1, registry=registry)
+    code = session.start_live_session()["join_code"]
+    assert LiveSessionPage.find_by_join_code(code, registry=registry) is session
+    session.end_session()
+    assert LiveSessionPage.find_by_join_code(code, registry=registry) is None
+    assert len(registry) == 0
+
+def test_restart_replaces_code():
+    """Test 539: Restarting a session frees its previous code"""
+    registry = JoinCodeRegistry()
+    session = LiveSessionPage(quiz_id=1, registry=registry)
+    first = session.start_live_session()["join_code"]
+    second = session.start_live_session()["join_code"]
+    assert len(registry) == 1
+    assert registry.resolve(second) is session
+    assert first == second or registry.resolve(first) is None
+
+
+# =============== NEGATIVE TESTS ===============
+
+def test_exhausted_registry():
+    """Test 540: Allocating past the code space raises ValueError"""
+    registry = JoinCodeRegistry(length=1)
+    for n in range(len(ALPHABET)):
+        registry.allocate(n)
+    with pytest.raises(ValueError, match="No join codes left"):
+        registry.allocate("extra")
+
+def test_release_unknown_code():
+    """Test 541: Releasing an inactive code returns False"""
+    assert JoinCodeRegistry().release("ZZZZZZ") is False
@@ -0,0 +1,101 @@
+"""
+Tests for Leaderboard - Incremental score ordering
+"""
+import pytest
+from leaderboard import Leaderboard
+
+
+# =============== POSITIVE TESTS ===============
+
+def test_top_orders_by_score():
+    """Test 508: Highest score first, ties in join order"""
+    board = Leaderboard()
+    board.add(1, 10)
+    board.add(2, 30)
+    board.add(3, 10)
+    assert board.top() == [2, 1, 3]
+    assert board.top(2) == [2, 1]
+
+def test_update_moves_member():
+    """Test 509: Score change repositions the member and keeps its tie order"""
+    board = Leaderboard()
+    for member_id in (1, 2, 3):
+        board.add(member_id)
+    board.update(3, 50)
+    board.update(1, 20)
+    assert board.top() == [3, 1, 2]
+    board.update(3, 0)
+    assert board.top() == [1, 2, 3]
+
+def test_rank_and_score():
+    """Test 510: Rank is the 1-based position"""
+    board = Leaderboard()
+    board.add(1, 5)
+    board.add(2, 15)
+    assert board.rank(2) == 1
+    assert board.rank(1) == 2
+    assert board.score(1) == 5
+
+def test_remove_member():
+    """Test 511: Removed members leave the order"""
+    board = Leaderboard()
+    board.add(1, 5)
+    board.add(2, 15)
+    board.remove(2)
+    assert board.top() == [1]
+    assert 2 not in board
+    assert len(board) == 1
+
+
+# =============== NEGATIVE TESTS ===============
+
+def test_duplicate_member_rejected():
+    """Test 512: Adding a member twice raises ValueError"""
+    board = Leaderboard()
+    board.add(1)
+    with pytest.raises(ValueError, match="already on the leaderboard"):
+        board.add(1)
+
+def test_unknown_member_rank():
+    """Test 513: Ranking an unknown member raises KeyError"""
+    with pytest.raises(KeyError):
+        Leaderboard().rank(7)
+
+
+# =============== BATCH UPDATE TESTS ===============
+
+def test_update_many_small_batch():
+    """Test 519: A small batch is applied with per-entry moves"""
+    board = Leaderboard()
+    for member_id in range(1, 21):
+        board.add(member_id)
+    board.update_many({7: 40, 3: 60})
+    assert board.top(3) == [3, 7, 1]
+
+def test_update_many_large_batch():
+    """Test 520: A large batch re-sorts once and keeps ties in join order"""
+    board = Leaderboard()
+    for member_id in range(1, 6):
+        board.add(member_id)
+    board.update_many({5: 10, 4: 10, 2: 30, 1: 5})
+    assert board.top() == [2, 4, 5, 1, 3]
+    assert board.rank(3) == 5
+
+def test_add_many_appends_in_order():
+    """Test 545: Bulk-added members follow existing ones with equal scores"""
+    board = Leaderboard()
+    board.add(1, 10)
+    board.add(2)
+    board.add_many([3, 4])
+    assert board.top() == [1, 2, 3, 4]
+    assert board.rank(4) == 4
+
+def test_add_many_rejects_duplicates():
+    """Test 546: Bulk add with repeated or existing members raises and adds nothing"""
+    board = Leaderboard()
+    board.add(1)
+    with pytest.raises(ValueError):
+        board.add_many([2, 2])
+    with pytest.raises(ValueError, match="already on the leaderboard"):
+        board.add_many([3, 1])
+    assert board.top() == [1]
@@ -2,7 +2,7 @@
 Tests for LiveSessionPage - Live quiz sessions
 """
 import pytest
-from live_session_page import LiveSessionPage
+from live_session_page import QUESTION_TIME_LIMIT, LiveSessionPage, Participant, answer_points, qr_cache
 
 
 # =============== POSITIVE TESTS ===============
@@ -264,3 +264,290 @@ def test_participant_count_after_removal():
     session.add_participant("Bob")
     session.remove_participant(pid1)
     assert session.get_participant_count() == 1
+
+
+# =============== LEADERBOARD TESTS ===============
+
+def test_leaderboard_follows_score_updates():
+    """Test 514: Leaderboard reflects score changes without re-sorting participants"""
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    alice = session.add_participant("Alice")
+    bob = session.add_participant("Bob")
+    carol = session.add_participant("Carol")
+    session.update_score(bob, 300)
+    assert session.update_score(carol, 500) == 1
+    assert [p["name"] for p in session.get_leaderboard()] == ["Carol", "Bob", "Alice"]
+    assert session.get_rank(alice) == 3
+
+def test_leaderboard_top_n():
+    """Test 515: Leaderboard can be limited to the top N"""
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    for name in ("Alice", "Bob", "Carol"):
+        session.add_participant(name)
+    session.update_score(3, 10)
+    top = session.get_leaderboard(limit=1)
+    assert [p["name"] for p in top] == ["Carol"]
+    assert top[0]["score"] == 10
+
+def test_leaderboard_drops_removed_participant():
+    """Test 516: Removed participants disappear from the leaderboard"""
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    alice = session.add_participant("Alice")
+    session.add_participant("Bob")
+    session.update_score(alice, 100)
+    session.remove_participant(alice)
+    assert [p["name"] for p in session.get_leaderboard()] == ["Bob"]
+
+def test_update_score_negative():
+    """Test 517: Negative scores raise ValueError"""
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    pid = session.add_participant("Alice")
+    with pytest.raises(ValueError, match="Score cannot be negative"):
+        session.update_score(pid, -1)
+
+def test_rank_unknown_participant():
+    """Test 518: Rank of unknown participant raises ValueError"""
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    with pytest.raises(ValueError, match="not found"):
+        session.get_rank(99)
+
+
+# =============== ANSWER SUBMISSION TESTS ===============
+
+def started_quiz(*names):
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    ids = [session.add_participant(name) for name in names]
+    session.start_quiz()
+    return session, ids
+
+def test_answer_points_by_speed():
+    """Test 521: Instant correct answers earn full points, at the time limit half"""
+    assert answer_points(True, 0) == 1000
+    assert answer_points(True, QUESTION_TIME_LIMIT) == 500
+    assert answer_points(False, 1.0) == 0
+
+def test_submit_answers_updates_scores():
+    """Test 522: A batch scores correct answers by speed and reorders the leaderboard"""
+    session, (alice, bob, carol) = started_quiz("Alice", "Bob", "Carol")
+    result = session.submit_answers([
+        {"participant_id": alice, "question": 1, "correct": True, "response_time": 10.0},
+        {"participant_id": bob, "question": 1, "correct": True, "response_time": 2.0},
+        {"participant_id": carol, "question": 1, "correct": False, "response_time": 1.0}
+    ])
+    assert result == {"question": 1, "accepted": 3, "rejected": 0}
+    assert [p["name"] for p in session.get_leaderboard()] == ["Bob", "Alice", "Carol"]
+    assert session.get_leaderboard()[0]["score"] == 950
+
+def test_submit_answers_rejects_invalid():
+    """Test 523: Wrong question, unknown player, repeats and bad times are rejected"""
+    session, (alice, bob) = started_quiz("Alice", "Bob")
+    result = session.submit_answers([
+        {"participant_id": alice, "question": 1, "correct": True, "response_time": 1.0},
+        {"participant_id": alice, "question": 1, "correct": True, "response_time": 0.5},
+        {"participant_id": bob, "question": 2, "correct": True, "response_time": 1.0},
+        {"participant_id": 99, "question": 1, "correct": True, "response_time": 1.0},
+        {"participant_id": bob, "question": 1, "correct": True, "response_time": -1},
+        {"participant_id": bob}
+    ])
+    assert result["accepted"] == 1
+    assert result["rejected"] == 5
+    assert session.get_leaderboard()[1]["score"] == 0
+
+def test_next_question_accepts_new_answers():
+    """Test 524: Each question accepts one answer per participant"""
+    session, (alice,) = started_quiz("Alice")
+    answer = {"participant_id": alice, "question": 1, "correct": True, "response_time": 0}
+    session.submit_answers([answer])
+    session.next_question()
+    session.submit_answers([dict(answer, question=2)])
+    assert session.get_leaderboard()[0]["score"] == 2000
+
+def test_submit_answers_before_quiz():
+    """Test 525: Submitting before the quiz starts raises ValueError"""
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    with pytest.raises(ValueError, match="Quiz has not been started yet"):
+        session.submit_answers([])
+
+def test_submit_answers_non_list():
+    """Test 526: Batch must be a list"""
+    session, _ = started_quiz("Alice")
+    with pytest.raises(TypeError, match="Answer batch must be a list"):
+        session.submit_answers({"participant_id": 1})
+
+
+# =============== PARTICIPANT INDEX TESTS ===============
+
+def test_ids_not_reused_after_removal():
+    """Test 542: New participants never get the id of a removed one"""
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    alice = session.add_participant("Alice")
+    bob = session.add_participant("Bob")
+    session.remove_participant(alice)
+    carol = session.add_participant("Carol")
+    assert carol not in (alice, bob)
+    assert [p["name"] for p in session.get_participants()] == ["Bob", "Carol"]
+
+def test_remove_keeps_join_order():
+    """Test 543: Removing from the middle keeps the others in join order"""
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    ids = [session.add_participant(name) for name in ("A", "B", "C", "D")]
+    session.remove_participant(ids[1])
+    session.remove_participant(ids[2])
+    assert [p["id"] for p in session.participants] == [ids[0], ids[3]]
+    assert session.get_leaderboard()[1]["name"] == "D"
+
+def test_removed_participant_cannot_be_removed_twice():
+    """Test 544: Second removal of the same id raises ValueError"""
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    pid = session.add_participant("Alice")
+    session.remove_participant(pid)
+    with pytest.raises(ValueError, match=f"Participant with ID {pid} not found"):
+        session.remove_participant(pid)
+
+
+# =============== BULK JOIN TESTS ===============
+
+def test_add_participants_bulk():
+    """Test 547: Bulk join allocates ids in order and reports each name"""
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    results = session.add_participants(["Alice", " Bob ", "Carol"])
+    assert [r["status"] for r in results] == ["joined"] * 3
+    assert [r["id"] for r in results] == [1, 2, 3]
+    assert results[1]["name"] == "Bob"
+    assert session.get_participant_count() == 3
+    assert len(session.get_leaderboard()) == 3
+
+def test_add_participants_dedupes_names():
+    """Test 548: Repeated names (case-insensitive) map to the existing participant"""
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    alice = session.add_participant("Alice")
+    results = session.add_participants(["alice", "Bob", "BOB"])
+    assert results[0] == {"name": "alice", "status": "duplicate", "id": alice}
+    assert results[2]["status"] == "duplicate"
+    assert results[2]["id"] == results[1]["id"]
+    assert session.get_participant_count() == 2
+
+def test_add_participants_reports_invalid():
+    """Test 549: Invalid names are reported without stopping the batch"""
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    results = session.add_participants([42, "  ", "Dana"])
+    assert [r["status"] for r in results] == ["invalid", "invalid", "joined"]
+    assert results[0]["error"] == "Participant name must be a string"
+    assert results[1]["error"] == "Participant name cannot be empty"
+
+def test_name_frees_after_leave():
+    """Test 550: A name can be used again once its participant leaves"""
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    alice = session.add_participant("Alice")
+    session.remove_participant(alice)
+    assert session.add_participants(["Alice"])[0]["status"] == "joined"
+
+def test_add_participants_before_start():
+    """Test 551: Bulk join before the session starts raises ValueError"""
+    session = LiveSessionPage(quiz_id=1)
+    with pytest.raises(ValueError, match="Session has not been started yet"):
+        session.add_participants(["Alice"])
+
+def test_add_participants_non_list():
+    """Test 552: Names must be given as a list"""
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    with pytest.raises(TypeError, match="Names must be a list"):
+        session.add_participants("Alice")
+
+# =============== QR CODE TESTS ===============
+
+def test_share_qr_renders_join_link():
+    """Test 570: QR share returns a PNG and the module matrix for the join link"""
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    result = session.share_join_code("qr")
+    assert result["url"].endswith(session.join_code)
+    assert result["png"].startswith(b"\x89PNG")
+    assert len(result["matrix"]) == 29
+
+def test_share_qr_is_cached():
+    """Test 571: Repeated QR requests reuse the rendered image"""
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    hits = qr_cache.hits
+    first = session.share_join_code("qr")
+    second = session.share_join_code("qr")
+    assert second["png"] is first["png"]
+    assert qr_cache.hits == hits + 1
+
+def test_end_session_evicts_qr():
+    """Test 572: Ending the session drops its cached QR code"""
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    session.share_join_code("qr")
+    join_code = session.join_code
+    session.end_session()
+    assert qr_cache.pop(join_code) is None
+
+# =============== PARTICIPANT RECORD TESTS ===============
+
+def test_participant_dict_style_access():
+    """Test 573: Participant records support record["field"] reads"""
+    participant = Participant(1, "Alice", 12.5, 300)
+    assert (participant["id"], participant["name"], participant["joined_at"], participant.score) == (1, "Alice", 12.5, 300)
+    assert not hasattr(participant, "__dict__")
+
+def test_participant_mapping_protocol():
+    """Test 591: Participant records convert to dicts and answer membership like them"""
+    participant = Participant(1, "Alice", 12.5, 300)
+    assert dict(participant) == {"id": 1, "name": "Alice", "joined_at": 12.5, "score": 300}
+    assert "id" in participant and "email" not in participant
+    assert participant.get("email") is None and len(participant) == 4
+
+def test_join_time_from_clock():
+    """Test 574: Join times come from the session clock; a bulk join shares one time"""
+    ticks = iter([5.0, 9.0])
+    session = LiveSessionPage(quiz_id=1, clock=lambda: next(ticks))
+    session.start_live_session()
+    session.add_participant("Alice")
+    session.add_participants(["Bob", "Carol"])
+    assert [p["joined_at"] for p in session.get_participants()] == [5.0, 9.0, 9.0]
+
+def test_names_interned_across_rooms():
+    """Test 575: The same name in different rooms is stored once"""
+    first, second = LiveSessionPage(quiz_id=1), LiveSessionPage(quiz_id=2)
+    first.start_live_session()
+    second.start_live_session()
+    first.add_participant("".join(["Ol", "ena"]))
+    second.add_participants(["".join(["Ole", "na"])])
+    assert first.get_participants()[0].name is second.get_participants()[0].name
+
+def test_participant_unknown_field():
+    """Test 576: Unknown record fields raise KeyError"""
+    participant = Participant(1, "Alice", 0.0)
+    with pytest.raises(KeyError):
+        participant["email"]
+
+def test_participant_score_read_only():
+    """Test 592: Scores cannot be written past the leaderboard"""
+    session = LiveSessionPage(quiz_id=1)
+    session.start_live_session()
+    session.add_participant("Alice")
+    participant = session.get_participants()[0]
+    with pytest.raises(TypeError):
+        participant["score"] = 500
+    with pytest.raises(AttributeError):
+        participant.score = 500
+    session.update_score(participant.id, 500)
+    assert participant.score == 500
+    assert session.get_leaderboard()[0]["score"] == 500
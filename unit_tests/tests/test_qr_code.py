@@ -0,0 +1,94 @@
+"""
+Tests for QrCode - Pure-Python QR code encoder and PNG output
+"""
+import struct
+import zlib
+
+import pytest
+from qr_code import MASKS, VERSIONS, format_bits, function_patterns, qr_matrix, qr_png, rs_remainder
+
+
+def decode(matrix):
+    """Read the byte-mode payload back: format bits, unmasking, zigzag order, RS check"""
+    size = len(matrix)
+    version = (size - 17) // 4
+    fmt = sum(matrix[row][8] << row for row in range(6)) | matrix[7][8] << 6 | matrix[8][8] << 7
+    fmt |= matrix[8][7] << 8 | sum(matrix[8][14 - index] << index for index in range(9, 15))
+    mask = [mask for mask in range(8) if format_bits(mask) == fmt][0]
+    _, reserved = function_patterns(version)
+    columns = [col for col in range(size - 1, 0, -2) if col > 6] + list(range(5, 0, -2))
+    bits = []
+    for pair, col in enumerate(columns):
+        rows = range(size - 1, -1, -1) if pair % 2 == 0 else range(size)
+        for row in rows:
+            for c in (col, col - 1):
+                if not reserved[row][c]:
+                    bits.append(matrix[row][c] ^ MASKS[mask](row, c))
+    data = [int("".join(map(str, bits[i:i + 8])), 2) for i in range(0, len(bits) - 7, 8)]
+    data_codewords, ec_codewords = VERSIONS[version]
+    assert rs_remainder(data[:data_codewords], ec_codewords) == data[data_codewords:data_codewords + ec_codewords]
+    assert data[0] >> 4 == 0b0100
+    length = (data[0] & 15) << 4 | data[1] >> 4
+    return bytes((data[i] & 15) << 4 | data[i + 1] >> 4 for i in range(1, length + 1)).decode("utf-8")
+
+
+def png_pixels(png):
+    """(width, height, rows of grayscale bytes) of an unfiltered 8-bit PNG"""
+    assert png[:8] == b"\x89PNG\r\n\x1a\n"
+    width, height = struct.unpack(">II", png[16:24])
+    start = png.index(b"IDAT") + 4
+    length = struct.unpack(">I", png[start - 8:start - 4])[0]
+    raw = zlib.decompress(png[start:start + length])
+    stride = width + 1
+    return width, height, [raw[offset + 1:offset + stride] for offset in range(0, len(raw), stride)]
+
+
+# =============== POSITIVE TESTS ===============
+
+def test_reed_solomon_reference():
+    """Test 563: Error correction codewords match the 1-M reference example"""
+    data = [32, 91, 11, 120, 209, 114, 220, 77, 67, 64, 236, 17, 236, 17, 236, 17]
+    assert rs_remainder(data, 10) == [196, 35, 39, 119, 235, 215, 231, 226, 93, 23]
+
+def test_format_bits_reference():
+    """Test 564: Format information matches the level M table"""
+    assert format_bits(0) == 0b101010000010010
+    assert format_bits(5) == 0b100000011001110
+
+@pytest.mark.parametrize("text,size", [("Q", 21), ("x" * 20, 25), ("https://quizizz.com/join?code=AB12CD", 29)])
+def test_matrix_round_trip(text, size):
+    """Test 565: The smallest fitting version is used and the payload decodes back"""
+    matrix = qr_matrix(text)
+    assert len(matrix) == size
+    assert decode(matrix) == text
+
+def test_finder_and_timing_patterns():
+    """Test 566: Finder corners and timing rows are in place"""
+    matrix = qr_matrix("ABC123")
+    size = len(matrix)
+    for top, left in ((0, 0), (0, size - 7), (size - 7, 0)):
+        assert list(matrix[top][left:left + 7]) == [1] * 7
+        assert list(matrix[top + 2][left:left + 7]) == [1, 0, 1, 1, 1, 0, 1]
+    assert list(matrix[6][8:size - 8]) == [1 - index % 2 for index in range(size - 16)]
+
+def test_png_matches_matrix():
+    """Test 567: PNG has one scaled pixel block per module inside a light quiet zone"""
+    matrix = qr_matrix("ABC123")
+    width, height, rows = png_pixels(qr_png(matrix, scale=2, border=4))
+    assert width == height == (len(matrix) + 8) * 2
+    assert set(rows[0]) == {255}
+    for row in range(len(matrix)):
+        pixels = rows[(row + 4) * 2]
+        assert [pixels[(col + 4) * 2] == 0 for col in range(len(matrix))] == [bool(m) for m in matrix[row]]
+
+# =============== NEGATIVE TESTS ===============
+
+def test_data_too_long():
+    """Test 568: Payloads beyond version 3 raise ValueError"""
+    with pytest.raises(ValueError, match="Data too long for a QR code"):
+        qr_matrix("x" * 43)
+
+def test_invalid_scale():
+    """Test 569: PNG scale must be a positive integer"""
+    with pytest.raises(ValueError, match="Scale must be a positive integer"):
+        qr_png(qr_matrix("A"), scale=0)
@@ -1,5 +1,5 @@
 import pytest
-from quiz_search_page import QuizSearchPage
+from quiz_search_page import PAGE_SIZE, QuizSearchPage
 
 
 # =============== POSITIVE TESTS ===============
@@ -27,14 +27,16 @@ def test_search_caches_results():
 def test_sort_by_plays_ascending():
     """Test 60: Sort quizzes by plays ascending"""
     page = QuizSearchPage()
+    page.load_quizzes()
     result = page.sort_by_plays("asc")
-    assert result == "asc"
+    assert [q["plays"] for q in result["quizzes"]] == [850, 1250, 2100]
 
 def test_sort_by_plays_descending():
     """Test 61: Sort quizzes by plays descending"""
     page = QuizSearchPage()
+    page.load_quizzes()
     result = page.sort_by_plays("desc")
-    assert result == "desc"
+    assert [q["plays"] for q in result["quizzes"]] == [2100, 1250, 850]
 
 def test_apply_filter_subject():
     """Test 62: Apply subject filter"""
@@ -184,6 +186,19 @@ def test_apply_filter_none_value():
     with pytest.raises(ValueError, match="Filter value cannot be None"):
         page.apply_filter("subject", None)
 
+def test_apply_filter_grade_range_needs_bounds():
+    """Test 599: A grade range without min or max raises ValueError"""
+    page = QuizSearchPage()
+    with pytest.raises(ValueError, match="Grade range must have min and max"):
+        page.apply_filter("grade", {"min": 3})
+    assert page.filters == {}
+
+def test_apply_filter_unhashable_facet_value():
+    """Test 600: Subject, grade and language values must be hashable"""
+    page = QuizSearchPage()
+    with pytest.raises(TypeError, match="Filter value for subject must be hashable"):
+        page.apply_filter("subject", ["Math"])
+
 def test_validate_grade_range_too_low():
     """Test 84: Validate grade below 1 raises error"""
     page = QuizSearchPage()
@@ -221,3 +236,406 @@ def test_get_last_query_before_search():
     """Test 89: Get last query before any search returns None"""
     page = QuizSearchPage()
     assert page.get_last_query() is None
+
+
+# =============== SEARCH INDEX TESTS ===============
+
+def test_load_default_catalog():
+    """Test 394: Load default mock catalog into the index"""
+    page = QuizSearchPage()
+    assert page.load_quizzes() == 3
+
+def test_search_matches_title_word():
+    """Test 395: Search finds quizzes by title word"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    result = page.search("biology")
+    assert result["count"] == 1
+    assert result["quizzes"][0]["title"] == "Biology Basics"
+
+def test_search_requires_all_words():
+    """Test 396: Every query word must match"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    assert page.search("world history")["count"] == 1
+    assert page.search("world biology")["count"] == 0
+
+def test_search_matches_subject_and_language():
+    """Test 397: Search matches subject and language fields"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    assert page.search("science")["quizzes"][0]["id"] == 3
+    assert page.search("EN")["count"] == 3
+
+def test_search_limit():
+    """Test 398: Limit caps returned quizzes but not the count"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    result = page.search("en", limit=2)
+    assert [q["id"] for q in result["quizzes"]] == [1, 2]
+    assert result["count"] == 3
+
+def test_add_quiz_is_searchable():
+    """Test 399: Added quiz is immediately searchable"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    page.add_quiz({"id": 4, "title": "Algebra Drill", "subject": "Math", "grade": 6, "plays": 10, "language": "en"})
+    assert page.search("math")["count"] == 2
+
+def test_remove_quiz_drops_postings():
+    """Test 400: Removed quiz no longer appears in results"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    page.remove_quiz(1)
+    assert page.search("math")["count"] == 0
+    assert "fundamentals" not in page.index.postings["title"]
+
+def test_load_quizzes_non_list():
+    """Test 401: Loading non-list catalog raises TypeError"""
+    page = QuizSearchPage()
+    with pytest.raises(TypeError, match="Quiz list must be a list"):
+        page.load_quizzes("not a list")
+
+def test_remove_nonexistent_quiz():
+    """Test 402: Removing unknown quiz raises ValueError"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    with pytest.raises(ValueError, match="Quiz with ID 999 not found"):
+        page.remove_quiz(999)
+
+def test_search_applies_subject_filter():
+    """Test 403: Subject filter restricts search results"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    page.apply_filter("subject", "History")
+    result = page.search("en")
+    assert [q["id"] for q in result["quizzes"]] == [2]
+
+def test_search_applies_grade_range_and_language():
+    """Test 404: Grade range and language filters intersect"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    page.apply_filter("grade", page.validate_grade_range(6, 8))
+    page.apply_filter("language", "en")
+    result = page.search("en")
+    assert [q["id"] for q in result["quizzes"]] == [2, 3]
+
+def test_search_returns_facet_counts():
+    """Test 405: Search response includes facet counts"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    facets = page.search("en")["facets"]
+    assert facets["subject"] == {"Math": 1, "History": 1, "Science": 1}
+    assert facets["language"] == {"en": 3}
+
+def test_facet_counts_follow_filters():
+    """Test 406: Facet counts only cover filtered results"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    page.apply_filter("grade", 5)
+    facets = page.search("en")["facets"]
+    assert facets["grade"] == {5: 1}
+
+def test_filter_with_no_matches():
+    """Test 407: Filter value with no quizzes gives empty results"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    page.apply_filter("language", "fr")
+    result = page.search("en")
+    assert result["count"] == 0
+    assert result["quizzes"] == []
+
+def test_removed_quiz_leaves_facets():
+    """Test 408: Removing a quiz drops it from facet sets"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    page.remove_quiz(1)
+    assert "Math" not in page.index.facets["subject"]
+
+def test_cache_key_normalizes_query():
+    """Test 415: Cache lookup ignores case and extra whitespace"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    result = page.search("World History")
+    assert page.get_cached_results("  world   HISTORY ") is result
+
+def test_cache_respects_filters():
+    """Test 416: Changing filters does not return stale cached results"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    page.search("en")
+    page.apply_filter("subject", "Math")
+    assert page.get_cached_results("en") is None
+    assert page.search("en")["count"] == 1
+
+def test_cache_ignores_non_facet_filters():
+    """Test 597: Filters outside subject/grade/language, even unhashable ones, keep search working"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    page.apply_filter("tags", ["a"])
+    result = page.search("en")
+    assert result["count"] == 3
+    page.apply_filter("tags", {"b": 1})
+    assert page.search("en") is result
+
+def test_get_cached_results_is_read_only():
+    """Test 598: Checking the cache changes neither its counters nor its eviction order"""
+    page = QuizSearchPage(cache_size=2)
+    page.load_quizzes()
+    page.search("math")
+    page.search("history")
+    before = page.get_cache_stats()
+    assert page.get_cached_results("math") is not None
+    assert page.get_cached_results("biology") is None
+    assert page.get_cache_stats() == before
+    page.search("biology")
+    assert page.get_cached_results("math") is None
+
+def test_cache_respects_sort_order():
+    """Test 417: Sort order is part of the cache key"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    page.search("en")
+    page.sort_by_plays("desc")
+    assert page.get_cached_results("en") is None
+
+def test_cache_is_bounded():
+    """Test 418: Cache evicts beyond its size limit"""
+    page = QuizSearchPage(cache_size=2)
+    page.load_quizzes()
+    for query in ("math", "history", "biology"):
+        page.search(query)
+    stats = page.get_cache_stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+
+def test_repeated_search_hits_cache():
+    """Test 419: Repeated search is served from the cache"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    page.search("math")
+    page.search("MATH")
+    assert page.get_cache_stats()["hits"] == 1
+
+def test_catalog_change_invalidates_cache():
+    """Test 420: Adding a quiz clears cached results"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    page.search("math")
+    page.add_quiz({"id": 4, "title": "Math Drill", "subject": "Math", "grade": 6, "plays": 10, "language": "en"})
+    assert page.get_cached_results("math") is None
+    assert page.search("math")["count"] == 2
+
+def test_sort_by_plays_uses_last_query():
+    """Test 421: Plays ranking covers the last search's matches"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    page.search("history")
+    result = page.sort_by_plays("desc")
+    assert [q["id"] for q in result["quizzes"]] == [2]
+    assert result["count"] == 1
+
+def test_sort_by_plays_pagination():
+    """Test 422: Cursor continues where the previous page stopped"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    first = page.sort_by_plays("desc", k=2)
+    assert [q["id"] for q in first["quizzes"]] == [3, 1]
+    second = page.sort_by_plays("desc", k=2, cursor=first["next_cursor"])
+    assert [q["id"] for q in second["quizzes"]] == [2]
+    assert second["next_cursor"] is None
+
+def test_sort_by_plays_ascending_pagination():
+    """Test 423: Ascending pages walk from least played"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    first = page.sort_by_plays("asc", k=1)
+    second = page.sort_by_plays("asc", k=1, cursor=first["next_cursor"])
+    assert first["quizzes"][0]["id"] == 2
+    assert second["quizzes"][0]["id"] == 1
+
+def test_sort_by_plays_with_filters():
+    """Test 424: Plays ranking honours active filters"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    page.apply_filter("grade", page.validate_grade_range(5, 7))
+    result = page.sort_by_plays("desc")
+    assert [q["id"] for q in result["quizzes"]] == [3, 1]
+
+def test_sparse_candidates_use_heap():
+    """Test 425: Heap and presorted walk give the same ranking"""
+    page = QuizSearchPage()
+    page.load_quizzes([
+        {"id": i, "title": f"Quiz {i}", "subject": "Math", "grade": 5, "plays": i % 7, "language": "en"}
+        for i in range(1, 101)
+    ])
+    candidates = {3, 10, 17, 50}
+    heap = page.index.top_by_plays(3, candidates)
+    walk = [i for i in page.index.top_by_plays(None) if i in candidates][:3]
+    assert heap == walk
+
+def test_search_sorted_by_plays():
+    """Test 426: Search results follow the chosen plays order"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    page.sort_by_plays("desc")
+    result = page.search("en")
+    assert [q["id"] for q in result["quizzes"]] == [3, 1, 2]
+
+def test_sort_by_plays_invalid_cursor():
+    """Test 427: Malformed cursor raises ValueError"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        page.sort_by_plays("desc", cursor="abc")
+
+def test_sort_by_plays_invalid_page_size():
+    """Test 428: Non-positive page size raises ValueError"""
+    page = QuizSearchPage()
+    with pytest.raises(ValueError, match="Page size must be a positive integer"):
+        page.sort_by_plays("desc", k=0)
+
+def test_suggest_titles_and_topics():
+    """Test 436: Suggestions cover quiz titles and category topics"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    page.load_topics()
+    assert page.suggest("Wor") == ["World History", "World Geography", "World History Quiz"]
+
+def test_suggest_updates_on_add():
+    """Test 437: Added quiz title is suggested immediately"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    page.add_quiz({"id": 4, "title": "Biology Lab", "subject": "Science", "grade": 9, "plays": 5000, "language": "en"})
+    assert page.suggest("bio") == ["Biology Lab", "Biology Basics"]
+
+def test_suggest_drops_removed_quiz():
+    """Test 438: Removed quiz title is no longer suggested"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    page.remove_quiz(3)
+    assert page.suggest("bio") == []
+
+def test_suggest_non_string():
+    """Test 439: Non-string prefix raises TypeError"""
+    page = QuizSearchPage()
+    with pytest.raises(TypeError, match="Prefix must be a string"):
+        page.suggest(5)
+
+def test_fuzzy_search_tolerates_typos():
+    """Test 440: Fuzzy search finds misspelled words"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    assert page.search("Biolgy")["count"] == 0
+    result = page.search("Biolgy", fuzzy=True)
+    assert [q["id"] for q in result["quizzes"]] == [3]
+
+def test_fuzzy_search_two_edits():
+    """Test 441: Longer words allow two edits"""
+    page = QuizSearchPage()
+    page.load_quizzes([{"id": 1, "title": "Geography Maps", "subject": "Geography", "grade": 6, "plays": 5, "language": "en"}])
+    assert page.search("Geografy", fuzzy=True)["count"] == 1
+
+def test_fuzzy_search_ranks_exact_first():
+    """Test 442: Exact matches rank ahead of typo matches"""
+    page = QuizSearchPage()
+    page.load_quizzes([
+        {"id": 1, "title": "Maps", "subject": "Geography", "grade": 6, "plays": 5, "language": "en"},
+        {"id": 2, "title": "Math", "subject": "Math", "grade": 6, "plays": 5, "language": "en"}
+    ])
+    result = page.search("math", fuzzy=True)
+    assert [q["id"] for q in result["quizzes"]] == [2]
+    result = page.search("mats", fuzzy=True)
+    assert [q["id"] for q in result["quizzes"]] == [1, 2]
+
+def test_fuzzy_search_short_words_exact():
+    """Test 443: Words of two letters must match exactly"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    assert page.search("es", fuzzy=True)["count"] == 0
+
+def test_fuzzy_terms_follow_removal():
+    """Test 444: Removed vocabulary leaves the trigram index"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    page.remove_quiz(3)
+    assert page.index.fuzzy_terms("biolgy") == {}
+    assert "bas" not in page.index.trigrams
+
+def test_bounded_edit_distance():
+    """Test 445: Edit distance is exact up to the limit and capped beyond it"""
+    from search_index import bounded_edit_distance
+    assert bounded_edit_distance("geografy", "geography", 2) == 2
+    assert bounded_edit_distance("kitten", "sitting", 5) == 3
+    assert bounded_edit_distance("kitten", "sitting", 2) == 3
+    assert bounded_edit_distance("", "abc", 5) == 3
+
+def test_fuzzy_terms_without_shared_trigrams():
+    """Test 590: Short words and spread-out typos match even with no trigram in common"""
+    from search_index import SearchIndex
+    index = SearchIndex()
+    index.add({"id": 1, "title": "cut abcdef", "subject": "Art", "grade": 5, "plays": 1, "language": "en"})
+    assert index.fuzzy_terms("cat") == {"cut": 1}
+    assert index.fuzzy_terms("axcdxf") == {"abcdef": 2}
+    index.remove(1)
+    assert index.fuzzy_terms("cat") == {}
+    assert index.by_length == {}
+
+def test_facet_counts_match_postings():
+    """Test 593: Facet counts agree with the facet sets for small and large matches after edits"""
+    page = QuizSearchPage()
+    page.load_quizzes([{"id": i, "title": f"Quiz {i % 7}", "subject": ["Math", "Art", None][i % 3],
+                        "grade": i % 12 + 1, "plays": i, "language": "en"} for i in range(1, 1201)])
+    for quiz_id in range(1, 1201, 5):
+        page.remove_quiz(quiz_id)
+    page.add_quiz({"id": 5000, "title": "Quiz 3", "subject": "Music", "grade": 4, "plays": 1})
+    for query in ("quiz", "3"):
+        matches = page.index.match(query)
+        expected = {facet: {value: len(matches & ids) for value, ids in page.index.facets[facet].items()
+                            if matches & ids} for facet in page.index.FACETS}
+        assert page.search(query)["facets"] == expected
+
+def test_search_default_page():
+    """Test 594: Without a limit search returns one page; limit=None returns every match"""
+    page = QuizSearchPage()
+    page.load_quizzes([{"id": i, "title": "Quiz", "subject": "Math", "grade": 5, "plays": i, "language": "en"}
+                       for i in range(1, 51)])
+    result = page.search("quiz")
+    assert len(result["quizzes"]) == PAGE_SIZE and result["count"] == 50
+    assert len(page.search("quiz", limit=None)["quizzes"]) == 50
+
+def test_failed_load_keeps_catalog():
+    """Test 606: A load with a bad quiz keeps the old index, suggestions and cached results"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    cached = page.search("math")
+    with pytest.raises(TypeError, match="Quiz ID must be an integer"):
+        page.load_quizzes([{"id": 9, "title": "Algebra Drill", "plays": 5}, {"title": "No id"}])
+    with pytest.raises(TypeError):
+        page.load_quizzes([{"id": 9, "title": "Algebra Drill", "subject": ["Math"], "plays": 5}])
+    assert page.search("math") is cached
+    assert page.search("algebra")["count"] == 0
+    assert page.suggest("alg") == []
+    assert page.suggest("math") == ["Math Fundamentals"]
+
+def test_reload_keeps_topics():
+    """Test 607: Reloading the catalog replaces titles but keeps topic suggestions"""
+    page = QuizSearchPage()
+    page.load_quizzes()
+    page.load_topics()
+    page.load_quizzes([{"id": 9, "title": "Algebra Drill", "subject": "Math", "plays": 5}])
+    assert "Math Fundamentals" not in page.suggest("math", limit=10)
+    assert "Algebra Drill" in page.suggest("alg", limit=10)
+    assert page.suggest("Wor") == ["World History", "World Geography"]
+
+def test_grade_range_skips_non_numeric_grades():
+    """Test 613: A text grade in the catalog does not break grade-range filters"""
+    page = QuizSearchPage()
+    page.load_quizzes([
+        {"id": 1, "title": "Counting", "subject": "Math", "grade": "K", "plays": 5, "language": "en"},
+        {"id": 2, "title": "Counting More", "subject": "Math", "grade": 2, "plays": 3, "language": "en"}
+    ])
+    page.apply_filter("grade", page.validate_grade_range(1, 3))
+    assert [q["id"] for q in page.search("counting")["quizzes"]] == [2]
+    page.apply_filter("grade", "K")
+    assert [q["id"] for q in page.search("counting")["quizzes"]] == [1]
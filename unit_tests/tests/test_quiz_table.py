@@ -0,0 +1,171 @@
+"""
+Tests for QuizTable - Columnar quiz storage
+"""
+import pytest
+from quiz_table import QuizTable
+from dashboard_page import DashboardPage
+from quiz_library_page import QuizLibraryPage
+
+
+QUIZZES = [
+    {"id": 1, "name": "Math Quiz", "subject": "Math", "grade": 5, "questions": 10, "date": "2024-01-15"},
+    {"id": 2, "name": "Science Test", "subject": "Science", "grade": 8, "questions": 15, "date": "2024-01-20"},
+    {"id": 3, "name": "Algebra", "subject": "Math", "grade": 7, "questions": 12, "date": "2024-01-10"},
+]
+
+
+# =============== POSITIVE TESTS ===============
+
+def test_row_reads_back_columns():
+    """Test 463: Row view returns the stored fields like a dict"""
+    table = QuizTable()
+    for quiz in QUIZZES:
+        table.append(quiz)
+    row = table.row(2)
+    assert row["name"] == "Science Test"
+    assert row["subject"] == "Science"
+    assert row["date"] == "2024-01-20"
+    assert dict(row)["questions"] == 15
+
+def test_subjects_stored_as_codes():
+    """Test 464: Repeated subjects share one integer code"""
+    table = QuizTable()
+    for quiz in QUIZZES:
+        table.append(quiz)
+    assert table.subjects == ["Math", "Science"]
+    assert list(table.subject_codes) == [0, 1, 0]
+
+def test_remove_keeps_other_rows():
+    """Test 465: Swap-remove leaves remaining rows intact and in insertion order"""
+    table = QuizTable()
+    for quiz in QUIZZES:
+        table.append(quiz)
+    table.remove(1)
+    assert 1 not in table
+    assert list(table) == [2, 3]
+    assert table.row(3)["name"] == "Algebra"
+    assert table.row(3)["grade"] == 7
+
+def test_set_value_updates_column():
+    """Test 466: Numeric columns can be updated in place"""
+    table = QuizTable()
+    table.append({"id": 9, "plays": 3})
+    table.set_value(9, "plays", 40)
+    assert table.value(9, "plays") == 40
+
+def test_dashboard_backed_by_table():
+    """Test 467: Dashboard stores quizzes in its table and sorts from columns"""
+    page = DashboardPage()
+    page.load_quizzes(list(QUIZZES))
+    page.delete_quiz(1)
+    page.add_quiz({"id": 4, "name": "Geometry", "subject": "Math", "grade": 6, "questions": 30, "date": "2024-02-01"})
+    assert len(page.table) == 3
+    assert [q["id"] for q in page.sort_quizzes("date")] == [4, 2, 3]
+    assert [q["id"] for q in page.filter_by_subject("Math")] == [3, 4]
+
+def test_library_keeps_one_row_per_quiz():
+    """Test 468: Saving a quiz twice keeps one row with summed plays"""
+    library = QuizLibraryPage()
+    library.add_quiz(5, plays=2)
+    library.add_quiz(5, plays=3)
+    assert len(library.table) == 1
+    assert library.get_quizzes() == [5, 5]
+    assert library.get_plays(5) == 5
+
+
+def test_row_round_trips_loaded_dict():
+    """Test 578: Extra keys survive and no unloaded fields are added"""
+    quiz = dict(QUIZZES[0], description="Fractions", author="Ms. Koval")
+    page = DashboardPage()
+    page.load_quizzes([quiz, {"id": 9, "name": "Bare"}])
+    assert page.get_quiz_by_id(1) == quiz
+    assert dict(page.get_quiz_by_id(9)) == {"id": 9, "name": "Bare"}
+
+def test_non_iso_dates_kept_as_text():
+    """Test 579: Dates that are not ISO are stored as given and sorted as strings"""
+    page = DashboardPage()
+    page.load_quizzes([dict(QUIZZES[0]), {"id": 5, "name": "Old", "date": "15/01/2023"}])
+    assert page.get_quiz_by_id(5)["date"] == "15/01/2023"
+    assert [q["id"] for q in page.sort_quizzes("date")] == [1, 5]
+
+def test_opened_quiz_is_editable():
+    """Test 580: Edits through a row view update the table and the sorted views"""
+    page = DashboardPage()
+    page.load_quizzes([dict(quiz) for quiz in QUIZZES])
+    page.open_quiz(1)["quiz"]["questions"] = 40
+    assert page.get_quiz_by_id(1)["questions"] == 40
+    assert [q["id"] for q in page.sort_quizzes("questions")] == [1, 2, 3]
+    page.delete_quiz(1)
+    assert [q["id"] for q in page.sort_quizzes("questions")] == [2, 3]
+
+def test_load_keeps_duplicate_ids():
+    """Test 581: Repeated ids load as separate rows; lookup returns the first"""
+    page = DashboardPage()
+    page.load_quizzes([dict(QUIZZES[0]), dict(QUIZZES[1]), dict(QUIZZES[0], name="Copy")])
+    assert page.get_quiz_count() == 3
+    assert page.get_quiz_by_id(1)["name"] == "Math Quiz"
+    page.delete_quiz(1)
+    assert [q["id"] for q in page.sort_quizzes("date")] == [2]
+
+def test_library_returns_lists_and_float_plays():
+    """Test 582: Library calls return plain lists and accept fractional plays"""
+    library = QuizLibraryPage()
+    assert library.add_quiz(1) == [1]
+    library.add_quiz(2, plays=1.5)
+    assert library.get_plays(2) == 1.5
+    assert library.clear_library() == []
+
+def test_ids_outside_int64():
+    """Test 601: Fractional and very large ids are stored like any other"""
+    library = QuizLibraryPage()
+    library.add_quiz(2.5, plays=3)
+    assert library.has_quiz(2.5) and library.get_plays(2.5) == 3
+    page = DashboardPage()
+    page.load_quizzes([dict(quiz) for quiz in QUIZZES])
+    page.add_quiz(dict(QUIZZES[0], id=2 ** 70))
+    assert page.get_quiz_count() == len(page.quizzes) == 4
+    assert page.get_quiz_by_id(2 ** 70)["name"] == "Math Quiz"
+
+# =============== NEGATIVE TESTS ===============
+
+def test_duplicate_id_rejected():
+    """Test 469: Appending an existing id raises"""
+    table = QuizTable()
+    table.append(QUIZZES[0])
+    with pytest.raises(ValueError, match="already exists"):
+        table.append(QUIZZES[0])
+
+def test_set_value_rejects_text_column():
+    """Test 470: Only numeric columns can be updated in place"""
+    table = QuizTable()
+    table.append(QUIZZES[0])
+    with pytest.raises(KeyError):
+        table.set_value(1, "name", "Renamed")
+
+def test_missing_row_is_none():
+    """Test 471: Unknown id has no row view"""
+    assert QuizTable().row(42) is None
+
+def test_failed_load_leaves_dashboard_unchanged():
+    """Test 583: A load that fails part-way keeps the previous quizzes"""
+    page = DashboardPage()
+    page.load_quizzes([dict(quiz) for quiz in QUIZZES])
+    with pytest.raises(TypeError, match="Quiz must be a dict"):
+        page.load_quizzes([{"id": 7, "name": "New"}, "not a quiz"])
+    assert page.get_quiz_count() == 3
+    assert [q["id"] for q in page.sort_quizzes("date")] == [2, 1, 3]
+
+def test_row_id_cannot_change():
+    """Test 584: Row views refuse to change the quiz id"""
+    table = QuizTable()
+    table.append(QUIZZES[0])
+    with pytest.raises(ValueError, match="Quiz ID cannot be changed"):
+        table.row(1)["id"] = 2
+
+def test_failed_append_leaves_table_unchanged():
+    """Test 602: An unhashable id is rejected before the row is registered"""
+    table = QuizTable()
+    table.append(QUIZZES[0])
+    with pytest.raises(TypeError):
+        table.append({"id": [2], "name": "Broken"}, unique=False)
+    assert len(table) == 1 and list(table) == [1] and len(table.names) == 1
@@ -1,8 +1,33 @@
 """
 Tests for ResultsPage - Quiz results and analytics
 """
+import re
+import zipfile
+import zlib
+import xml.etree.ElementTree as ET
+
 import pytest
 from results_page import ResultsPage
+from pdf_report import PdfStreamWriter, paginate, render_page, write_report
+from xlsx_writer import XlsxStreamWriter
+
+SHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+
+def read_sheet(path):
+    """Cell texts per row of an exported workbook"""
+    with zipfile.ZipFile(path) as archive:
+        root = ET.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+    rows = []
+    for row in root.iter(f"{SHEET_NS}row"):
+        rows.append(["".join(cell.itertext()) or None for cell in row])
+    return rows
+
+
+def pdf_page_texts(data):
+    """Decompressed content streams of a generated PDF, in file order"""
+    streams = re.findall(rb"stream\n(.*?)\nendstream", data, re.S)
+    return [zlib.decompress(stream).decode("latin-1") for stream in streams]
 
 
 # =============== POSITIVE TESTS ===============
@@ -97,8 +122,9 @@ def test_get_result_by_id():
     assert result is not None
     assert result["student"] == "Bob"
 
-def test_export_to_excel_default():
+def test_export_to_excel_default(tmp_path, monkeypatch):
     """Test 341: Export results to Excel with default filename"""
+    monkeypatch.chdir(tmp_path)
     page = ResultsPage()
     page.load_results()
     result = page.export_to_excel()
@@ -106,15 +132,17 @@ def test_export_to_excel_default():
     assert result["filename"] == "quiz_results.xlsx"
     assert result["records"] == 3
 
-def test_export_to_excel_custom_filename():
+def test_export_to_excel_custom_filename(tmp_path, monkeypatch):
     """Test 342: Export with custom filename"""
+    monkeypatch.chdir(tmp_path)
     page = ResultsPage()
     page.load_results()
     result = page.export_to_excel("my_results.xlsx")
     assert result["filename"] == "my_results.xlsx"
 
-def test_download_report():
+def test_download_report(tmp_path, monkeypatch):
     """Test 343: Download PDF report"""
+    monkeypatch.chdir(tmp_path)
     page = ResultsPage()
     page.load_results()
     result = page.download_report()
@@ -279,3 +307,391 @@ def test_filter_accuracy_with_float():
     page.load_results()
     filtered = page.filter_by_accuracy(85.5)
     assert len(filtered) == 1  # Only Bob (92)
+
+
+# =============== STATISTICS ENGINE TESTS ===============
+
+def test_statistics_spread():
+    """Test 472: Median, standard deviation and percentiles of scores"""
+    page = ResultsPage()
+    page.load_results()
+    stats = page.get_statistics()
+    assert stats["median_score"] == 85.0
+    assert stats["std_score"] == pytest.approx(5.7155, abs=1e-4)
+    assert stats["percentiles"][50] == 85.0
+    assert stats["percentiles"][25] == 81.5
+
+def test_statistics_histogram():
+    """Test 473: Scores are bucketed by tens with 100 in the top bucket"""
+    page = ResultsPage()
+    page.load_results([
+        {"id": 1, "student": "A", "score": 100, "accuracy": 100.0, "date": "2024-01-15"},
+        {"id": 2, "student": "B", "score": 90, "accuracy": 90.0, "date": "2024-01-15"},
+        {"id": 3, "student": "C", "score": 9, "accuracy": 9.0, "date": "2024-01-15"}
+    ])
+    histogram = page.get_statistics()["histogram"]
+    assert histogram["90-100"] == 2
+    assert histogram["0-9"] == 1
+    assert sum(histogram.values()) == 3
+
+def test_statistics_by_date():
+    """Test 474: Per-date aggregates are ordered by date"""
+    page = ResultsPage()
+    page.load_results()
+    by_date = page.get_statistics()["by_date"]
+    assert list(by_date) == ["2024-01-15", "2024-01-16"]
+    assert by_date["2024-01-15"]["count"] == 2
+    assert by_date["2024-01-15"]["average_score"] == 88.5
+    assert by_date["2024-01-15"]["highest_score"] == 92
+
+def test_statistics_refresh_after_reload():
+    """Test 475: Loading new results replaces the cached columns"""
+    page = ResultsPage()
+    page.load_results()
+    page.get_statistics()
+    page.load_results([{"id": 7, "student": "Eve", "score": 40, "accuracy": 40.0, "date": "2024-02-01"}])
+    stats = page.get_statistics()
+    assert stats["average_score"] == 40.0
+    assert list(stats["by_date"]) == ["2024-02-01"]
+
+def test_statistics_empty_has_all_keys():
+    """Test 476: Empty results report zeroed extended statistics"""
+    stats = ResultsPage().get_statistics()
+    assert stats["median_score"] == 0
+    assert stats["by_date"] == {}
+    assert sum(stats["histogram"].values()) == 0
+
+
+# =============== XLSX EXPORT TESTS ===============
+
+def test_export_writes_workbook(tmp_path):
+    """Test 477: Export writes a zip with workbook, sheet and content types"""
+    page = ResultsPage()
+    page.load_results()
+    path = tmp_path / "results.xlsx"
+    page.export_to_excel(str(path))
+    with zipfile.ZipFile(path) as archive:
+        names = set(archive.namelist())
+    assert {"[Content_Types].xml", "xl/workbook.xml", "xl/worksheets/sheet1.xml"} <= names
+
+def test_export_rows_round_trip(tmp_path):
+    """Test 478: Header plus one row per result with numbers and inline strings"""
+    page = ResultsPage()
+    page.load_results()
+    path = tmp_path / "results.xlsx"
+    page.export_to_excel(str(path))
+    rows = read_sheet(path)
+    assert rows[0][:3] == ["id", "student", "score"]
+    assert len(rows) == 4
+    assert rows[2][:4] == ["2", "Bob", "92", "92.0"]
+
+def test_export_escapes_text(tmp_path):
+    """Test 479: Markup characters in names survive export"""
+    path = tmp_path / "escaped.xlsx"
+    with XlsxStreamWriter(str(path)) as writer:
+        writer.write_row(["<Tom & Jerry>", None, 1])
+    assert read_sheet(path) == [["<Tom & Jerry>", None, "1"]]
+
+def test_export_strips_illegal_xml_characters(tmp_path):
+    """Test 595: Control characters are dropped and NaN/inf become empty cells"""
+    path = tmp_path / "control.xlsx"
+    with XlsxStreamWriter(str(path), sheet_name="Week\x0b1") as writer:
+        writer.write_row(["A\x01b", float("nan"), float("inf"), -float("inf"), 2.5])
+    assert read_sheet(path) == [["Ab", None, None, None, "2.5"]]
+    with zipfile.ZipFile(path) as archive:
+        assert ET.fromstring(archive.read("xl/workbook.xml"))[0][0].get("name") == "Week1"
+
+def test_writer_streams_in_chunks(tmp_path):
+    """Test 480: Rows beyond one chunk are all written"""
+    path = tmp_path / "big.xlsx"
+    with XlsxStreamWriter(str(path)) as writer:
+        written = writer.write_rows([i, f"row {i}"] for i in range(2500))
+    assert written == 2500
+    rows = read_sheet(path)
+    assert len(rows) == 2500
+    assert rows[-1] == ["2499", "row 2499"]
+
+def test_writer_rejects_rows_after_close(tmp_path):
+    """Test 481: Writing to a closed writer raises ValueError"""
+    writer = XlsxStreamWriter(str(tmp_path / "closed.xlsx"))
+    writer.close()
+    with pytest.raises(ValueError, match="closed"):
+        writer.write_row([1])
+
+
+# =============== PDF REPORT TESTS ===============
+
+def test_report_written_as_pdf(tmp_path):
+    """Test 482: Report file is a PDF with a summary page and a results page"""
+    page = ResultsPage()
+    page.load_results()
+    path = tmp_path / "report.pdf"
+    result = page.download_report(str(path))
+    data = path.read_bytes()
+    assert result["pages"] == 2
+    assert data.startswith(b"%PDF-1.4")
+    assert data.rstrip().endswith(b"%%EOF")
+    assert b"/Count 2" in data
+    texts = pdf_page_texts(data)
+    assert "Average score: 85.0" in texts[0]
+    assert "Bob" in texts[1]
+
+def test_report_xref_offsets(tmp_path):
+    """Test 483: Cross-reference table points at every object"""
+    path = tmp_path / "offsets.pdf"
+    with PdfStreamWriter(str(path)) as writer:
+        writer.add_page(render_page(["one"], 1))
+        writer.add_page(render_page(["two"], 2))
+    data = path.read_bytes()
+    xref = int(data.rsplit(b"startxref\n", 1)[1].split()[0])
+    assert data[xref:xref + 4] == b"xref"
+    entries = data[xref:].split(b"\n")[3:]
+    for object_id in range(1, 8):
+        offset = int(entries[object_id - 1][:10])
+        assert data[offset:].startswith(b"%d 0 obj" % object_id)
+
+def test_report_paginates_results(tmp_path):
+    """Test 484: Results are split across pages with the header repeated"""
+    page = ResultsPage()
+    page.load_results([
+        {"id": i, "student": f"S{i}", "score": 50, "accuracy": 50.0, "date": "2024-01-15"} for i in range(1, 121)
+    ])
+    path = tmp_path / "long.pdf"
+    assert page.download_report(str(path))["pages"] == 4
+    texts = pdf_page_texts(path.read_bytes())
+    assert all("(Results) Tj" in text for text in texts[1:])
+
+def test_report_escapes_parentheses():
+    """Test 485: Parentheses and backslashes are escaped in page text"""
+    text = zlib.decompress(render_page(["Alice (A) \\ B"], 1))
+    assert b"(Alice \\(A\\) \\\\ B) Tj" in text
+
+def test_parallel_report_matches_serial(tmp_path):
+    """Test 486: Process-pool rendering produces the same file as serial rendering"""
+    pages = [[f"line {i}-{j}" for j in range(5)] for i in range(30)]
+    serial = tmp_path / "serial.pdf"
+    parallel = tmp_path / "parallel.pdf"
+    assert write_report(str(serial), pages, workers=1) == 30
+    assert write_report(str(parallel), iter(pages), workers=2) == 30
+    assert serial.read_bytes() == parallel.read_bytes()
+
+def test_paginate_is_lazy():
+    """Test 487: Pages are pulled from the line source on demand"""
+    pages = paginate(iter(range(10 ** 9)), per_page=3)
+    assert next(pages) == [0, 1, 2]
+    assert next(pages) == [3, 4, 5]
+
+def test_report_rejects_bad_filename():
+    """Test 488: Report filename must end with .pdf"""
+    page = ResultsPage()
+    page.load_results()
+    with pytest.raises(ValueError, match=".pdf extension"):
+        page.download_report("report.xlsx")
+
+def test_report_rejects_bad_workers(tmp_path):
+    """Test 489: Worker count must be a positive integer"""
+    with pytest.raises(ValueError, match="Workers"):
+        write_report(str(tmp_path / "bad.pdf"), [["x"]], workers=0)
+
+
+# =============== RESULT INDEX TESTS ===============
+
+def test_accuracy_threshold_is_inclusive():
+    """Test 490: Accuracy filter includes the threshold, lowest accuracy first"""
+    page = ResultsPage()
+    page.load_results()
+    filtered = page.filter_by_accuracy(85)
+    assert [r["student"] for r in filtered] == ["Alice", "Bob"]
+
+def test_accuracy_filter_above_all():
+    """Test 491: Threshold above every result returns an empty list"""
+    page = ResultsPage()
+    page.load_results()
+    assert page.filter_by_accuracy(99.5) == []
+
+def test_student_index_case_folded():
+    """Test 492: Student lookup ignores case and keeps load order"""
+    page = ResultsPage()
+    page.load_results([
+        {"id": 1, "student": "Alice", "score": 60, "accuracy": 60.0, "date": "2024-01-15"},
+        {"id": 2, "student": "ALICE", "score": 70, "accuracy": 70.0, "date": "2024-01-16"},
+        {"id": 3, "student": "Bob", "score": 80, "accuracy": 80.0, "date": "2024-01-16"}
+    ])
+    assert [r["id"] for r in page.filter_by_student("aLiCe")] == [1, 2]
+
+def test_indexes_rebuilt_on_load():
+    """Test 493: Reloading results replaces the id, student and accuracy indexes"""
+    page = ResultsPage()
+    page.load_results()
+    page.load_results([{"id": 9, "student": "Dana", "score": 99, "accuracy": 99.0, "date": "2024-02-01"}])
+    assert page.get_result_by_id(1) is None
+    assert page.get_result_by_id(9)["student"] == "Dana"
+    assert page.filter_by_student("Alice") == []
+    assert len(page.filter_by_accuracy(0)) == 1
+
+def test_filters_before_load_are_empty():
+    """Test 494: Filtering before any results are loaded returns nothing"""
+    page = ResultsPage()
+    assert page.filter_by_accuracy(50) == []
+    assert page.filter_by_student("Alice") == []
+
+def test_rows_missing_fields_load():
+    """Test 604: Rows without id, student or accuracy load and are left out of that index"""
+    page = ResultsPage()
+    page.load_results([
+        {"id": 1, "score": 60, "accuracy": 60.0},
+        {"student": "Alice", "score": 70, "accuracy": 70.0},
+        {"id": 3, "student": "Bob", "score": 80}
+    ])
+    assert len(page.get_all_results()) == 3
+    assert [r["score"] for r in page.filter_by_accuracy(0)] == [60, 70]
+    assert [r["score"] for r in page.filter_by_student("alice")] == [70]
+    assert page.get_result_by_id(3)["student"] == "Bob"
+
+def test_failed_load_keeps_previous_indexes():
+    """Test 605: A load that fails part-way leaves rows and indexes from the previous load"""
+    page = ResultsPage()
+    page.load_results()
+    with pytest.raises(TypeError):
+        page.load_results([{"id": 9, "student": "Dana", "accuracy": 99.0}, {"id": [10], "student": "Eve"}])
+    assert len(page.get_all_results()) == 3
+    assert page.get_result_by_id(9) is None
+    assert [r["student"] for r in page.filter_by_accuracy(85)] == ["Alice", "Bob"]
+
+
+# =============== ANSWER MATRIX TESTS ===============
+
+ANSWER_RESULTS = [
+    {"id": 1, "student": "Ann", "score": 100, "accuracy": 100.0, "date": "2024-03-01", "answers": [1, 1, 1, 1]},
+    {"id": 2, "student": "Ben", "score": 75, "accuracy": 75.0, "date": "2024-03-01", "answers": [1, 1, 1, 0]},
+    {"id": 3, "student": "Cat", "score": 25, "accuracy": 25.0, "date": "2024-03-01", "answers": [1, 0, 0, 0]},
+    {"id": 4, "student": "Dan", "score": 0, "accuracy": 0.0, "date": "2024-03-01", "answers": [0, 0]},
+    {"id": 5, "student": "Eve", "score": 0, "accuracy": 0.0, "date": "2024-03-01"}
+]
+
+def test_filter_question_wrong_answers():
+    """Test 495: Who got a question wrong"""
+    page = ResultsPage()
+    page.load_results()
+    wrong = page.filter_by_question(7, correct=False)
+    assert [r["student"] for r in wrong] == ["Bob", "Charlie"]
+
+def test_filter_question_correct_answers():
+    """Test 496: Who got a question right"""
+    page = ResultsPage()
+    page.load_results(ANSWER_RESULTS)
+    assert [r["id"] for r in page.filter_by_question(2, correct=True)] == [1, 2]
+
+def test_filter_question_skips_unanswered():
+    """Test 497: Results without an answer for the question are excluded"""
+    page = ResultsPage()
+    page.load_results(ANSWER_RESULTS)
+    assert [r["id"] for r in page.filter_by_question(3)] == [1, 2, 3]
+    assert page.filter_by_question(9) == []
+
+def test_item_difficulty():
+    """Test 498: Difficulty is the share of correct answers among students who answered"""
+    page = ResultsPage()
+    page.load_results(ANSWER_RESULTS)
+    analysis = page.get_item_analysis()
+    assert analysis[1]["answered"] == 4
+    assert analysis[1]["difficulty"] == 0.75
+    assert analysis[4]["difficulty"] == pytest.approx(1 / 3)
+
+def test_item_discrimination():
+    """Test 499: Questions the strongest students get right and the weakest miss discriminate"""
+    page = ResultsPage()
+    page.load_results(ANSWER_RESULTS)
+    analysis = page.get_item_analysis()
+    assert analysis[2]["discrimination"] == 1.0
+    assert analysis[1]["discrimination"] == 1.0
+
+def test_matrix_spans_many_questions():
+    """Test 500: Questions beyond the first packed byte are addressed correctly"""
+    page = ResultsPage()
+    answers = [0] * 12
+    answers[10] = 1
+    page.load_results([{"id": 1, "student": "Ann", "score": 8, "accuracy": 8.0, "date": "2024-03-01", "answers": answers}])
+    assert len(page.filter_by_question(11, correct=True)) == 1
+    assert page.filter_by_question(12, correct=True) == []
+
+def test_filter_question_invalid_id():
+    """Test 501: Question IDs start at 1"""
+    page = ResultsPage()
+    page.load_results()
+    with pytest.raises(ValueError, match="Question ID must be positive"):
+        page.filter_by_question(0)
+
+def test_filter_question_correct_flag_type():
+    """Test 502: correct must be a boolean or None"""
+    page = ResultsPage()
+    page.load_results()
+    with pytest.raises(TypeError, match="Correct must be a boolean"):
+        page.filter_by_question(1, correct="yes")
+
+
+# =============== MULTI-KEY SORT TESTS ===============
+
+SORT_RESULTS = [
+    {"id": 1, "student": "Cara", "score": 80, "accuracy": 80.0, "date": "2024-01-16"},
+    {"id": 2, "student": "Abe", "score": 90, "accuracy": 90.0, "date": "2024-01-15"},
+    {"id": 3, "student": "Bea", "score": 80, "accuracy": 80.0, "date": "2024-01-15"},
+    {"id": 4, "student": "Abe", "score": 80, "accuracy": 80.0, "date": "2024-01-15"}
+]
+
+def test_multi_key_sort():
+    """Test 503: Score descending, then date, then student"""
+    page = ResultsPage()
+    page.load_results(SORT_RESULTS)
+    ordered = page.sort_results([("score", False), ("date", True), ("student", True)])
+    assert [r["id"] for r in ordered] == [2, 4, 3, 1]
+
+def test_multi_key_uses_default_direction():
+    """Test 504: Plain field names in a key list use the ascending argument"""
+    page = ResultsPage()
+    page.load_results(SORT_RESULTS)
+    ordered = page.sort_results(["student", "date"], ascending=True)
+    assert [r["id"] for r in ordered] == [2, 4, 3, 1]
+
+def test_sort_ties_keep_load_order():
+    """Test 505: Equal keys keep load order in both directions"""
+    page = ResultsPage()
+    page.load_results(SORT_RESULTS)
+    assert [r["id"] for r in page.sort_results("score")] == [2, 1, 3, 4]
+    assert [r["id"] for r in page.sort_results("score", ascending=True)] == [1, 3, 4, 2]
+
+def test_sort_permutation_cached_until_load():
+    """Test 506: Repeated sorts reuse the permutation; loading new data discards it"""
+    page = ResultsPage()
+    page.load_results(SORT_RESULTS)
+    page.sort_results("date")
+    assert len(page._permutations) == 1
+    page.sort_results("date")
+    assert len(page._permutations) == 1
+    page.load_results()
+    assert page._permutations == {}
+    assert page.sort_results("date")[0]["student"] == "Charlie"
+
+def test_sort_rejects_bad_key_list():
+    """Test 507: Unknown fields and malformed pairs raise ValueError"""
+    page = ResultsPage()
+    page.load_results()
+    with pytest.raises(ValueError, match="Invalid sort option"):
+        page.sort_results([("score", "down")])
+    with pytest.raises(ValueError, match="Invalid sort option"):
+        page.sort_results([])
+
+def test_sort_ascending_coerced_for_plain_fields():
+    """Test 610: A truthy ascending argument works for plain field names"""
+    page = ResultsPage()
+    page.load_results(SORT_RESULTS)
+    assert page.sort_results("score", ascending=1) == page.sort_results("score", ascending=True)
+    assert page.sort_results(["student"], ascending=0) == page.sort_results(["student"])
+
+def test_sort_rejects_non_pair_entries():
+    """Test 611: Entries that are neither a field nor a (field, ascending) pair raise ValueError"""
+    page = ResultsPage()
+    page.load_results()
+    for sort_by in ([5], [("score",)], [("score", True, 1)], [("score", 1)]):
+        with pytest.raises(ValueError, match="Invalid sort option"):
+            page.sort_results(sort_by)
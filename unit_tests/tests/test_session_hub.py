@@ -0,0 +1,178 @@
+"""
+Tests for SessionHub - Asyncio live session rooms and event fan-out
+"""
+import asyncio
+
+import pytest
+from session_hub import SessionHub
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+# =============== POSITIVE TESTS ===============
+
+def test_rooms_have_unique_join_codes():
+    """Test 527: Every room gets its own join code"""
+    hub = SessionHub()
+    codes = {hub.create_room(quiz_id) for quiz_id in range(200)}
+    assert len(codes) == 200
+    assert len(hub) == 200
+
+def test_question_fan_out():
+    """Test 528: next_question reaches every subscriber of the room only"""
+    async def scenario():
+        hub = SessionHub()
+        first, second = hub.create_room(1), hub.create_room(2)
+        _, alice = hub.join(first, "Alice")
+        _, bob = hub.join(first, "Bob")
+        _, carol = hub.join(second, "Carol")
+        question = await hub.next_question(first)
+        return question, await alice.get(), await bob.get(), carol.queue.empty()
+    question, alice_event, bob_event, carol_idle = run(scenario())
+    assert question == 1
+    assert alice_event["type"] == "question" and alice_event["question"] == 1
+    assert bob_event["question"] == 1
+    assert carol_idle
+
+def test_leaderboard_update_event():
+    """Test 529: Submitted answers push the top of the leaderboard"""
+    async def scenario():
+        hub = SessionHub()
+        code = hub.create_room(1)
+        alice_id, alice = hub.join(code, "Alice")
+        bob_id, _ = hub.join(code, "Bob")
+        await hub.next_question(code)
+        await alice.get()
+        await hub.submit_answers(code, [
+            {"participant_id": bob_id, "question": 1, "correct": True, "response_time": 0.0}
+        ])
+        return await alice.get()
+    event = run(scenario())
+    assert event["type"] == "leaderboard"
+    assert [entry["name"] for entry in event["top"]] == ["Bob", "Alice"]
+
+def test_slow_subscriber_drops_oldest():
+    """Test 530: A full queue keeps the newest events and counts drops"""
+    async def scenario():
+        hub = SessionHub(queue_size=2)
+        code = hub.create_room(1)
+        subscription = hub.subscribe(code)
+        for number in range(5):
+            await hub.publish(code, {"type": "tick", "n": number})
+        return subscription.dropped, [(await subscription.get())["n"] for _ in range(2)]
+    dropped, kept = run(scenario())
+    assert dropped == 3
+    assert kept == [3, 4]
+
+def test_block_policy_waits_for_consumer():
+    """Test 531: With overflow="block" the publisher waits until the subscriber catches up"""
+    async def scenario():
+        hub = SessionHub(queue_size=1, overflow="block")
+        code = hub.create_room(1)
+        subscription = hub.subscribe(code)
+        received = []
+
+        async def consume():
+            for _ in range(4):
+                received.append((await subscription.get())["n"])
+
+        consumer = asyncio.ensure_future(consume())
+        for number in range(4):
+            await hub.publish(code, {"type": "tick", "n": number})
+        await consumer
+        return received, subscription.dropped
+    received, dropped = run(scenario())
+    assert received == [0, 1, 2, 3]
+    assert dropped == 0
+
+def test_close_room_ends_subscriptions():
+    """Test 532: Closing a room sends a final event and ends iteration"""
+    async def scenario():
+        hub = SessionHub()
+        code = hub.create_room(1)
+        _, subscription = hub.join(code, "Alice")
+        await hub.next_question(code)
+        await hub.close_room(code)
+        return [event["type"] async for event in subscription], code in hub.rooms
+    events, still_open = run(scenario())
+    assert events == ["question", "ended"]
+    assert not still_open
+
+
+def test_unsubscribe_releases_blocked_publisher():
+    """Test 587: A publisher waiting on a full queue returns once that subscriber leaves"""
+    async def scenario():
+        hub = SessionHub(queue_size=1, overflow="block")
+        code = hub.create_room(1)
+        _, stuck = hub.join(code, "Alice")
+        _, reader = hub.join(code, "Bob")
+        await hub.publish(code, {"type": "first"})
+        await reader.get()
+        publisher = asyncio.ensure_future(hub.publish(code, {"type": "second"}))
+        await asyncio.sleep(0.01)
+        assert not publisher.done()
+        hub.unsubscribe(stuck)
+        return await asyncio.wait_for(publisher, 1)
+    assert run(scenario()) == 1
+
+def test_close_room_with_full_blocking_queue():
+    """Test 588: Closing a room never waits on a subscriber that stopped reading"""
+    async def scenario():
+        hub = SessionHub(queue_size=1, overflow="block")
+        code = hub.create_room(1)
+        _, stuck = hub.join(code, "Alice")
+        await hub.publish(code, {"type": "first"})
+        blocked = asyncio.ensure_future(hub.publish(code, {"type": "second"}))
+        await asyncio.sleep(0.01)
+        await asyncio.wait_for(hub.close_room(code), 1)
+        return await asyncio.wait_for(blocked, 1), [event["type"] async for event in stuck]
+    delivered, events = run(scenario())
+    assert delivered == 0
+    assert events == ["ended"]
+
+def test_broadcast_not_stalled_by_one_room():
+    """Test 589: A blocked room does not hold back delivery to the other rooms"""
+    async def scenario():
+        hub = SessionHub(queue_size=1, overflow="block")
+        first, second = hub.create_room(1), hub.create_room(2)
+        _, stuck = hub.join(first, "Alice")
+        await hub.publish(first, {"type": "first"})
+        _, other = hub.join(second, "Bob")
+        broadcast = asyncio.ensure_future(hub.broadcast({"type": "notice"}))
+        event = await asyncio.wait_for(other.get(), 1)
+        hub.unsubscribe(stuck)
+        return event, await asyncio.wait_for(broadcast, 1)
+    event, delivered = run(scenario())
+    assert event["type"] == "notice"
+    assert delivered == 1
+
+def test_unsubscribe_wakes_waiting_reader():
+    """Test 608: A reader waiting for events stops once its subscription is dropped"""
+    async def scenario():
+        hub = SessionHub()
+        code = hub.create_room(1)
+        _, subscription = hub.join(code, "Alice")
+        await hub.publish(code, {"type": "first"})
+
+        async def read():
+            return [event["type"] async for event in subscription]
+        reader = asyncio.ensure_future(read())
+        await asyncio.sleep(0.01)
+        assert not reader.done()
+        hub.unsubscribe(subscription)
+        return await asyncio.wait_for(reader, 1)
+    assert run(scenario()) == ["first"]
+
+# =============== NEGATIVE TESTS ===============
+
+def test_unknown_room():
+    """Test 533: Subscribing to an unknown room raises ValueError"""
+    with pytest.raises(ValueError, match="Room ABC123 not found"):
+        SessionHub().subscribe("ABC123")
+
+def test_invalid_overflow_policy():
+    """Test 534: Unknown overflow policy raises ValueError"""
+    with pytest.raises(ValueError, match="Overflow must be"):
+        SessionHub(overflow="ignore")
@@ -0,0 +1,195 @@
+"""
+Tests for SessionLog - Live session event log, snapshots and restore
+"""
+import json
+
+import pytest
+from join_codes import JoinCodeRegistry
+from live_session_page import LiveSessionPage
+from session_log import SessionLog
+
+
+def played_session(log, registry):
+    """Session with three participants, one leaver and two scored questions"""
+    session = LiveSessionPage(quiz_id=7, registry=registry, log=log)
+    session.start_live_session()
+    alice = session.add_participant("Alice")
+    session.add_participants(["Bob", "Cara", "Dan"])
+    session.remove_participant(alice + 3)
+    session.start_quiz()
+    session.submit_answers([
+        {"participant_id": alice, "question": 1, "correct": True, "response_time": 4.0},
+        {"participant_id": alice + 1, "question": 1, "correct": True, "response_time": 1.0},
+    ])
+    session.next_question()
+    session.submit_answers([{"participant_id": alice + 2, "question": 2, "correct": True, "response_time": 0.0}])
+    return session
+
+
+def state_of(session):
+    return (session.snapshot(), [p["id"] for p in session.get_leaderboard()])
+
+
+# =============== POSITIVE TESTS ===============
+
+def test_append_buffers_until_flush(tmp_path):
+    """Test 553: Events are written in batches, numbered in order"""
+    log = SessionLog(str(tmp_path / "room.log"), flush_every=3)
+    log.append({"type": "a"})
+    log.append({"type": "b"})
+    assert not (tmp_path / "room.log").exists()
+    log.append({"type": "c"})
+    lines = (tmp_path / "room.log").read_text().splitlines()
+    assert [json.loads(line)["seq"] for line in lines] == [1, 2, 3]
+
+def test_restore_from_log_only(tmp_path):
+    """Test 554: Replaying the full log rebuilds the session and its join code"""
+    log = SessionLog(str(tmp_path / "room.log"))
+    session = played_session(log, JoinCodeRegistry())
+    log.flush()
+    registry = JoinCodeRegistry()
+    restored = LiveSessionPage.restore(SessionLog(str(tmp_path / "room.log")), registry=registry)
+    assert state_of(restored) == state_of(session)
+    assert registry.resolve(session.join_code) is restored
+
+def test_restore_from_snapshot_and_tail(tmp_path):
+    """Test 555: A snapshot plus the events after it gives the same state"""
+    log = SessionLog(str(tmp_path / "room.log"), flush_every=1, snapshot_every=4)
+    session = played_session(log, JoinCodeRegistry())
+    assert (tmp_path / "room.log.snap").exists()
+    state, events = SessionLog(str(tmp_path / "room.log")).load()
+    assert state is not None and 0 < len(events) < 4
+    restored = LiveSessionPage.restore(SessionLog(str(tmp_path / "room.log")), registry=JoinCodeRegistry())
+    assert state_of(restored) == state_of(session)
+
+def test_restored_session_keeps_logging(tmp_path):
+    """Test 556: Changes after a restore continue the same log"""
+    log = SessionLog(str(tmp_path / "room.log"), flush_every=1)
+    played_session(log, JoinCodeRegistry())
+    restored = LiveSessionPage.restore(SessionLog(str(tmp_path / "room.log"), flush_every=1),
+                                       registry=JoinCodeRegistry())
+    eve = restored.add_participant("Eve")
+    again = LiveSessionPage.restore(SessionLog(str(tmp_path / "room.log")), registry=JoinCodeRegistry())
+    assert again.get_participants()[-1]["id"] == eve
+    assert state_of(again) == state_of(restored)
+
+def test_snapshot_skips_covered_events(tmp_path):
+    """Test 557: Events left in the log but covered by the snapshot are not replayed"""
+    path = str(tmp_path / "room.log")
+    log = SessionLog(path, flush_every=1)
+    session = played_session(log, JoinCodeRegistry())
+    covered = (tmp_path / "room.log").read_text()
+    log.write_snapshot(session.snapshot())
+    # Crash between writing the snapshot and truncating the log
+    (tmp_path / "room.log").write_text(covered)
+    restored = LiveSessionPage.restore(SessionLog(path), registry=JoinCodeRegistry())
+    assert state_of(restored) == state_of(session)
+
+def test_torn_last_line_ignored(tmp_path):
+    """Test 558: A partially written final event is dropped"""
+    log = SessionLog(str(tmp_path / "room.log"), flush_every=1)
+    session = played_session(log, JoinCodeRegistry())
+    with open(tmp_path / "room.log", "a") as log_file:
+        log_file.write('{"type":"leave","id"')
+    restored = LiveSessionPage.restore(SessionLog(str(tmp_path / "room.log")), registry=JoinCodeRegistry())
+    assert state_of(restored) == state_of(session)
+
+def test_ended_session_not_rebound(tmp_path):
+    """Test 559: An ended session is restored without taking its join code back"""
+    log = SessionLog(str(tmp_path / "room.log"))
+    session = played_session(log, JoinCodeRegistry())
+    session.end_session()
+    registry = JoinCodeRegistry()
+    restored = LiveSessionPage.restore(SessionLog(str(tmp_path / "room.log")), registry=registry)
+    assert restored.is_started is False
+    assert len(registry) == 0
+
+def test_restore_keeps_join_times(tmp_path):
+    """Test 577: Restored participants keep their logged join times"""
+    ticks = iter([1.5, 2.5])
+    log = SessionLog(str(tmp_path / "room.log"))
+    session = LiveSessionPage(quiz_id=7, registry=JoinCodeRegistry(), log=log, clock=lambda: next(ticks))
+    session.start_live_session()
+    session.add_participant("Alice")
+    log.write_snapshot(session.snapshot())
+    session.add_participants(["Bob"])
+    log.flush()
+    restored = LiveSessionPage.restore(SessionLog(str(tmp_path / "room.log")), registry=JoinCodeRegistry())
+    assert [p.joined_at for p in restored.get_participants()] == [1.5, 2.5]
+
+def test_restore_without_explicit_flush(tmp_path):
+    """Test 585: Answer batches and question changes reach disk without flush()"""
+    session = LiveSessionPage(quiz_id=7, registry=JoinCodeRegistry(), log=SessionLog(str(tmp_path / "room.log")))
+    session.start_live_session()
+    ids = [result["id"] for result in session.add_participants([f"Player {n}" for n in range(30)])]
+    session.start_quiz()
+    for question in range(1, 11):
+        session.submit_answers([{"participant_id": participant_id, "question": question, "correct": True,
+                                 "response_time": 2.0} for participant_id in ids])
+        if question < 10:
+            session.next_question()
+    restored = LiveSessionPage.restore(SessionLog(str(tmp_path / "room.log")), registry=JoinCodeRegistry())
+    assert state_of(restored) == state_of(session)
+
+def test_flush_after_interval(tmp_path):
+    """Test 586: Buffered events are written once flush_interval has passed"""
+    now = [0.0]
+    log = SessionLog(str(tmp_path / "room.log"), flush_every=100, flush_interval=1.0, clock=lambda: now[0])
+    log.append({"type": "leave", "id": 1})
+    assert not (tmp_path / "room.log").exists()
+    now[0] = 1.5
+    log.append({"type": "leave", "id": 2})
+    assert len((tmp_path / "room.log").read_text().splitlines()) == 2
+
+def test_torn_line_cut_before_new_events(tmp_path):
+    """Test 603: Events logged after recovering from a torn line survive the next restore"""
+    path = str(tmp_path / "room.log")
+    session = LiveSessionPage(quiz_id=7, registry=JoinCodeRegistry(), log=SessionLog(path, flush_every=1))
+    session.start_live_session()
+    session.add_participants(["Alice", "Bob", "Cara"])
+    with open(path, "a") as log_file:
+        log_file.write('{"type":"leave","id"')
+    restored = LiveSessionPage.restore(SessionLog(path), registry=JoinCodeRegistry())
+    restored.add_participants(["Dan", "Eve"])
+    restored.log.flush()
+    again = LiveSessionPage.restore(SessionLog(path), registry=JoinCodeRegistry())
+    assert [p["name"] for p in again.get_participants()] == ["Alice", "Bob", "Cara", "Dan", "Eve"]
+
+def test_snapshots_wait_for_question_boundary(tmp_path):
+    """Test 609: A due snapshot is not taken while answers are scored, only at the next question"""
+    log = SessionLog(str(tmp_path / "room.log"), snapshot_every=3)
+    session = LiveSessionPage(quiz_id=7, registry=JoinCodeRegistry(), log=log)
+    session.start_live_session()
+    ids = [result["id"] for result in session.add_participants(["Alice", "Bob"])]
+    session.start_quiz()
+    snapshot = (tmp_path / "room.log.snap").read_text()
+    for participant_id in ids:
+        session.submit_answers([{"participant_id": participant_id, "question": 1, "correct": True,
+                                 "response_time": 1.0}])
+    session.remove_participant(ids[0])
+    assert (tmp_path / "room.log.snap").read_text() == snapshot
+    session.next_question()
+    assert (tmp_path / "room.log.snap").read_text() != snapshot
+    restored = LiveSessionPage.restore(SessionLog(str(tmp_path / "room.log")), registry=JoinCodeRegistry())
+    assert state_of(restored) == state_of(session)
+
+# =============== NEGATIVE TESTS ===============
+
+def test_restore_empty_log(tmp_path):
+    """Test 560: Restoring from an empty log raises ValueError"""
+    with pytest.raises(ValueError, match="Session log is empty"):
+        LiveSessionPage.restore(SessionLog(str(tmp_path / "room.log")))
+
+def test_restore_code_in_use(tmp_path):
+    """Test 561: Restoring onto a registry already using the code raises ValueError"""
+    log = SessionLog(str(tmp_path / "room.log"))
+    registry = JoinCodeRegistry()
+    session = played_session(log, registry)
+    log.flush()
+    with pytest.raises(ValueError, match=f"Join code {session.join_code} is already in use"):
+        LiveSessionPage.restore(SessionLog(str(tmp_path / "room.log")), registry=registry)
+
+def test_invalid_flush_every(tmp_path):
+    """Test 562: flush_every must be a positive integer"""
+    with pytest.raises(ValueError, match="flush_every must be a positive integer"):
+        SessionLog(str(tmp_path / "room.log"), flush_every=0)
@@ -0,0 +1,128 @@
+"""
+XlsxStreamWriter - Write-only single-sheet .xlsx writer that streams rows into the zip
+"""
+import math
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '</Relationships>'
+)
+SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+SHEET_END = '</sheetData></worksheet>'
+
+# Rows are buffered and compressed in chunks of this many
+CHUNK_ROWS = 1000
+# Characters XML 1.0 does not allow even escaped; a single one makes Excel reject the sheet
+ILLEGAL_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+
+
+def xml_text(value):
+    """Escaped text with characters illegal in XML 1.0 removed"""
+    text = str(value)
+    # Printable text (the usual case) cannot contain them; skip the regex pass
+    if not text.isprintable():
+        text = ILLEGAL_XML_CHARS.sub("", text)
+    return escape(text)
+
+
+def cell_xml(value):
+    """One <c> element: numbers as values, text as inline strings, None and NaN/inf as empty cells"""
+    if value is None:
+        return "<c/>"
+    if isinstance(value, bool):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, int):
+        return f"<c><v>{value!r}</v></c>"
+    if isinstance(value, float):
+        # Spreadsheets have no NaN or infinity; <v>nan</v> makes the file unreadable
+        return f"<c><v>{value!r}</v></c>" if math.isfinite(value) else "<c/>"
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{xml_text(value)}</t></is></c>'
+
+
+class XlsxStreamWriter:
+    """Streams rows into xl/worksheets/sheet1.xml; memory use is bounded by CHUNK_ROWS"""
+    def __init__(self, filename, sheet_name="Sheet1"):
+        if not isinstance(sheet_name, str) or not sheet_name.strip():
+            raise ValueError("Sheet name cannot be empty")
+        self.filename = filename
+        self.rows_written = 0
+        self._archive = zipfile.ZipFile(filename, "w", compression=zipfile.ZIP_DEFLATED)
+        self._archive.writestr("[Content_Types].xml", CONTENT_TYPES)
+        self._archive.writestr("_rels/.rels", ROOT_RELS)
+        name = escape(ILLEGAL_XML_CHARS.sub("", sheet_name), {'"': "&quot;"})
+        self._archive.writestr("xl/workbook.xml", WORKBOOK.format(name=name))
+        self._archive.writestr("xl/_rels/workbook.xml.rels", WORKBOOK_RELS)
+        self._sheet = self._archive.open("xl/worksheets/sheet1.xml", "w", force_zip64=True)
+        self._sheet.write(SHEET_START.encode())
+        self._buffer = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def write_row(self, values):
+        """Append one row of cell values"""
+        if self._sheet is None:
+            raise ValueError("Writer is closed")
+        self._buffer.append("<row>" + "".join(map(cell_xml, values)) + "</row>")
+        self.rows_written += 1
+        if len(self._buffer) >= CHUNK_ROWS:
+            self._flush()
+
+    def write_rows(self, rows):
+        for values in rows:
+            self.write_row(values)
+        return self.rows_written
+
+    def close(self):
+        """Finish the sheet and the zip central directory"""
+        if self._sheet is None:
+            return
+        self._flush()
+        self._sheet.write(SHEET_END.encode())
+        self._sheet.close()
+        self._sheet = None
+        self._archive.close()
+
+    def _flush(self):
+        if self._buffer:
+            self._sheet.write("".join(self._buffer).encode())
+            self._buffer = []